@@ -123,23 +123,25 @@ def open_link(url):
 
 
 def display_data_in_tabs(tabs, df_list, start, end):
-    for tab, (status, df, filename, error_list, url) in zip(tabs, df_list[start:end]):
+    for tab, (status, df, filename, error_list, url, cache_hit) in zip(
+        tabs, df_list[start:end]
+    ):
         with tab:
             col1, col2, col3 = st.columns([3, 1, 1])
             with col1:
-                #st.header(f"{filename}")
+                # st.header(f"{filename}")
                 st.markdown(
-                        f"<h2 style='font-size:25px;'>{filename}</h2>",
-                        unsafe_allow_html=True
-                        )
+                    f"<h2 style='font-size:25px;'>{filename}</h2>",
+                    unsafe_allow_html=True,
+                )
             with col3:
                 if status:
                     table_size = df.shape
                 else:
                     table_size = None
                 data = {
-                    "Metric": ["Status", "Table Size"],
-                    "Value": [status, table_size],  # Example values
+                    "Metric": ["Status", "Table Size", "From Cache"],
+                    "Value": [status, table_size, cache_hit],  # Example values
                 }
                 # Convert to DataFrame
                 df_status = pd.DataFrame(data)
@@ -200,8 +202,8 @@ def display_data_in_tabs(tabs, df_list, start, end):
 
             # Set up columns for Info and Error buttons
             col1, col2, col3 = st.columns([1, 4, 1])
-           #filename = filename.split(".")[0]
-            filename, _ = filename.rsplit('.', 1)
+            # filename = filename.split(".")[0]
+            filename, _ = filename.rsplit(".", 1)
             with st.container(border=True):
                 with col1:
                     # Display Info Log if button is clicked
@@ -275,7 +277,7 @@ def display_data_in_tabs(tabs, df_list, start, end):
                     # Row 1: Form, Width, Thickness
                     col1, col2, col3 = st.columns(3)
                     with col1:
-                        #st.markdown(f"<h2 style='font-size:25px;'>Form Frequency</h2>",unsafe_allow_html=True)
+                        # st.markdown(f"<h2 style='font-size:25px;'>Form Frequency</h2>",unsafe_allow_html=True)
                         form_count = df["Form"].value_counts().reset_index()
                         form_count.columns = ["Form", "Count"]
                         fig_form = px.bar(
@@ -284,7 +286,7 @@ def display_data_in_tabs(tabs, df_list, start, end):
                         st.plotly_chart(fig_form, use_container_width=True)
 
                     with col2:
-                       # st.markdown(f"<h2 style='font-size:25px;'>Width Distribution</h2>",unsafe_allow_html=True)
+                        # st.markdown(f"<h2 style='font-size:25px;'>Width Distribution</h2>",unsafe_allow_html=True)
                         fig_width = px.histogram(
                             df, x="Width (mm)", nbins=10, title="Width (mm)"
                         )
@@ -292,7 +294,7 @@ def display_data_in_tabs(tabs, df_list, start, end):
                         st.plotly_chart(fig_width, use_container_width=True)
 
                     with col3:
-                       # st.markdown(f"<h2 style='font-size:25px;'>Thickness Distribution</h2>",unsafe_allow_html=True)
+                        # st.markdown(f"<h2 style='font-size:25px;'>Thickness Distribution</h2>",unsafe_allow_html=True)
                         fig_thickness = px.histogram(
                             df, x="Thickness (mm)", nbins=10, title="Thickness (mm)"
                         )
@@ -377,16 +379,21 @@ def app():
 
     # Check if pipeline has already been run
     if st.sidebar.button("Run Pipeline") and uploaded_files:
-        # Save uploaded files and call pipeline
-        for uploaded_file in uploaded_files:
-            with open(os.path.join(RAW_FOLDER, uploaded_file.name), "wb") as f:
-                f.write(uploaded_file.getbuffer())
+        if config["etl_pipeline"].get("in_memory", False):
+            # Pass the uploads to the pipeline as in-memory buffers
+            files_to_process = uploaded_files
+        else:
+            # Save uploaded files and call pipeline
+            files_to_process = None
+            for uploaded_file in uploaded_files:
+                with open(os.path.join(RAW_FOLDER, uploaded_file.name), "wb") as f:
+                    f.write(uploaded_file.getbuffer())
 
         # Start timing
         start_time = time.time()
         try:
             with st.spinner("Processing..."):  # main function to get data
-                dataframes = pipeline_run()
+                dataframes = pipeline_run(files_to_process)
                 st.session_state["dataframes"] = dataframes  # Store in session state
                 st.session_state["show_info_message"] = True  # Show success message
                 st.session_state["current_page"] = 1  # Reset to first page
@@ -500,7 +507,7 @@ def app():
         start = (st.session_state["current_page"] - 1) * tabs_per_page
         end = start + tabs_per_page
 
-        tabs = st.tabs([item for _, _, item, _, _ in dataframes[start:end]])
+        tabs = st.tabs([item for _, _, item, _, _, _ in dataframes[start:end]])
         display_data_in_tabs(tabs, dataframes, start, end)
 
 
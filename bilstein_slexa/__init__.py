@@ -2,6 +2,7 @@
 
 import os
 import logging
+import importlib
 import logging.config
 from pathlib import Path
 from typing import Optional
@@ -23,8 +24,8 @@ service_account_path = str(
     os.path.join(PROJECT_DIR, "secrets/azadsandbox-437909-ee45e051e930.json")
 )
 
-# Collect errors
-global_vars = {"error_list": []}
+# Collect errors, and the messages about single bundles
+global_vars = {"error_list": [], "bundle_messages": []}
 
 # Define log output locations
 log_output_path = str(Path(__file__).parent.resolve() / "logs/")
@@ -53,6 +54,11 @@ log_config_path = Path(__file__).parent.resolve() / "config/logging.yaml"
 # Define module logger
 logger = logging.getLogger(__name__)
 
+# Import config/logging_system.py before binding `config`: importing a submodule of
+# the config/ package sets the package as the `config` attribute of bilstein_slexa,
+# which would otherwise replace the config dict for every later import
+importlib.import_module("bilstein_slexa.config.logging_system")
+
 # base/global config
 _base_config_path = Path(__file__).parent.resolve() / "config/base.yaml"
 config = get_yaml_config(_base_config_path)
@@ -61,5 +67,29 @@ config = get_yaml_config(_base_config_path)
 local_data_input_path = str(Path(__file__).resolve().parents[1] / "inputs/")
 local_data_output_path = str(Path(__file__).resolve().parents[1] / "outputs/")
 
+# translation cache location
+translation_cache_path = str(
+    Path(__file__).resolve().parents[1] / "inputs/cache/translation_cache.sqlite"
+)
+
+# reference data snapshot location
+grade_snapshot_path = str(
+    Path(__file__).resolve().parents[1] / "inputs/cache/grade_snapshot.json"
+)
+
 # finish repo path
 finish_repo_path = Path(__file__).parent.resolve() / "config/bilstein_finish_repo.yaml"
+
+# translation glossary path
+glossary_path = Path(__file__).parent.resolve() / "config/translation_glossary.yaml"
+
+# whole-file result cache location
+result_cache_path = str(Path(__file__).resolve().parents[1] / "inputs/cache/results")
+
+# stage checkpoint location
+checkpoint_path = str(Path(__file__).resolve().parents[1] / "inputs/cache/checkpoints")
+
+# processed bundle store location
+bundle_store_path = str(
+    Path(__file__).resolve().parents[1] / "inputs/cache/bundle_store.sqlite"
+)
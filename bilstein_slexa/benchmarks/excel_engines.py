@@ -0,0 +1,100 @@
+"""Time the Excel engines on generated Bilstein-shaped workbooks.
+
+Usage:
+    python -m bilstein_slexa.benchmarks.excel_engines --rows 1000 10000 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+import openpyxl
+import pandas as pd
+from bilstein_slexa import source_schema_path
+from bilstein_slexa.getters.data_getter import read_projected_excel
+from bilstein_slexa.getters.excel_engines import EXCEL_ENGINES, open_sheet
+from bilstein_slexa.utils.helper import load_layout_schema
+
+# Typical values of the text columns of a Bilstein stock list
+TEXT_VALUES = {
+    "Lagerort": ["100", "139"],
+    "Güte-Text": ["DC 01", "DC 04", "S235JR", "C45"],
+    "Beschreibung": ["Alllast VK", "Rest", "Kaltband"],
+    "Kurztext zum Code": ["Spaltband kaltgewalzt", "Kaltband geglüht"],
+    "Walzzustand (Fertigung)": ["10", "7"],
+    "Basismengeneinheit": ["KG"],
+}
+
+
+def make_workbook(path: str, rows: int, extra_cols: int = 10, seed: int = 0) -> None:
+    """Write a workbook with the source schema columns plus unused SAP columns."""
+    rng = np.random.default_rng(seed)
+    schema = load_layout_schema(source_schema_path)
+    columns = {}
+    for col in schema["columns"]:
+        name = col["name"]
+        if col["dtype"] == "float":
+            columns[name] = rng.integers(1, 1000, rows).astype(float)
+        elif col["dtype"] == "date":
+            columns[name] = ["2024-09-04"] * rows
+        elif name in TEXT_VALUES:
+            columns[name] = rng.choice(TEXT_VALUES[name], rows)
+        else:
+            columns[name] = rng.integers(10**7, 10**8, rows).astype(str)
+    for idx in range(extra_cols):
+        columns[f"SAP_{idx}"] = rng.random(rows)
+
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    worksheet.append(list(columns))
+    for row in zip(*columns.values()):
+        worksheet.append(
+            [value.item() if hasattr(value, "item") else value for value in row]
+        )
+    workbook.save(path)
+
+
+def time_reader(reader, repeats: int):
+    """Return the best wall time of a reader and its last result."""
+    timings = []
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        result = reader()
+        timings.append(time.perf_counter() - start_time)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--engines", nargs="+", default=["calamine", "openpyxl"])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    engines = [name for name in args.engines if name in EXCEL_ENGINES]
+    print(f"{'rows':>8}{'engine':>12}{'best (s)':>10}{'rows/s':>11}{'shape':>14}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in args.rows:
+            path = os.path.join(tmp_dir, f"bilstein_{rows}.xlsx")
+            make_workbook(path, rows)
+
+            readers = {"pandas": lambda: pd.read_excel(path, header=0)}
+            for name in engines:
+                sheet = open_sheet(path, [name])
+                if sheet is None:
+                    print(f"{rows:>8}{name:>12}{'not installed':>24}")
+                    continue
+                sheet.close()
+                readers[name] = lambda name=name: read_projected_excel(path, [name])
+
+            for name, reader in readers.items():
+                best, df = time_reader(reader, args.repeats)
+                shape = f"{df.shape[0]}x{df.shape[1]}"
+                print(
+                    f"{rows:>8}{name:>12}{best:>10.3f}{rows / best:>11.0f}{shape:>14}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compare the row-wise and the indexed material lookup.
+
+Usage:
+    python -m bilstein_slexa.benchmarks.material_lookup --rows 1000 10000
+"""
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from bilstein_slexa.pipeline.material_checker import (
+    add_material,
+    apply_logic,
+    validation_df,
+)
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Generate an aggregated frame with grades drawn from the mapping table plus unknown grades."""
+    rng = np.random.default_rng(seed)
+    grades = np.concatenate(
+        [
+            validation_df["Grade_Suffix"].values,
+            validation_df["Grade"].values,
+            ["XYZ", ""],
+        ]
+    )
+    return pd.DataFrame(
+        {
+            "grade": rng.choice(grades, rows),
+            "choice": rng.choice(["2nd", "3rd"], rows),
+            "form": rng.choice(["Coils", "Slit Coils", "Offcuts"], rows),
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>8}{'row-wise (s)':>14}{'indexed (s)':>13}{'speed-up':>10}{'equal':>7}"
+    )
+    for rows in args.rows:
+        df = make_frame(rows)
+
+        start_time = time.perf_counter()
+        expected = df.apply(apply_logic, axis=1)
+        row_wise = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        actual = add_material(df.copy())["material"]
+        indexed = time.perf_counter() - start_time
+
+        equal = expected.fillna("").equals(actual.fillna(""))
+        print(
+            f"{rows:>8}{row_wise:>14.3f}{indexed:>13.4f}{row_wise / indexed:>9.0f}x{str(equal):>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare the latency and output agreement of the translation inference profiles.
+
+Usage:
+    python -m bilstein_slexa.benchmarks.translation_profiles --profiles accurate fast
+"""
+
+import argparse
+import statistics
+import time
+from bilstein_slexa import config
+from bilstein_slexa.model_loader import ModelLoader
+
+# Fixed corpus of typical Bilstein stock list descriptions
+DESCRIPTION_CORPUS = [
+    "Spaltband kaltgewalzt",
+    "Kaltband geglüht",
+    "Kaltband gebeizt und geölt",
+    "Spaltband warmgewalzt gebeizt",
+    "Kaltgewalztes Band aus unlegiertem Stahl",
+    "Band rekristallisierend geglüht, leicht nachgewalzt",
+    "Federstahlband gehärtet und angelassen",
+    "Kaltband feuerverzinkt, Oberfläche geölt",
+    "Reststück Spaltband",
+    "Abschnitte kaltgewalzt",
+    "Präzisionsband mit engen Dickentoleranzen",
+    "Kaltband weichgeglüht, Kanten gesäumt",
+    "Spaltband mit Naturkante",
+    "Band elektrolytisch verzinkt",
+    "Kaltband für Tiefziehzwecke",
+    "Warmband gebeizt, nicht geölt",
+]
+
+
+def run_profile(profile_name, texts, batch_size, repeats):
+    """
+    Translate the corpus with one profile.
+
+    Returns:
+        Tuple[list, float, list]: Translations, model load time and per-batch latencies.
+    """
+    start_time = time.perf_counter()
+    model, tokenizer = ModelLoader.build_translation_model(profile_name)
+    load_time = time.perf_counter() - start_time
+    generate_kwargs = ModelLoader.get_generate_kwargs(profile_name)
+
+    latencies = []
+    translations = []
+    for _ in range(repeats):
+        translations = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start : start + batch_size]
+            batch_start = time.perf_counter()
+            tokens = tokenizer(batch, return_tensors="pt", padding=True)
+            generated = model.generate(**tokens, **generate_kwargs)
+            translations += tokenizer.batch_decode(generated, skip_special_tokens=True)
+            latencies.append(time.perf_counter() - batch_start)
+    return translations, load_time, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=list(config["translation"]["profiles"]),
+        help="Profiles to compare; the first one is the reference for agreement.",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=config["translation"]["batch_size"]
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {}
+    for profile_name in args.profiles:
+        results[profile_name] = run_profile(
+            profile_name, DESCRIPTION_CORPUS, args.batch_size, args.repeats
+        )
+
+    reference = results[args.profiles[0]][0]
+    print(
+        f"{'profile':<12}{'load (s)':>10}{'median batch (s)':>18}{'p95 batch (s)':>15}{'agreement':>11}"
+    )
+    for profile_name, (translations, load_time, latencies) in results.items():
+        agreement = sum(a == b for a, b in zip(reference, translations)) / len(
+            reference
+        )
+        p95 = sorted(latencies)[max(int(len(latencies) * 0.95) - 1, 0)]
+        print(
+            f"{profile_name:<12}{load_time:>10.2f}{statistics.median(latencies):>18.3f}"
+            f"{p95:>15.3f}{agreement:>10.0%}"
+        )
+
+    for profile_name in args.profiles[1:]:
+        for source, expected, actual in zip(
+            DESCRIPTION_CORPUS, reference, results[profile_name][0]
+        ):
+            if expected != actual:
+                print(f"[{profile_name}] {source!r}: {expected!r} != {actual!r}")
+
+
+if __name__ == "__main__":
+    main()
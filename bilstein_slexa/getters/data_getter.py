@@ -1,10 +1,27 @@
 import os
+import time
 import filetype
 import logging
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional
 import pandas as pd
 from google.cloud import storage
-from bilstein_slexa import PROJECT_DIR, config, local_data_input_path
+from bilstein_slexa import (
+    PROJECT_DIR,
+    config,
+    global_vars,
+    local_data_input_path,
+    source_schema_path,
+)
+from bilstein_slexa.getters.excel_engines import open_sheet, rewind, source_name
+from bilstein_slexa.pipeline.schema_validation import (
+    convert_column_dtype,
+    get_required_columns,
+    resolve_column_mapping,
+    validate_header_prefetch,
+)
+from bilstein_slexa.utils.helper import load_layout_schema
+from bilstein_slexa.utils.table import identify_tables
 
 logger = logging.getLogger("<Bilstein SLExA ETL>")
 
@@ -28,6 +45,31 @@ def is_valid_format(dir_path: str, file_name: str) -> bool:
     return is_valid_extension and is_valid_mime
 
 
+def is_valid_buffer(buffer) -> bool:
+    """
+    Check the file type of an uploaded file buffer, like `is_valid_format` does for files.
+
+    Args:
+        buffer (file-like): The uploaded file, with its file name as `name`.
+
+    Returns:
+        bool: True if the buffer holds a valid file type, otherwise False.
+    """
+    accepted_file_types = config["file_types"]["valid_file_extensions"]
+
+    kind = filetype.guess(buffer.getvalue()[:8192])
+    if kind is None:
+        logger.error(
+            f"File {buffer.name} IS NOT A VALID FILE TYPE. Check config.yaml for more info."
+        )
+        return False
+
+    return (
+        kind.extension in accepted_file_types.keys()
+        and kind.mime in accepted_file_types.values()
+    )
+
+
 def generate_path_list(folder_name) -> list:
     """
     Checks if the file at the specified path has a valid format based on allowed file types
@@ -66,11 +108,15 @@ def load_excel_file(file_path: str) -> Optional[pd.DataFrame]:
     Load an Excel file from a local path or a Google Cloud Storage path.
 
     Args:
-        file_path (str): Path to the Excel file. Can be a local path or a GCS URL (gs://).
+        file_path (str or file-like): Path to the Excel file. Can be a local path, a GCS
+            URL (gs://) or an uploaded file buffer.
 
     Returns:
         Optional[pd.DataFrame]: The loaded DataFrame if the file is valid, otherwise None.
     """
+    if not isinstance(file_path, str):
+        logger.info("The source file is loading from an uploaded buffer")
+        return load_from_buffer(file_path)
     if config["etl_pipeline"]["load_local"]:
         logger.info("The source file is loading from local repository")
         return load_from_local(file_path)
@@ -79,10 +125,71 @@ def load_excel_file(file_path: str) -> Optional[pd.DataFrame]:
         return load_from_gcs(file_path)
 
 
+def read_sheet_heads(file_path, rows: int) -> Optional[list]:
+    """
+    Read the first rows of every sheet of a local Excel file.
+
+    Args:
+        file_path (str or file-like): Local path to the Excel file, or an uploaded file buffer.
+        rows (int): Number of rows to read per sheet, header included.
+
+    Returns:
+        Optional[list]: The rows of each sheet, or None if no engine could open the file.
+    """
+    sheet = open_sheet(file_path)
+    if sheet is None:
+        return None
+
+    sheet_heads = []
+    try:
+        for index in range(sheet.sheet_count):
+            sheet.select_sheet(index)
+            header = sheet.header()
+            if header is None:
+                sheet_heads.append([])
+                continue
+            sheet_heads.append([header, *islice(sheet.rows(), rows - 1)])
+    finally:
+        sheet.close()
+    return sheet_heads
+
+
+def prefetch_header(file_path) -> bool:
+    """
+    Check that a file can match the source schema before loading it whole.
+
+    Only the first `prefetch_rows` rows of each sheet are read. Files that cannot be
+    checked (prefetch disabled, files on GCS, no engine able to open them) pass, and
+    are validated after the full load as before.
+
+    Args:
+        file_path (str or file-like): Path to the Excel file, or an uploaded file buffer.
+
+    Returns:
+        bool: False if no sheet starts with a header matching the mandatory columns.
+    """
+    etl_config = config["etl_pipeline"]
+    if not etl_config.get("prefetch_validation", False):
+        return True
+    if isinstance(file_path, str) and not etl_config["load_local"]:
+        return True
+
+    start_time = time.perf_counter()
+    sheet_heads = read_sheet_heads(file_path, etl_config.get("prefetch_rows", 10))
+    if sheet_heads is None:
+        return True
+    status = validate_header_prefetch(sheet_heads, source_name(file_path))
+    logger.info(f"Header prefetch took {time.perf_counter() - start_time:.2f}s")
+    return status
+
+
 def load_from_local(file_path: str) -> Optional[pd.DataFrame]:
     """
     Load an Excel file from a local path.
 
+    The file is read through `read_projected_excel`, which only materializes the
+    columns required by the source schema.
+
     Args:
         file_path (str): Local path to the Excel file.
 
@@ -91,14 +198,333 @@ def load_from_local(file_path: str) -> Optional[pd.DataFrame]:
     """
 
     if os.path.exists(file_path):
-        df = pd.read_excel(file_path, header=0)
-        logger.info(f"DataFrame is created successfully with the shape:{df.shape}")
+        start_time = time.perf_counter()
+        df = read_projected_excel(file_path)
+        logger.info(
+            f"DataFrame is created successfully with the shape:{df.shape} "
+            f"({os.path.getsize(file_path) / 1e6:.2f} MB read in {time.perf_counter() - start_time:.2f}s)"
+        )
         return df
     else:
         logger.error(f"Invalid file type or path: {file_path}")
         return None
 
 
+def get_empty_run_limits() -> tuple[int, int]:
+    """Return the number of consecutive empty rows and header columns that end a sheet."""
+    etl_config = config["etl_pipeline"]
+    return etl_config.get("max_empty_rows", 100), etl_config.get("max_empty_cols", 20)
+
+
+def is_empty_cell(value) -> bool:
+    """Return True for cells that hold no value (formatted-only cells are read as None)."""
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def load_from_buffer(buffer) -> pd.DataFrame:
+    """
+    Load an Excel file uploaded as an in-memory buffer, without writing it to disk.
+
+    Args:
+        buffer (file-like): The uploaded file, with its file name as `name`.
+
+    Returns:
+        pd.DataFrame: The loaded DataFrame.
+    """
+    start_time = time.perf_counter()
+    df = read_projected_excel(buffer)
+    logger.info(
+        f"DataFrame is created successfully with the shape:{df.shape} "
+        f"({buffer.getbuffer().nbytes / 1e6:.2f} MB read in {time.perf_counter() - start_time:.2f}s)"
+    )
+    return df
+
+
+def read_header(sheet) -> Optional[list]:
+    """
+    Read the header row of a sheet, naming empty header cells like pandas.
+
+    The header ends at the last non-empty cell before a run of `max_empty_cols`
+    empty cells, so that formatted but unused columns are not read.
+    """
+    header = sheet.header()
+    if header is None:
+        return None
+
+    _, max_empty_cols = get_empty_run_limits()
+    used_width = 0
+    empty_run = 0
+    for idx, col in enumerate(header):
+        if is_empty_cell(col):
+            empty_run += 1
+            if empty_run >= max_empty_cols:
+                break
+        else:
+            used_width = idx + 1
+            empty_run = 0
+
+    return [
+        str(col).strip() if col is not None else f"Unnamed: {idx}"
+        for idx, col in enumerate(header[:used_width])
+    ]
+
+
+def report_early_stop(sheet, rows_read: int) -> None:
+    """Report a sheet whose reading stopped at a run of empty rows before its declared end."""
+    max_empty_rows, _ = get_empty_run_limits()
+    declared_rows, _ = sheet.dimensions()
+    if not declared_rows or declared_rows <= rows_read:
+        return
+    message = (
+        f"Reading stopped after {max_empty_rows} consecutive empty rows at row {rows_read}, "
+        f"but the sheet declares {declared_rows} rows. Rows after the gap were not loaded; "
+        f"increase 'max_empty_rows' if the data continues."
+    )
+    global_vars["error_list"].append(message)
+    logger.warning(message)
+
+
+def iter_used_rows(sheet, positions: list, stats: dict) -> Iterator[tuple]:
+    """
+    Yield the projected data rows of a sheet up to the end of the used range.
+
+    Empty rows are held back and only yielded once a non-empty row follows them;
+    reading stops after `max_empty_rows` consecutive empty rows, so a sheet formatted
+    down to the last Excel row is never read to its end. If the sheet declares more
+    rows than were read, the stop is reported, since data after the gap is not loaded.
+
+    Args:
+        sheet: A sheet opened by `open_sheet`.
+        positions (list): Header positions of the columns to keep.
+        stats (dict): Updated with the number of 'rows' yielded.
+
+    Yields:
+        tuple: The projected cells of one row.
+    """
+    max_empty_rows, _ = get_empty_run_limits()
+    stats["rows"] = 0
+    if not positions:
+        return
+
+    pending = []
+    max_col = max(positions) + 1
+    for row in sheet.rows(max_col):
+        values = tuple(row[idx] if idx < len(row) else None for idx in positions)
+        if all(is_empty_cell(value) for value in values):
+            pending.append(values)
+            if len(pending) >= max_empty_rows:
+                report_early_stop(sheet, stats["rows"] + len(pending) + 1)
+                break
+            continue
+        stats["rows"] += len(pending) + 1
+        yield from pending
+        pending = []
+        yield values
+
+
+def log_used_range(file_path, sheet, rows: int, header: list) -> None:
+    """Log the used data range of a sheet next to the dimensions it declares."""
+    declared_rows, declared_cols = sheet.dimensions()
+    logger.info(
+        f"Used range of {os.path.basename(source_name(file_path))}: {rows + 1} rows x {len(header)} columns "
+        f"(sheet declares {declared_rows} rows x {declared_cols} columns)"
+    )
+
+
+def trim_empty_tail(df: pd.DataFrame, file_path) -> pd.DataFrame:
+    """Drop the trailing all-empty rows and unnamed columns of a sheet read by pandas."""
+    filled = df.notna()
+    used_rows = filled.any(axis=1)
+    last_row = used_rows[used_rows].index[-1] + 1 if used_rows.any() else 0
+    used_cols = filled.any(axis=0) | ~df.columns.astype(str).str.startswith("Unnamed:")
+    last_col = int(used_cols.to_numpy().nonzero()[0][-1]) + 1 if used_cols.any() else 0
+
+    trimmed = df.iloc[:last_row, :last_col]
+    if trimmed.shape != df.shape:
+        logger.info(
+            f"Used range of {os.path.basename(source_name(file_path))}: {len(trimmed) + 1} rows x "
+            f"{trimmed.shape[1]} columns (sheet declares {len(df) + 1} rows x {df.shape[1]} columns)"
+        )
+    return trimmed
+
+
+def resolve_projection(header: list) -> tuple[list, dict]:
+    """
+    Find the header positions of the mandatory schema columns.
+
+    Args:
+        header (list): The header row of the sheet.
+
+    Returns:
+        Tuple[list, dict]: Positions of the columns to read, and the schema dtype of each
+        projected column keyed by its header name.
+    """
+    schema = load_layout_schema(source_schema_path)
+    required_columns = get_required_columns(schema)
+    mapping, _ = resolve_column_mapping(header, required_columns)
+    schema_dtypes = {col["name"]: col["dtype"] for col in schema["columns"]}
+
+    positions = []
+    dtypes = {}
+    resolved = set()
+    for idx, col in enumerate(header):
+        required_col = mapping.get(col, col)
+        if required_col in required_columns and required_col not in resolved:
+            resolved.add(required_col)
+            positions.append(idx)
+            dtypes[col] = schema_dtypes[required_col]
+    return positions, dtypes
+
+
+def apply_schema_dtypes(df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    """Convert the projected columns to their schema dtypes while loading, keeping empty cells empty."""
+    for col, dtype in dtypes.items():
+        missing = df[col].isna()
+        df = convert_column_dtype(df, col, dtype)
+        df[col] = df[col].mask(missing)
+    return df
+
+
+def read_projected_excel(file_path, engines: list = None) -> pd.DataFrame:
+    """
+    Read the first sheet of a local Excel file, keeping only the columns that
+    fuzzy-match the mandatory columns of the source schema.
+
+    The sheet is opened with the first configured engine that can read it. The header
+    row is read first to resolve the columns; the rows of the used range are then
+    streamed and only the projected cells are kept. Column names are left as in the
+    sheet so that the schema validation still reports and renames them. If no engine
+    can open the file it is read whole with pandas.
+
+    Args:
+        file_path (str or file-like): Local path to the Excel file, or an uploaded file buffer.
+        engines (list, optional): Engine names to try; defaults to the configured engines.
+
+    Returns:
+        pd.DataFrame: The projected sheet with schema dtypes applied.
+    """
+    name = source_name(file_path)
+    sheet = open_sheet(file_path, engines)
+    if sheet is None:
+        logger.warning(f"No configured Excel engine could open {name}, using pandas.")
+        return trim_empty_tail(pd.read_excel(rewind(file_path), header=0), file_path)
+
+    try:
+        header = read_header(sheet)
+        if header is None:
+            return pd.DataFrame()
+        positions, dtypes = resolve_projection(header)
+
+        columns = [[] for _ in positions]
+        stats = {}
+        for row in iter_used_rows(sheet, positions, stats):
+            for values, value in zip(columns, row):
+                values.append(value)
+        log_used_range(file_path, sheet, stats["rows"], header)
+    finally:
+        sheet.close()
+
+    df = pd.DataFrame({header[idx]: values for idx, values in zip(positions, columns)})
+    logger.info(
+        f"Read {len(positions)} of {len(header)} columns and {len(df)} rows from {name}"
+    )
+    return apply_schema_dtypes(df, dtypes)
+
+
+def iter_excel_chunks(file_path, chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Read the first sheet of a local Excel file in chunks of rows.
+
+    The sheet is streamed with the first configured engine that can open it, so that
+    only one chunk of the mandatory schema columns is held in memory. If no engine can
+    open the file it is read whole with pandas and then sliced.
+
+    Args:
+        file_path (str or file-like): Local path to the Excel file, or an uploaded file buffer.
+        chunk_rows (int): Maximum number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: Consecutive row chunks, all with the header row as columns.
+    """
+    sheet = open_sheet(file_path)
+    if sheet is None:
+        logger.warning(
+            f"No configured Excel engine could open {source_name(file_path)}, using pandas."
+        )
+        df = trim_empty_tail(pd.read_excel(rewind(file_path), header=0), file_path)
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start : start + chunk_rows].reset_index(drop=True)
+        return
+
+    try:
+        header = read_header(sheet)
+        if header is None:
+            return
+        # Only the cells of the mandatory schema columns are kept
+        positions, dtypes = resolve_projection(header)
+        columns = [header[idx] for idx in positions]
+
+        buffer = []
+        stats = {}
+        for row in iter_used_rows(sheet, positions, stats):
+            buffer.append(tuple(row))
+            if len(buffer) >= chunk_rows:
+                yield apply_schema_dtypes(pd.DataFrame(buffer, columns=columns), dtypes)
+                buffer = []
+        if buffer:
+            yield apply_schema_dtypes(pd.DataFrame(buffer, columns=columns), dtypes)
+        log_used_range(file_path, sheet, stats["rows"], header)
+    finally:
+        sheet.close()
+
+
+def has_mandatory_columns(df: pd.DataFrame) -> bool:
+    """Return True if the columns of a loaded sheet match every mandatory schema column."""
+    schema = load_layout_schema(source_schema_path)
+    required_columns = get_required_columns(schema)
+    _, matched_columns = resolve_column_mapping(
+        [str(col) for col in df.columns], required_columns
+    )
+    return matched_columns == required_columns
+
+
+def load_detected_table(file_path) -> Optional[pd.DataFrame]:
+    """
+    Find the stock list among the tables of every sheet of a local Excel file.
+
+    Used when the header is not on the first row of the first sheet, e.g. below title
+    rows or on another sheet. Every sheet is read without a header and split into
+    tables; the first table whose header matches the mandatory schema columns is
+    returned, together with the following tables of its sheet that repeat its header.
+
+    Args:
+        file_path (str or file-like): Local path to the Excel file, or an uploaded file buffer.
+
+    Returns:
+        Optional[pd.DataFrame]: The detected table, or None if no table matches.
+    """
+    name = source_name(file_path)
+    sheets = pd.read_excel(rewind(file_path), sheet_name=None, header=None)
+    for sheet_name, sheet_df in sheets.items():
+        tables = identify_tables(sheet_df)
+        for idx, table in enumerate(tables):
+            if not has_mandatory_columns(table):
+                continue
+            columns = table.columns.tolist()
+            parts = [table] + [
+                later
+                for later in tables[idx + 1 :]
+                if later.columns.tolist() == columns
+            ]
+            df = pd.concat(parts, ignore_index=True)
+            logger.info(
+                f"Table with {len(df)} rows detected in sheet '{sheet_name}' of {name}"
+            )
+            return df
+    logger.error(f"No table matching the source schema was detected in {name}")
+    return None
+
+
 def load_from_gcs(gcs_path: str) -> Optional[pd.DataFrame]:
     """
     Load an Excel file from Google Cloud Storage.
@@ -0,0 +1,194 @@
+import logging
+from itertools import chain, islice, repeat
+from typing import Iterator, Optional
+import openpyxl
+from bilstein_slexa import config
+
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+
+def source_name(source) -> str:
+    """Return the file name of a source given as a path or as an uploaded file buffer."""
+    return source if isinstance(source, str) else source.name
+
+
+def rewind(source):
+    """Move a buffer back to its start so that it can be read again."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+class OpenpyxlSheet:
+    name = "openpyxl"
+
+    def __init__(self, file_path):
+        """Open the first sheet of an `.xlsx` file or buffer with openpyxl in read-only mode."""
+        self.workbook = openpyxl.load_workbook(
+            file_path, read_only=True, data_only=True
+        )
+        self.sheet_count = len(self.workbook.worksheets)
+        self.select_sheet(0)
+
+    def select_sheet(self, index: int):
+        """Read the sheet at `index` from now on."""
+        self.worksheet = self.workbook.worksheets[index]
+
+    def header(self) -> Optional[tuple]:
+        """Return the first row of the sheet, or None if the sheet is empty."""
+        return next(
+            self.worksheet.iter_rows(min_row=1, max_row=1, values_only=True), None
+        )
+
+    def rows(self, max_col: int = None) -> Iterator[tuple]:
+        """Yield the data rows below the header, cut to the first `max_col` cells."""
+        return self.worksheet.iter_rows(min_row=2, max_col=max_col, values_only=True)
+
+    def dimensions(self) -> tuple:
+        """Return the (rows, columns) the sheet declares."""
+        return self.worksheet.max_row, self.worksheet.max_column
+
+    def close(self):
+        self.workbook.close()
+
+
+class CalamineSheet:
+    name = "calamine"
+
+    def __init__(self, file_path):
+        """Open the first sheet of a workbook with the Rust-backed python-calamine reader."""
+        from python_calamine import CalamineWorkbook
+
+        if isinstance(file_path, str):
+            self.workbook = CalamineWorkbook.from_path(file_path)
+        else:
+            self.workbook = CalamineWorkbook.from_filelike(file_path)
+        self.sheet_count = len(self.workbook.sheet_names)
+        self.select_sheet(0)
+
+    def select_sheet(self, index: int):
+        self.sheet = self.workbook.get_sheet_by_index(index)
+
+    def iter_all_rows(self) -> Iterator[list]:
+        """
+        Yield the sheet rows from A1, with empty cells as None like openpyxl.
+
+        calamine starts at the first used cell, so leading rows and columns are padded.
+        """
+        if self.sheet.start is None:
+            return iter(())
+        start_row, start_col = self.sheet.start
+        padding = [None] * start_col
+        rows = (
+            padding + [None if value == "" else value for value in row]
+            for row in self.sheet.iter_rows()
+        )
+        return chain(repeat([], start_row), rows)
+
+    def header(self) -> Optional[list]:
+        return next(self.iter_all_rows(), None)
+
+    def rows(self, max_col: int = None) -> Iterator[list]:
+        return (row[:max_col] for row in islice(self.iter_all_rows(), 1, None))
+
+    def dimensions(self) -> tuple:
+        return self.sheet.total_height, self.sheet.total_width
+
+    def close(self):
+        self.workbook.close()
+
+
+class XlrdSheet:
+    name = "xlrd"
+
+    def __init__(self, file_path):
+        """Open the first sheet of a legacy `.xls` file or buffer with xlrd."""
+        import xlrd
+
+        self.xlrd = xlrd
+        if isinstance(file_path, str):
+            self.workbook = xlrd.open_workbook(file_path, on_demand=True)
+        else:
+            self.workbook = xlrd.open_workbook(
+                file_contents=file_path.read(), on_demand=True
+            )
+        self.sheet_count = self.workbook.nsheets
+        self.select_sheet(0)
+
+    def select_sheet(self, index: int):
+        self.sheet = self.workbook.sheet_by_index(index)
+
+    def read_row(self, row_idx: int, max_col: int = None) -> list:
+        """Read a row, converting date cells to datetimes as pandas does."""
+        return [
+            (
+                self.xlrd.xldate.xldate_as_datetime(cell.value, self.workbook.datemode)
+                if cell.ctype == self.xlrd.XL_CELL_DATE
+                else cell.value
+            )
+            for cell in self.sheet.row_slice(row_idx, 0, max_col)
+        ]
+
+    def header(self) -> Optional[list]:
+        return self.read_row(0) if self.sheet.nrows else None
+
+    def rows(self, max_col: int = None) -> Iterator[list]:
+        return (self.read_row(idx, max_col) for idx in range(1, self.sheet.nrows))
+
+    def dimensions(self) -> tuple:
+        return self.sheet.nrows, self.sheet.ncols
+
+    def close(self):
+        self.workbook.release_resources()
+
+
+EXCEL_ENGINES = {
+    "openpyxl": OpenpyxlSheet,
+    "calamine": CalamineSheet,
+    "xlrd": XlrdSheet,
+}
+
+
+def get_engine_names(file_path) -> list:
+    """Return the configured engines for a file, in the order they are tried."""
+    etl_config = config["etl_pipeline"]
+    if source_name(file_path).lower().endswith(".xls"):
+        return etl_config.get("xls_engines", ["xlrd"])
+    return etl_config.get("excel_engines", ["openpyxl"])
+
+
+def open_sheet(file_path, engines: list = None):
+    """
+    Open the first sheet of a workbook with the first engine that can read it.
+
+    Engines that are not installed or fail to open the file are skipped, so a
+    deployment without python-calamine falls back to openpyxl.
+
+    Args:
+        file_path (str or file-like): Local path to the Excel file, or an uploaded file buffer.
+        engines (list, optional): Engine names to try; defaults to the configured engines.
+
+    Returns:
+        The opened sheet, or None if no engine could open the file.
+    """
+    name = source_name(file_path)
+    for engine_name in engines or get_engine_names(file_path):
+        engine = EXCEL_ENGINES.get(engine_name)
+        if engine is None:
+            logger.warning(
+                f"Unknown Excel engine '{engine_name}' in config, skipping it."
+            )
+            continue
+        try:
+            sheet = engine(rewind(file_path))
+        except ImportError:
+            logger.info(
+                f"Excel engine '{engine_name}' is not installed, trying the next one."
+            )
+            continue
+        except Exception as e:
+            logger.warning(f"Excel engine '{engine_name}' could not open {name}: {e}")
+            continue
+        logger.info(f"Reading {name} with the {engine_name} engine.")
+        return sheet
+    return None
@@ -1,16 +1,101 @@
-from transformers import MarianMTModel, MarianTokenizer
+import time
+import logging
+import threading
+from bilstein_slexa import config
+
+logger = logging.getLogger("<Bilstein SLExA ETL>")
 
 
 class ModelLoader:
+    model_name = "Helsinki-NLP/opus-mt-de-en"
     _model = None
     _tokenizer = None
+    _lock = threading.Lock()
+    _prewarm_thread = None
+
+    @staticmethod
+    def get_profile_name():
+        """Return the name of the configured inference profile."""
+        return config.get("translation", {}).get("profile", "accurate")
+
+    @classmethod
+    def get_profile(cls, profile_name=None):
+        """Return the settings of an inference profile (defaults to the configured one)."""
+        profile_name = profile_name or cls.get_profile_name()
+        profiles = config.get("translation", {}).get("profiles", {})
+        if profile_name not in profiles:
+            raise ValueError(f"Unknown translation profile '{profile_name}'.")
+        return profiles[profile_name]
+
+    @classmethod
+    def get_model_id(cls):
+        """Return an identifier of the model and profile, as translations differ per profile."""
+        return f"{cls.model_name}:{cls.get_profile_name()}"
+
+    @classmethod
+    def get_generate_kwargs(cls, profile_name=None):
+        """Return the keyword arguments passed to `model.generate` for a profile."""
+        return dict(cls.get_profile(profile_name).get("generate") or {})
+
+    @classmethod
+    def build_translation_model(cls, profile_name=None):
+        """
+        Build a new model and tokenizer for an inference profile.
+
+        Args:
+            profile_name (str, optional): Name of the profile in `base.yaml`.
+
+        Returns:
+            Tuple[MarianMTModel, MarianTokenizer]: The model (quantized if the profile asks for it)
+            and its tokenizer.
+        """
+        profile = cls.get_profile(profile_name)
+
+        # Imported here so that importing the pipeline does not pay for transformers
+        import torch
+        from transformers import MarianMTModel, MarianTokenizer
+
+        if profile.get("num_threads"):
+            torch.set_num_threads(profile["num_threads"])
+
+        model = MarianMTModel.from_pretrained(cls.model_name)
+        model.eval()
+        if profile.get("quantize", False):
+            # Dynamic int8 quantization of the linear layers for CPU inference
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        tokenizer = MarianTokenizer.from_pretrained("Helsinki-NLP/opus-mt-en-de")
+        return model, tokenizer
 
     @classmethod
     def load_translation_model(cls):
         """Load the translation model and tokenizer once, if not already loaded."""
-        if cls._model is None or cls._tokenizer is None:
-            cls._model = MarianMTModel.from_pretrained("Helsinki-NLP/opus-mt-de-en")
-            cls._tokenizer = MarianTokenizer.from_pretrained(
-                "Helsinki-NLP/opus-mt-en-de"
-            )
+        with cls._lock:
+            if cls._model is None or cls._tokenizer is None:
+                start_time = time.perf_counter()
+                cls._model, cls._tokenizer = cls.build_translation_model()
+                logger.info(
+                    f"Translation model '{cls.get_model_id()}' loaded in {time.perf_counter() - start_time:.2f}s"
+                )
         return cls._model, cls._tokenizer
+
+    @classmethod
+    def prewarm(cls):
+        """
+        Start loading the translation model in a background thread, if not already loaded.
+
+        Nothing is loaded when the shared translation worker is enabled, as the
+        descriptions are then translated by the worker process.
+        """
+        if config.get("translation", {}).get("worker", {}).get("enabled", False):
+            return
+        if cls._model is not None or (
+            cls._prewarm_thread is not None and cls._prewarm_thread.is_alive()
+        ):
+            return
+        cls._prewarm_thread = threading.Thread(
+            target=cls.load_translation_model, name="model-prewarm", daemon=True
+        )
+        cls._prewarm_thread.start()
+        logger.info("Started pre-warming the translation model in the background.")
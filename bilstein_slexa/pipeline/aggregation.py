@@ -9,121 +9,202 @@ pd.set_option("display.width", 1000)
 pd.set_option("display.max_rows", None)
 
 
-def aggregate_data(df) -> tuple[bool, pd.DataFrame]:
+def join_unique_values(
+    df: pd.DataFrame, column: str, separator: str, as_string: bool = False
+) -> pd.Series:
     """
-    Aggregates data grouped by 'bundle_id' and includes detailed information about unique columns.
-    Validates that certain columns have identical values within each group.
+    Join the distinct values of a column per 'bundle_id', in order of appearance.
 
     Args:
-        df (pd.DataFrame): Input DataFrame.
+        df (pd.DataFrame): Rows to aggregate.
+        column (str): The column to join.
+        separator (str): Separator placed between values.
+        as_string (bool): Convert values with `str` first (missing values become 'nan').
 
     Returns:
-        pd.DataFrame: Aggregated DataFrame with additional columns for unique values and validation results.
+        pd.Series: Joined values indexed by 'bundle_id'.
     """
-    try:
-        # Ensure 'thickness(mm)' and 'width(mm)' are used for aggregation
-        required_columns = [
-            "thickness(mm)",
-            "width(mm)",
-            "weight",
-            "grade",
-            "min_price",
-            "location",
-            "finish",
-            "beschreibung",
-        ]
+    values = df[["bundle_id", column]]
+    if as_string:
+        values = values.assign(**{column: values[column].map(str)})
+    else:
+        values = values.dropna(subset=[column])
+    return values.drop_duplicates().groupby("bundle_id")[column].agg(separator.join)
+
+
+# Columns that must be present for aggregation
+required_columns = [
+    "thickness(mm)",
+    "width(mm)",
+    "weight",
+    "grade",
+    "min_price",
+    "location",
+    "finish",
+    "beschreibung",
+]
+
+# Output column -> (source column, separator for conflicts, join values as strings)
+conflict_columns = {
+    "grade": ("grade", ",", False),
+    "finish": ("finish", ",", False),
+    "min_price": ("min_price", ",", True),
+    "location": ("location", ",", False),
+    "thickness": ("thickness(mm)", ",", True),
+    "width": ("width(mm)", ", ", True),
+    "beschreibung": ("beschreibung", ", ", False),
+}
+
+# Columns whose values must be identical within a bundle
+validation_columns = [
+    "grade",
+    "min_price",
+    "location",
+    "finish",
+    "thickness",
+    "width",
+]
+
+
+class BundleAggregator:
+    def __init__(self):
+        """
+        Aggregate rows grouped by 'bundle_id' incrementally, one chunk at a time.
+
+        Only per-bundle partial results are kept: weight totals, the first row of each
+        bundle and the distinct (bundle_id, value) pairs of the aggregated columns, so the
+        memory held is bounded by the number of bundles rather than the number of rows.
+        """
+        self.totals = None
+        self.first_rows = None
+        self.distinct = {}
+
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Merge a chunk of rows into the partial aggregates.
+
+        Args:
+            df (pd.DataFrame): Rows of the sheet, in sheet order.
+        """
         for col in required_columns:
             if col not in df.columns:
                 raise KeyError(
                     f"The required column '{col}' is missing from the DataFrame."
                 )
+        source_columns = [source for source, _, _ in conflict_columns.values()]
 
-        # Group by 'bundle_id' and aggregate required metrics
-        aggregated_df = (
-            df.groupby("bundle_id")
-            .agg(
-                weight=("weight", "sum"),
-                quantity=("weight", "count"),
-                grade=(
-                    "grade",
-                    lambda x: ",".join(x.unique()) if x.nunique() > 1 else x.iloc[0],
-                ),
-                finish=(
-                    "finish",
-                    lambda x: ",".join(x.unique()) if x.nunique() > 1 else x.iloc[0],
-                ),
-                min_price=(
-                    "min_price",
-                    lambda x: (
-                        ",".join(map(str, x.unique())) if x.nunique() > 1 else x.iloc[0]
-                    ),
-                ),
-                location=(
-                    "location",
-                    lambda x: ",".join(x.unique()) if x.nunique() > 1 else x.iloc[0],
-                ),
-                thickness=(
-                    "thickness(mm)",
-                    lambda x: (
-                        ",".join(map(str, x.unique())) if x.nunique() > 1 else x.iloc[0]
-                    ),
-                ),
-                width=(
-                    "width(mm)",
-                    lambda x: (
-                        ", ".join(map(str, x.unique()))
-                        if x.nunique() > 1
-                        else x.iloc[0]
-                    ),
-                ),
-                beschreibung=(
-                    "beschreibung",
-                    lambda x: (
-                        ", ".join(x.unique())
-                        if x.replace(" ", "").nunique() > 1
-                        else x.iloc[0]
-                    ),
-                ),
-                description=(
-                    "description",
-                    lambda x: "| ".join(pd.Series(x.unique()).dropna()),
-                ),
-                batch_number=(
-                    "batch_number",
-                    lambda x: "\n".join(x.dropna().astype(str).unique()),
-                ),
-            )
-            .reset_index()
+        totals = df.groupby("bundle_id")["weight"].agg(["sum", "count"])
+        self.totals = (
+            totals if self.totals is None else self.totals.add(totals, fill_value=0)
         )
 
-        # Validation: Check if values are not identical for specific columns
-        validation_columns = [
-            "grade",
-            "min_price",
-            "location",
-            "finish",
-            "thickness",
-            "width",
+        first_rows = df.drop_duplicates("bundle_id").set_index("bundle_id")[
+            source_columns
         ]
-
-        aggregated_df_rep = pd.DataFrame()
-        for col in validation_columns:
-            aggregated_df_rep[f"{col}_identical"] = aggregated_df[col].apply(
-                lambda x: len(set(x.split(","))) == 1 if isinstance(x, str) else True
+        if self.first_rows is not None:
+            first_rows = pd.concat(
+                [
+                    self.first_rows,
+                    first_rows[~first_rows.index.isin(self.first_rows.index)],
+                ]
             )
+        self.first_rows = first_rows
+
+        for col in source_columns + ["description", "batch_number"]:
+            pairs = df[["bundle_id", col]].drop_duplicates()
+            if col in self.distinct:
+                pairs = pd.concat([self.distinct[col], pairs]).drop_duplicates()
+            self.distinct[col] = pairs
+
+    def count_unique(self, col: str) -> pd.Series:
+        """Return the number of distinct non-missing values of a column per bundle."""
+        pairs = self.distinct[col]
+        if col == "beschreibung":
+            # Blank descriptions count as empty ones
+            pairs = pairs.assign(
+                beschreibung=pairs[col].replace(" ", "")
+            ).drop_duplicates()
+        return (
+            pairs.dropna(subset=[col])
+            .groupby("bundle_id")
+            .size()
+            .reindex(self.totals.index, fill_value=0)
+        )
+
+    def result(self) -> tuple[bool, pd.DataFrame]:
+        """
+        Build the aggregated DataFrame from the partial aggregates and validate it.
+
+        Returns:
+            Tuple[bool, pd.DataFrame]: False if any bundle has non-identical values in the
+            validation columns, and the aggregated DataFrame.
+        """
+        self.totals = self.totals.sort_index()
+        index = self.totals.index
+        first_rows = self.first_rows.reindex(index)
 
-        # Log warnings for non-identical values
-        non_identical_rows_flag = True
-        for col in validation_columns:
-            non_identical_rows = aggregated_df[~aggregated_df_rep[f"{col}_identical"]]
-            if not non_identical_rows.empty:
-                logger.error(
-                    f"Details of non-identical rows:\n{non_identical_rows[['bundle_id', col]]}"
+        aggregated_df = pd.DataFrame(
+            {
+                "weight": self.totals["sum"],
+                "quantity": self.totals["count"].astype(int),
+            },
+            index=index,
+        )
+        nunique = {}
+        for output, (source, separator, as_string) in conflict_columns.items():
+            nunique[output] = self.count_unique(source)
+            values = first_rows[source].astype(object)
+            conflicting = nunique[output] > 1
+            if conflicting.any():
+                pairs = self.distinct[source]
+                conflict_pairs = pairs[pairs["bundle_id"].isin(index[conflicting])]
+                joined = join_unique_values(
+                    conflict_pairs, source, separator, as_string
                 )
-                global_vars["error_list"].append(
-                    f"Details of non-identical rows:\n{non_identical_rows[['bundle_id', col]].to_string(index=False)}"
+                values = values.where(~conflicting, joined.reindex(index))
+            aggregated_df[output] = values
+
+        for output, separator, as_string in (
+            ("description", "| ", False),
+            ("batch_number", "\n", True),
+        ):
+            pairs = self.distinct[output].dropna(subset=[output])
+            aggregated_df[output] = (
+                join_unique_values(pairs, output, separator, as_string)
+                .reindex(index)
+                .fillna("")
+            )
+        aggregated_df = aggregated_df.reset_index()
+
+        # Validation: Check if values are not identical for specific columns
+        aggregated_df_rep = pd.DataFrame(
+            {
+                f"{col}_identical": (nunique[col] <= 1).values
+                for col in validation_columns
+            }
+        )
+
+        # Report non-identical values in one columnar table
+        conflict_report = pd.concat(
+            [
+                pd.DataFrame(
+                    {
+                        "bundle_id": aggregated_df.loc[~identical, "bundle_id"],
+                        "column": col,
+                        "values": aggregated_df.loc[~identical, col],
+                    }
                 )
-                non_identical_rows_flag = False
+                for col in validation_columns
+                for identical in [aggregated_df_rep[f"{col}_identical"]]
+            ],
+            ignore_index=True,
+        )
+        non_identical_rows_flag = conflict_report.empty
+        if not non_identical_rows_flag:
+            logger.error(f"Details of non-identical rows:\n{conflict_report}")
+            global_vars["error_list"].append(
+                f"Details of non-identical rows:\n{conflict_report.to_string(index=False)}"
+            )
 
         logger.info(
             "Data successfully aggregated with unique values and validation checks."
@@ -133,6 +214,26 @@ def aggregate_data(df) -> tuple[bool, pd.DataFrame]:
 
         return non_identical_rows_flag, aggregated_df
 
+
+def aggregate_data(df) -> tuple[bool, pd.DataFrame]:
+    """
+    Aggregates data grouped by 'bundle_id' and includes detailed information about unique columns.
+    Validates that certain columns have identical values within each group.
+
+    Columns are aggregated with the built-in groupby kernels: a group takes the value of
+    its first row, and the distinct values are only joined for groups with conflicting values.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame.
+
+    Returns:
+        pd.DataFrame: Aggregated DataFrame with additional columns for unique values and validation results.
+    """
+    try:
+        aggregator = BundleAggregator()
+        aggregator.update(df)
+        return aggregator.result()
+
     except KeyError as e:
         logger.error(f"KeyError - Missing column during aggregation: {e}")
         raise
@@ -51,8 +51,72 @@ def apply_logic(row):
         return ""
 
 
+def build_category_matrix(lookup_df: pd.DataFrame) -> pd.Series:
+    """
+    Compile the category table into a (form, material) -> category Series.
+
+    Each form keeps the values of its first row, which is the row `apply_logic` reads.
+
+    Args:
+        lookup_df (pd.DataFrame): The category mapping table.
+
+    Returns:
+        pd.Series: Categories indexed by a (form, material) MultiIndex.
+    """
+    first_rows = lookup_df.drop_duplicates("Forms", keep="first").set_index("Forms")
+    matrix = first_rows.stack()
+    matrix.index.names = ["form", "material"]
+    return matrix
+
+
+def build_finish_index(lookup_df: pd.DataFrame) -> dict:
+    """Compile the 'Finish Long' -> 'Carbon Steel Flat' lookup, keeping the first match."""
+    first_rows = lookup_df.drop_duplicates("Finish Long", keep="first")
+    return dict(zip(first_rows["Finish Long"], first_rows["Carbon Steel Flat"]))
+
+
+# Compile the lookups once at load time
+category_matrix = build_category_matrix(validation_df)
+finish_index = build_finish_index(validation_df)
+
+
 # Function to add 'material' column to DataFrame
 def add_category(df: pd.DataFrame) -> pd.DataFrame:
-    # Apply the function to each row
-    df["category"] = df.apply(apply_logic, axis=1)
+    """
+    Add a 'category' column by resolving every (form, material) pair in one pass.
+
+    Cells marked 'Finish' are resolved through the first part of 'finish_1'. Unknown
+    combinations get an empty category and are reported once.
+
+    Args:
+        df (pd.DataFrame): DataFrame with 'form', 'material' and 'finish_1' columns.
+
+    Returns:
+        pd.DataFrame: DataFrame with the added 'category' column.
+    """
+    keys = pd.MultiIndex.from_arrays([df["form"], df["material"]])
+    known = keys.isin(category_matrix.index)
+    category = pd.Series(
+        category_matrix.reindex(keys).values, index=df.index, dtype=object
+    ).where(known, "")
+
+    # Flat products are categorised by their finish
+    finish_rows = category == "Finish"
+    first_part = df.loc[finish_rows, "finish_1"].map(
+        lambda finish: finish.split(";")[0] if isinstance(finish, str) else None
+    )
+    category[finish_rows] = first_part.map(finish_index).fillna("")
+
+    if not known.all():
+        unknown = (
+            df.loc[~known, ["form", "material"]]
+            .value_counts(dropna=False)
+            .rename("rows")
+            .reset_index()
+        )
+        logger.warning(
+            f"No category found for these form/material combinations:\n{unknown.to_string(index=False)}"
+        )
+
+    df["category"] = category
     return df
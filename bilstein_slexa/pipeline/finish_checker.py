@@ -1,27 +1,64 @@
+import os
+import threading
 import pandas as pd
 import yaml
 import logging
-from bilstein_slexa import finish_repo_path, global_vars
+from bilstein_slexa import finish_repo_path
+from bilstein_slexa.pipeline.incremental import report_bundle_table
 import numpy as np
 
 # Configure logging
 logger = logging.getLogger("<Bilstein SLExA ETL>")
 
+# Process-wide finish index, rebuilt when the YAML file changes
+_finish_index_cache = {"mtime": None, "index": None}
+_finish_index_lock = threading.Lock()
+
+
+def normalize_finish_id(finish_id):
+    """
+    Normalize a finish ID so that 10, "10", 10.0 and "10.0" give the same key.
+
+    Args:
+        finish_id: The finish ID as read from the sheet or the YAML file.
+
+    Returns:
+        Optional[str]: The normalized key, or None for missing values.
+    """
+    if finish_id is None or (isinstance(finish_id, float) and np.isnan(finish_id)):
+        return None
+    key = str(finish_id).strip()
+    try:
+        number = float(key)
+    except ValueError:
+        return key
+    return str(int(number)) if number.is_integer() else key
+
+
+def load_finish_index() -> dict:
+    """
+    Return the normalized finish ID -> finish entry index, re-reading the YAML file
+    only when its modification time changed.
+    """
+    mtime = os.path.getmtime(finish_repo_path)
+    with _finish_index_lock:
+        if _finish_index_cache["mtime"] != mtime:
+            with open(finish_repo_path, "r") as file:
+                finishes = yaml.safe_load(file)
+            _finish_index_cache["index"] = {
+                normalize_finish_id(item["finish_id"]): item for item in finishes
+            }
+            _finish_index_cache["mtime"] = mtime
+            logger.info(f"Finish index loaded from {finish_repo_path}")
+        return _finish_index_cache["index"]
+
 
 class FinishChecker:
     def __init__(self):
         """
-        Initialize FinishChecker by loading finishes from a YAML file.
-
-        Args:
-            yaml_path (str): Path to the YAML file containing finish data.
+        Initialize FinishChecker with the process-wide finish index.
         """
-        self.finishes = self.load_finishes_from_yaml()
-
-    def load_finishes_from_yaml(self):
-        """Load finish data from a YAML file."""
-        with open(finish_repo_path, "r") as file:
-            return yaml.safe_load(file)
+        self.finish_index = load_finish_index()
 
     def check_and_update_finish(self, df, finish_column="finish"):
         """
@@ -32,30 +69,22 @@ class FinishChecker:
             finish_column (str): The name of the column to check and update.
 
         Returns:
-            pd.DataFrame: Updated DataFrame with `finish1` and `finish2` values.
+            pd.DataFrame: Updated DataFrame with the `finish_1` column.
         """
-        # Create a lookup dictionary from finish data for faster access
-        finish_dict = {str(item["finish_id"]): item for item in self.finishes}
-
-        # Initialize finish2 column
-        # df["finish_2"] = np.nan
-
-        for idx, finish_id in df[finish_column].items():
-            if finish_id in finish_dict:
-                finish_data = finish_dict[finish_id]
-                df.at[idx, finish_column] = finish_data[
-                    "finish_1"
-                ]  # Update finish column with finish1
-                # df.at[idx, "finish_2"] = finish_data.get(
-                #     "finish_2"
-                # )  # Update finish2 if it exists
-                logger.info(
-                    f"Finish ID '{finish_id}' matched. Updated to '{finish_data['finish_1']}'"
-                )
-            else:
-                message = f"Finish ID '{finish_id}' not found in Bundle Id {df['bundle_id'].loc[idx]} in the YAML data. Updated to 'NaN'"
-                df.at[idx, finish_column] = np.nan
-                global_vars["error_list"].append(message)
-                logger.warning(message)
+        finish_1 = {key: item["finish_1"] for key, item in self.finish_index.items()}
+        keys = df[finish_column].map(normalize_finish_id)
+        matched = keys.isin(list(finish_1))
+
+        if not matched.all():
+            misses = df.loc[~matched, ["bundle_id", finish_column]]
+            message = report_bundle_table(
+                "Finish IDs not found in the YAML data. Updated to 'NaN'", misses
+            )
+            logger.warning(message)
+        logger.info(
+            f"{matched.sum()} of {len(df)} finish IDs matched with the YAML data."
+        )
+
+        df[finish_column] = keys.map(finish_1)
         df.rename(columns={finish_column: "finish_1"}, inplace=True)
         return df
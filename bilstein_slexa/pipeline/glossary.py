@@ -0,0 +1,84 @@
+import re
+import yaml
+import logging
+from functools import lru_cache
+from bilstein_slexa import glossary_path
+
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+WORD_PATTERN = re.compile(r"[^\W\d_]{2,}")
+TOKEN_PATTERN = re.compile(r"[^\W\d_]+|[^\s\w]|\d[\d.,/x×-]*", re.UNICODE)
+
+
+@lru_cache(maxsize=1)
+def load_glossary() -> dict:
+    """Load the translation glossary once per process, with normalized keys."""
+    with open(glossary_path, "r", encoding="utf-8") as file:
+        glossary = yaml.safe_load(file) or {}
+    return {
+        "phrases": {
+            normalize_phrase(key): value
+            for key, value in (glossary.get("phrases") or {}).items()
+        },
+        "tokens": {
+            key.lower(): value for key, value in (glossary.get("tokens") or {}).items()
+        },
+        "english_words": {word.lower() for word in glossary.get("english_words") or []},
+    }
+
+
+def normalize_phrase(text: str) -> str:
+    """Normalize a phrase by lowercasing and collapsing whitespace."""
+    return re.sub(r"\s+", " ", text).strip().lower()
+
+
+def translate_with_glossary(text: str):
+    """
+    Translate a description without the neural translator, if possible.
+
+    Texts without any word (batch numbers, dimensions, codes) and texts that are already
+    English are returned unchanged. Otherwise the text is translated through an exact
+    phrase match or, if every word is known, word by word.
+
+    Args:
+        text (str): The description to translate.
+
+    Returns:
+        Optional[str]: The translation, or None if the text needs the translation model.
+    """
+    glossary = load_glossary()
+    words = [word.lower() for word in WORD_PATTERN.findall(text)]
+
+    if not words or all(word in glossary["english_words"] for word in words):
+        return text
+
+    phrase = glossary["phrases"].get(normalize_phrase(text))
+    if phrase is not None:
+        return phrase
+
+    if all(word in glossary["tokens"] for word in words):
+        tokens = []
+        for token in TOKEN_PATTERN.findall(text):
+            tokens.append(glossary["tokens"].get(token.lower(), token))
+        translated = re.sub(r"\s+([,.;:)])", r"\1", " ".join(tokens))
+        return translated[:1].upper() + translated[1:]
+
+    return None
+
+
+def apply_glossary(texts) -> dict:
+    """
+    Translate the texts that the glossary can handle.
+
+    Args:
+        texts (list): Unique texts to translate.
+
+    Returns:
+        dict: Mapping of source text to translation for every text served by the glossary.
+    """
+    translations = {}
+    for text in texts:
+        translated = translate_with_glossary(text)
+        if translated is not None:
+            translations[text] = translated
+    return translations
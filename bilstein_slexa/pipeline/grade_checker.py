@@ -1,23 +1,60 @@
 import pandas as pd
 import logging
 import re
-from bilstein_slexa import global_vars
+from bilstein_slexa import config
+from bilstein_slexa.pipeline.incremental import report_bundle_message
+from bilstein_slexa.utils.ngram_index import NgramIndex
+from bilstein_slexa.utils.reference_snapshot import GradeSnapshot
 
 # Configure logging
 logger = logging.getLogger("<Bilstein SLExA ETL>")
 
 
 class GradeChecker:
-    def __init__(self, db_connection):
+    def __init__(self, db_connection=None):
         self.db = db_connection
         self.grade_list = self.get_grades_from_db()
+        self.grade_index = self.build_grade_index(self.grade_list)
+        self.suggestion_index = None
 
     def get_grades_from_db(self):
-        """Fetch grade names from the database and return as a list."""
-        query = "SELECT name FROM grade WHERE active = TRUE"
-        result = self.db.query(query)
-        # Extract grade names from the query result
-        return [row[0].strip() for row in result]
+        """Fetch grade names through the local snapshot, which only queries the database when stale."""
+        return GradeSnapshot().get_grades(self.db)
+
+    def build_grade_index(self, grade_list):
+        """
+        Build a normalized grade -> reference grade index.
+
+        The first reference of the list wins when several normalize to the same key,
+        as in a linear scan of `grade_list`.
+        """
+        grade_index = {}
+        for reference in grade_list:
+            grade_index.setdefault(self.normalize_grade(reference), reference)
+        return grade_index
+
+    def suggest_grades(self, candidates):
+        """
+        Suggest the closest reference grades for candidates without an exact match.
+
+        Args:
+            candidates (list): Unmatched grade candidates.
+
+        Returns:
+            dict: Mapping of candidate to its list of (reference, score) pairs.
+        """
+        if not candidates:
+            return {}
+        if self.suggestion_index is None:
+            self.suggestion_index = NgramIndex(
+                self.grade_list, n=3, normalize=self.normalize_grade
+            )
+        suggestion_config = config.get("grade_suggestions", {})
+        return self.suggestion_index.search_many(
+            candidates,
+            top_k=suggestion_config.get("top_k", 3),
+            min_score=suggestion_config.get("min_score", 0.3),
+        )
 
     def normalize_grade(self, grade):
         """Normalize the grade by converting to lowercase and removing spaces."""
@@ -33,8 +70,6 @@ class GradeChecker:
         Returns:
             Tuple[str, bool]: (Matched grade, True) if found, else (original candidate, False).
         """
-        normalized_candidate = self.normalize_grade(candidate)
-
         # Generate possible combinations
         parts = re.split(r"\s+", candidate)  # Split on whitespace
         combinations = []
@@ -53,33 +88,27 @@ class GradeChecker:
 
         # Attempt to match each combination against reference grades
         for combo in combinations:
-            normalized_combo = self.normalize_grade(combo)
-            for reference in self.grade_list:
-                if normalized_combo == self.normalize_grade(reference):
-                    return reference, True
+            reference = self.grade_index.get(self.normalize_grade(combo))
+            if reference is not None:
+                return reference, True
 
         return candidate, False  # Return original if no match found
 
     def match_grade(self, candidate):
         """Check if a candidate grade matches a grade in the database."""
-        normalized_candidate = self.normalize_grade(candidate)
-
         # Direct match check
-        for reference in self.grade_list:
-            if normalized_candidate == self.normalize_grade(reference):
-                return reference, True
+        reference = self.grade_index.get(self.normalize_grade(candidate))
+        if reference is not None:
+            return reference, True
 
         # Attempt to split and match largest segment
         if "+" in candidate or "-" in candidate:
             split_candidate = (
                 candidate.split("+")[0] if "+" in candidate else candidate.split("-")[0]
             )
-            normalized_split = self.normalize_grade(split_candidate)
-
-            for reference in self.grade_list:
-                if normalized_split == self.normalize_grade(reference):
-                    # suffix = candidate[len(split_candidate):].strip()
-                    return reference, True
+            reference = self.grade_index.get(self.normalize_grade(split_candidate))
+            if reference is not None:
+                return reference, True
 
         reference, matched_flag = self.try_combinations(candidate)
         if matched_flag:
@@ -89,23 +118,43 @@ class GradeChecker:
 
     def check_and_update_grade(self, df, grade_column="grade"):
         """Check and update grades in a DataFrame based on database reference."""
-        for idx, candidate in df[grade_column].items():
+        column = df[grade_column]
+        is_string = column.map(lambda x: isinstance(x, str))
+
+        # Match every distinct grade once and map the results back to the rows
+        matches = {
+            candidate: self.match_grade(candidate)
+            for candidate in column[is_string].unique()
+        }
+        unmatched = []
+        for candidate, (updated_grade, matched) in matches.items():
+            if matched:
+                logger.info(
+                    f"Grade '{candidate}' matched with database entry. Updated to '{updated_grade}'"
+                )
+            else:
+                unmatched.append(candidate)
+
+        suggestions = self.suggest_grades(unmatched)
+
+        # Only the rows that need a message are visited
+        for idx in df.index[column.isin(unmatched) | ~is_string]:
+            candidate = column.loc[idx]
             if isinstance(candidate, str):
-                updated_grade, matched = self.match_grade(candidate)
-                if matched:
-                    logger.info(
-                        f"Grade '{candidate}' matched with database entry. Updated to '{updated_grade}'"
+                message = f"Grade '{candidate}' with Bundle Id {df['bundle_id'].loc[idx]} was not found in database. No mapping applied."
+                if suggestions.get(candidate):
+                    message += " Closest grades: " + ", ".join(
+                        f"'{reference}' ({score})"
+                        for reference, score in suggestions[candidate]
                     )
-                else:
-                    message = f"Grade '{candidate}' with Bundle Id {df['bundle_id'].loc[idx]} was not found in database. No mapping applied."
-                    global_vars["error_list"].append(message)
-                    logger.warning(message)
-
-                # Update the DataFrame with the validated or original grade
-                df.at[idx, grade_column] = updated_grade
             else:
                 message = f"Grade '{candidate}' with Bundle Id {df['bundle_id'].loc[idx]} is empty"
-                global_vars["error_list"].append(message)
-                logger.warning(message)
+            report_bundle_message(df["bundle_id"].loc[idx], message)
+            logger.warning(message)
+
+        # Update the DataFrame with the validated or original grades
+        df[grade_column] = column.map(
+            {candidate: updated for candidate, (updated, _) in matches.items()}
+        ).where(is_string, column)
 
         return df
@@ -0,0 +1,252 @@
+import logging
+from typing import Callable
+import pandas as pd
+from bilstein_slexa import config, global_vars
+from bilstein_slexa.utils.bundle_store import BundleStore
+
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+
+def split_bundles(aggregated_df: pd.DataFrame, version: str):
+    """
+    Find the bundles that were processed unchanged in a previous successful run.
+
+    Args:
+        aggregated_df (pd.DataFrame): The aggregated frame, one row per bundle.
+        version (str): Version of the reference data and processing code.
+
+    Returns:
+        Tuple[BundleStore, pd.Series, dict]: The open store (None if reuse is disabled
+        or the frame cannot be fingerprinted), the bundle fingerprints and the stored
+        'row' and 'messages' of the unchanged bundles keyed by fingerprint.
+    """
+    if not config.get("bundle_reuse", {}).get("enabled", False):
+        return None, None, {}
+    try:
+        fingerprints = BundleStore.fingerprint(aggregated_df)
+    except TypeError as e:
+        # e.g. cells holding lists cannot be hashed
+        logger.warning(f"Bundles cannot be fingerprinted, processing all of them: {e}")
+        return None, None, {}
+
+    bundle_store = BundleStore(version)
+    reused = bundle_store.get_many(fingerprints.tolist())
+    logger.info(
+        f"{len(reused)} of {len(aggregated_df)} bundles unchanged since a previous run"
+    )
+    return bundle_store, fingerprints, reused
+
+
+def merge_bundles(
+    aggregated_df: pd.DataFrame,
+    processed_df: pd.DataFrame,
+    fingerprints: pd.Series,
+    reused: dict,
+) -> pd.DataFrame:
+    """
+    Merge the processed changed bundles with the stored unchanged bundles in bundle order.
+
+    Args:
+        aggregated_df (pd.DataFrame): The aggregated frame, one row per bundle.
+        processed_df (pd.DataFrame): The processed changed bundles, or None if none changed.
+        fingerprints (pd.Series): The bundle fingerprints, aligned with aggregated_df.
+        reused (dict): Stored bundles of the unchanged rows keyed by fingerprint.
+
+    Returns:
+        pd.DataFrame: One processed row per bundle, in the order of aggregated_df.
+    """
+    unchanged = fingerprints.isin(list(reused))
+    reused_df = pd.DataFrame(
+        [reused[fingerprint]["row"] for fingerprint in fingerprints[unchanged]],
+        index=aggregated_df.index[unchanged],
+    )
+    if processed_df is None:
+        return reused_df.loc[aggregated_df.index]
+    return pd.concat([processed_df, reused_df[processed_df.columns]]).loc[
+        aggregated_df.index
+    ]
+
+
+def format_report(title: str, report: pd.DataFrame) -> str:
+    """Format a report table under its title, as shown in the error list."""
+    return f"{title}:\n{report.to_string(index=False)}"
+
+
+def report_bundle_message(bundle_id, message: str):
+    """
+    Add a message about one bundle to the error list and record it for that bundle.
+
+    Args:
+        bundle_id: ID of the bundle the message is about.
+        message (str): The message.
+    """
+    global_vars["error_list"].append(message)
+    global_vars["bundle_messages"].append(
+        {"bundle_id": str(bundle_id), "message": message}
+    )
+
+
+def report_bundle_table(title: str, report: pd.DataFrame) -> str:
+    """
+    Add a report with a 'bundle_id' column to the error list and record each of its
+    rows for its bundle, so that the report can be rebuilt for any set of bundles.
+
+    Args:
+        title (str): Title of the report.
+        report (pd.DataFrame): One row per bundle.
+
+    Returns:
+        str: The formatted report.
+    """
+    message = format_report(title, report)
+    global_vars["error_list"].append(message)
+    records = (
+        report.astype(object).where(report.notna(), None).to_dict(orient="records")
+    )
+    global_vars["bundle_messages"].extend(
+        {"bundle_id": str(record["bundle_id"]), "title": title, "row": record}
+        for record in records
+    )
+    return message
+
+
+def group_messages(records: list, bundle_ids) -> dict:
+    """
+    Group the recorded messages of a run by bundle.
+
+    Args:
+        records (list): Records added by `report_bundle_message` and `report_bundle_table`.
+        bundle_ids (iterable): IDs of the processed bundles.
+
+    Returns:
+        dict: Bundle ID -> list of records about that bundle, without the bundle ID.
+    """
+    bundle_ids = set(map(str, bundle_ids))
+    by_bundle = {}
+    for record in records:
+        if record["bundle_id"] in bundle_ids:
+            by_bundle.setdefault(record["bundle_id"], []).append(
+                {key: value for key, value in record.items() if key != "bundle_id"}
+            )
+    return by_bundle
+
+
+def join_messages(bundle_messages: list) -> list:
+    """
+    Rebuild the messages of several bundles, merging the rows of one report.
+
+    Args:
+        bundle_messages (list): The stored records of each bundle, as returned by
+            `group_messages`.
+
+    Returns:
+        list: Messages for the error list; a report shared by several bundles is
+        returned once with the rows of all of them.
+    """
+    joined = {}
+    for records in bundle_messages:
+        for record in records:
+            if "title" in record:
+                joined.setdefault(("report", record["title"]), []).append(record["row"])
+            else:
+                joined.setdefault(("text", record["message"]), None)
+
+    return [
+        format_report(key, pd.DataFrame(rows)) if kind == "report" else key
+        for (kind, key), rows in joined.items()
+    ]
+
+
+def process_bundles(aggregated_df: pd.DataFrame, version: str, enrich: Callable):
+    """
+    Run the enrichment on the bundles changed since a successful run and reuse the
+    stored rows of the others.
+
+    The messages the enrichment records per bundle are kept with its row, and the
+    messages of reused bundles are added to the error list again, so that every run
+    reports the warnings of all of its bundles. The processed bundles are not stored
+    here: they are returned as pending bundles, which `commit_bundles` stores once
+    the result was loaded.
+
+    Args:
+        aggregated_df (pd.DataFrame): The aggregated frame, one row per bundle.
+        version (str): Version of the reference data and processing code.
+        enrich (callable): Function running the enrichment stages on a frame of bundles.
+
+    Returns:
+        Tuple[pd.DataFrame, dict]: One processed row per bundle, in the order of
+        aggregated_df, and the pending bundles (None if there is nothing to store).
+    """
+    bundle_store, fingerprints, reused = split_bundles(aggregated_df, version)
+    if bundle_store is not None:
+        bundle_store.close()
+
+    changed = (
+        ~fingerprints.isin(list(reused))
+        if fingerprints is not None
+        else pd.Series(True, index=aggregated_df.index)
+    )
+    messages_before = len(global_vars["bundle_messages"])
+    processed_df = None
+    if changed.all():
+        processed_df = enrich(aggregated_df)
+    elif changed.any():
+        processed_df = enrich(aggregated_df[changed])
+    new_messages = global_vars["bundle_messages"][messages_before:]
+
+    if reused:
+        df = merge_bundles(aggregated_df, processed_df, fingerprints, reused)
+        reused_messages = join_messages(
+            [
+                reused[fingerprint]["messages"]
+                for fingerprint in dict.fromkeys(fingerprints[~changed])
+            ]
+        )
+        for message in reused_messages:
+            global_vars["error_list"].append(message)
+            logger.warning(f"{message}")
+        logger.info(
+            f"{len(reused_messages)} message(s) of unchanged bundles reported again"
+        )
+    else:
+        df = processed_df
+
+    pending = None
+    if (
+        bundle_store is not None
+        and changed.any()
+        and df.index.equals(aggregated_df.index)
+    ):
+        bundle_ids = aggregated_df.loc[changed, "bundle_id"].astype(str)
+        messages = group_messages(new_messages, bundle_ids)
+        pending = {
+            "version": version,
+            "positions": [
+                int(position) for position in changed.to_numpy().nonzero()[0]
+            ],
+            "fingerprints": fingerprints[changed].tolist(),
+            "messages": [messages.get(bundle_id, []) for bundle_id in bundle_ids],
+        }
+    return df, pending
+
+
+def commit_bundles(df: pd.DataFrame, pending: dict):
+    """
+    Store the processed bundles of a run whose result was loaded successfully.
+
+    Args:
+        df (pd.DataFrame): The loaded result, one row per bundle.
+        pending (dict): The pending bundles returned by `process_bundles`, or None.
+    """
+    if not pending:
+        return
+    bundle_store = BundleStore(pending["version"])
+    try:
+        bundle_store.put_many(
+            pending["fingerprints"],
+            df.iloc[pending["positions"]],
+            pending["messages"],
+        )
+        logger.info(f"Stored {len(pending['fingerprints'])} processed bundles")
+    finally:
+        bundle_store.close()
@@ -29,6 +29,33 @@ def lookup_material(value, lookup_df):
         return None  # Return None when no match is found
 
 
+def build_material_index(lookup_df: pd.DataFrame) -> dict:
+    """
+    Compile the lookup table into a value -> material dict.
+
+    A value maps to the material of the first row in which it appears as 'Grade_Suffix',
+    'Grade' or 'Suffix', which is the row `lookup_material` would return.
+
+    Args:
+        lookup_df (pd.DataFrame): The material mapping table.
+
+    Returns:
+        dict: Mapping of grade, grade+suffix or suffix to material.
+    """
+    material_index = {}
+    for grade_suffix, grade, suffix, material in lookup_df[
+        ["Grade_Suffix", "Grade", "Suffix", "Material"]
+    ].itertuples(index=False):
+        for key in (grade_suffix, grade, suffix):
+            if pd.notna(key):
+                material_index.setdefault(key, material)
+    return material_index
+
+
+# Compile the lookup table once at load time
+material_index = build_material_index(validation_df)
+
+
 # Apply the logic
 def apply_logic(row):
     # Check the conditions for 'choice', 'form', and empty 'grade'
@@ -41,6 +68,26 @@ def apply_logic(row):
 
 # Function to add 'material' column to DataFrame
 def add_material(df: pd.DataFrame) -> pd.DataFrame:
-    # Apply the function to each row
-    df["material"] = df.apply(apply_logic, axis=1)
+    """
+    Add a 'material' column by mapping each grade through the compiled material index.
+
+    Rows with an empty grade and a '3rd' choice or 'Offcuts' form are 'Carbon Steel'.
+
+    Args:
+        df (pd.DataFrame): DataFrame with 'grade', 'choice' and 'form' columns.
+
+    Returns:
+        pd.DataFrame: DataFrame with the added 'material' column.
+    """
+    materials = df["grade"].map(material_index)
+
+    carbon_steel_default = ((df["choice"] == "3rd") | (df["form"] == "Offcuts")) & (
+        df["grade"] == ""
+    )
+    materials = materials.where(~carbon_steel_default, "Carbon Steel")
+
+    for grade in df.loc[materials.isna(), "grade"].unique():
+        logger.warning(f"No material found for grade '{grade}'")
+
+    df["material"] = materials
     return df
@@ -1,5 +1,6 @@
 import os
 import yaml
+import pandas as pd
 import streamlit as st
 from bilstein_slexa import (
     logger,
@@ -9,104 +10,513 @@ from bilstein_slexa import (
     source_schema_path,
     global_vars,
 )
-from bilstein_slexa.getters.data_getter import generate_path_list
-from bilstein_slexa.getters.data_getter import load_excel_file
+from bilstein_slexa.getters.data_getter import generate_path_list, is_valid_buffer
+from bilstein_slexa.getters.data_getter import load_excel_file, prefetch_header
+from bilstein_slexa.getters.data_getter import (
+    has_mandatory_columns,
+    load_detected_table,
+)
+from bilstein_slexa.utils.table import identify_tables
+from bilstein_slexa.getters.excel_engines import open_sheet, source_name
 from bilstein_slexa.pipeline.schema_validation import (
     validate_with_all_schemas,
     get_required_columns,
     fix_data_types,
 )
 from bilstein_slexa.pipeline.transformation import (
-    drop_rows_with_missing_values,
-    standardize_missing_values,
-    transform_dimensions,
-    ensure_floating_point,
     translate_and_merge_description,
+    transform_dimensions,
 )
 from bilstein_slexa.utils.helper import (
-    save_pickle_file,
+    save_interim_file,
     load_layout_schema,
-    load_pickle_file,
+    load_interim_file,
+    delete_interim_file,
 )
-from bilstein_slexa.pipeline.data_validation import (
-    validate_frei_verwendbar,
-    validate_missing_values,
-    validate_units,
-)
-from bilstein_slexa.pipeline.data_augmentaion import (
-    add_material_form,
-    convert_warehouse_address,
-    add_article_id,
-    add_material_choice,
-    add_access_default,
-    add_auction_type,
-    add_supplier_min,
+from bilstein_slexa.pipeline.streaming import (
+    get_header_translations,
+    prepare_rows,
+    report_validation_results,
+    stream_file,
+    validate_rows,
 )
+from bilstein_slexa.pipeline.data_augmentaion import augment_data
 from bilstein_slexa.pipeline.aggregation import aggregate_data
 from bilstein_slexa.config.logging_system import setup_logger
-from bilstein_slexa.utils.database import Database
 from bilstein_slexa.pipeline.grade_checker import GradeChecker
 from bilstein_slexa.pipeline.finish_checker import FinishChecker
 from bilstein_slexa.pipeline.generate_gsheet import get_gsheet_url
 from bilstein_slexa.utils.helper import delete_file, delete_all_files
 from bilstein_slexa.pipeline.material_checker import add_material
 from bilstein_slexa.pipeline.category_checker import add_category
+from bilstein_slexa.model_loader import ModelLoader
+from bilstein_slexa.utils.result_cache import ResultCache
+from bilstein_slexa.utils.stage_checkpoint import StageCheckpoints
+from bilstein_slexa.pipeline.incremental import commit_bundles, process_bundles
 
 # Define global variable to track the status of Excelsheet
 status = None
 
 
-def pipeline_run():
+def load_stage(file_path) -> dict:
+    """Stage 1: load the workbook."""
+    return {"data_frame": load_excel_file(file_path)}
+
+
+def detect_stage(file_path) -> dict:
+    """Stage 2: find the table matching the source schema on every sheet."""
+    return {"data_frame": load_detected_table(file_path)}
+
+
+def validation_stage(df, file_name: str) -> dict:
+    """Stage 3: validate the layout, renaming and dropping columns of the DataFrame."""
+    status = validate_with_all_schemas(df, file_name)
+    return {"data_frame": df, "status": status}
+
+
+def clean_stage(df, schema, required_cols, header_translations, logger) -> dict:
+    """Clean the rows and run the row-level validations."""
+    # Clean rows, rename columns and transform dimensions
+    df = prepare_rows(df, schema, required_cols, header_translations)
+
+    # Run validations and print validation reports
+    not_missed, validation_reports = validate_rows(df)
+    report_validation_results(validation_reports, logger)
+    return {"data_frame": df, "not_missed": not_missed}
+
+
+def aggregate_stage(df) -> dict:
+    """Aggregate the rows into bundles."""
+    # Aggregate data grouped by 'Q-Meldungsnummer'
+    non_identical_rows_flag, aggregated_df = aggregate_data(df)
+    return {"data_frame": aggregated_df, "identical": non_identical_rows_flag}
+
+
+def translate_stage(df, reference_version) -> dict:
+    """Translate the descriptions and merge the description columns."""
+    return {"data_frame": translate_and_merge_description(df)}
+
+
+def grade_stage(df, reference_version) -> dict:
+    """Check and update the grade column against the local grade snapshot."""
+    grade_checker = GradeChecker()
+    return {
+        "data_frame": grade_checker.check_and_update_grade(df, grade_column="grade")
+    }
+
+
+def finish_stage(df, reference_version) -> dict:
+    """Check and update the finish column."""
+    finish_checker = FinishChecker()
+    return {
+        "data_frame": finish_checker.check_and_update_finish(df, finish_column="finish")
+    }
+
+
+def augment_stage(df, reference_version) -> dict:
+    """Add the derived columns declared in the config."""
+    return {"data_frame": augment_data(df)}
+
+
+def material_stage(df, reference_version) -> dict:
+    """Add the material columns."""
+    return {"data_frame": add_material(df)}
+
+
+def category_stage(df, reference_version) -> dict:
+    """Add the category columns."""
+    return {"data_frame": add_category(df)}
+
+
+# Stages run per bundle after the aggregation, with the modules implementing them
+ENRICHMENT_STAGES = [
+    # Translate description and merge columns[ description, bescheribung, batch_number]
+    ("translate", translate_stage, (translate_and_merge_description,)),
+    # Check and update grade column (from the local grade snapshot)
+    ("grade", grade_stage, (GradeChecker,)),
+    # Check and update finish column
+    ("finish", finish_stage, (FinishChecker,)),
+    # Add derived columns (form, location UUID, article ID, choice,
+    # access, auction type, supplier min) declared in the config
+    ("augment", augment_stage, (augment_data,)),
+    # Add material columns
+    ("material", material_stage, (add_material,)),
+    # Add category columns
+    ("category", category_stage, (add_category,)),
+]
+
+
+def enrich_bundles(df, checkpoints, reference_version) -> pd.DataFrame:
+    """Run the enrichment stages on aggregated bundles."""
+    for stage_name, stage, code in ENRICHMENT_STAGES:
+        df = checkpoints.run(stage_name, stage, df, reference_version, code=code)[
+            "data_frame"
+        ]
+    return df
+
+
+def upload_stage(df, file_name: str) -> dict:
+    """Publish the result to Google Sheets."""
+    return {
+        "url": get_gsheet_url(
+            df,
+            file_name=file_name,
+            folder_id=config["google_folder_id"],
+        )
+    }
+
+
+def extract_file(file_path) -> dict | None:
+    """
+    Run the extraction steps for one file: header check, load and layout validation.
+
+    Args:
+        file_path (str or file-like): Local path to the Excel file, or an uploaded file buffer.
+
+    Returns:
+        dict: The extracted item ('file_name', 'data_frame', 'status', 'error_log',
+        'cache_key' and the streaming keys), the cached result with 'cache_hit' set if
+        the same workbook was processed before, or None if the file could not be loaded.
+    """
+    name = source_name(file_path)
+    file_name, _ = os.path.basename(name).rsplit(".", 1)
+
+    # Set up logging for each file
+    global_vars["error_list"] = []
+    status = False
+    logger = setup_logger(name, config)
+    logger.info(f"Starting processing for file: {name}")
+
+    # Serve workbooks that were already processed with the same reference data
+    cache_key = None
+    if config.get("result_cache", {}).get("enabled", False):
+        result_cache = ResultCache()
+        cache_key = result_cache.make_key(file_path)
+        cached = result_cache.get(cache_key)
+        if cached is not None:
+            logger.info(
+                f"Result of {name} served from the result cache ({cache_key[:12]})"
+            )
+            return {**cached, "file_name": file_name, "cache_hit": True}
+
+    checkpoints = StageCheckpoints()
+    extracted = {}
+    # Step 0: Check the header rows before paying for the full load
+    logger.info("<< Step 0: Checking the header rows of the Excel file >>")
+    if not prefetch_header(file_path):
+        df = None
+    elif config["etl_pipeline"].get("streaming", False):
+        # Steps 1-3 chunk by chunk, aggregating the bundles on the fly
+        logger.info("<< Step 1-3: Streaming Excel in chunks >>")
+        extracted = stream_file(file_path)
+        df = extracted.pop("data_frame")
+        status = extracted.pop("status")
+    else:
+        # Step 1: Load file
+        logger.info("<< Step 1: Loading Excel from from pre-define location >>")
+        df = checkpoints.run(
+            "load", load_stage, file_path, code=(load_excel_file, open_sheet)
+        )["data_frame"]
+        if df is None:
+            message = f"Loader failed to load Excel file to dataframe for: {name}"
+            global_vars["error_list"].append(message)
+            logger.error(message)
+            return None
+
+        # Step 2: Detect the table if its header is not on the first row of the
+        # first sheet (files on GCS are read as before)
+        is_local = (
+            not isinstance(file_path, str) or config["etl_pipeline"]["load_local"]
+        )
+        if is_local and not has_mandatory_columns(df):
+            logger.info("<< Step 2: Detecting table's header >>")
+            detected = checkpoints.run(
+                "detect",
+                detect_stage,
+                file_path,
+                code=(load_detected_table, identify_tables),
+            )["data_frame"]
+            if detected is not None:
+                df = detected
+
+        # Step 3: Validate against multiple schemas with scoring
+        logger.info(
+            "<< Step 3: Validate dataframe layout against pre-defined source schemas >>\n"
+        )
+        validated = checkpoints.run(
+            "validation",
+            validation_stage,
+            df,
+            code=(validate_with_all_schemas,),
+            file_name=name,
+        )
+        df, status = validated["data_frame"], validated["status"]
+    logger.info(f"error list >>{global_vars['error_list']}")
+
+    # Load the translation model in the background once a file can reach translation
+    if (
+        status
+        and config["etl_pipeline"]["run_transformation"]
+        and config.get("translation", {}).get("prewarm", False)
+    ):
+        ModelLoader.prewarm()
+
+    return {
+        "file_name": file_name,
+        "data_frame": df,
+        "status": status,
+        "error_log": global_vars["error_list"],
+        "cache_key": cache_key,
+        **extracted,
+    }
+
+
+def transform_item(
+    item: dict, schema: dict, required_cols: list, header_translations: dict
+) -> dict:
+    """
+    Run the transformation steps for one extracted item.
+
+    The item keeps the stem of the source file as its 'file_name', which also names
+    its G-sheet, so that every mode updates the same sheet.
+
+    Args:
+        item (dict): The item returned by `extract_file`.
+        schema (dict): The source schema.
+        required_cols (list): The mandatory source columns.
+        header_translations (dict): Source column -> internal column name mapping.
+
+    Returns:
+        dict: The processed item ('file_name', 'data_frame', 'status', 'error_log',
+        'cache_key', 'pending_bundles'); cached results are passed through.
+    """
+    file_name = item["file_name"]
+    if item.get("cache_hit", False):
+        return item
+
+    status = False
+    pending_bundles = None
+    global_vars["error_list"] = []
+    global_vars["bundle_messages"] = []
+    if item["status"]:
+
+        df = item["data_frame"]
+
+        # Set up logging for each file
+        logger = setup_logger(f"{item['file_name']}.pk", config)
+
+        checkpoints = StageCheckpoints()
+        if item.get("aggregated", False):
+            # Streaming mode already cleaned, validated and aggregated the rows
+            global_vars["error_list"] = item["error_log"]
+            aggregated_df = df
+            ready = item["ready"]
+        else:
+            cleaned = checkpoints.run(
+                "clean",
+                clean_stage,
+                df,
+                code=(
+                    prepare_rows,
+                    validate_rows,
+                    fix_data_types,
+                    transform_dimensions,
+                ),
+                schema=schema,
+                required_cols=required_cols,
+                header_translations=header_translations,
+                logger=logger,
+            )
+            aggregated = checkpoints.run(
+                "aggregate",
+                aggregate_stage,
+                cleaned["data_frame"],
+                code=(aggregate_data,),
+            )
+            aggregated_df = aggregated["data_frame"]
+            ready = aggregated["identical"] and cleaned["not_missed"]
+
+        if ready:
+            try:
+                # The stages below also depend on the reference data
+                reference_version = ResultCache.reference_version()
+
+                # Only bundles changed since a successful run go through the stages
+                df, pending_bundles = process_bundles(
+                    aggregated_df,
+                    reference_version
+                    + StageCheckpoints.stage_version(
+                        enrich_bundles,
+                        [
+                            code
+                            for _, _, stage_code in ENRICHMENT_STAGES
+                            for code in stage_code
+                        ],
+                    ),
+                    lambda bundles: enrich_bundles(
+                        bundles, checkpoints, reference_version
+                    ),
+                )
+
+                # Update status
+                status = True
+
+            except Exception as e:
+                message = f"Transformation failed for {file_name}: {e}"
+                global_vars["error_list"].append(message)
+                logger.exception(message)
+
+        else:
+            df = None
+            logger.error(
+                f" >>> Fix the errors for Excel file {item['file_name']} and upload file again! <<<"
+            )
+    else:
+        df = None
+        global_vars["error_list"] = item["error_log"]
+
+    return {
+        "file_name": file_name,
+        "data_frame": df,
+        "status": status,
+        "error_log": global_vars["error_list"],
+        "cache_key": item.get("cache_key"),
+        "pending_bundles": pending_bundles,
+    }
+
+
+def load_item(item: dict) -> tuple:
+    """
+    Publish a processed item to Google Sheets and store successful results in the
+    result cache and its processed bundles in the bundle store. Cached results keep
+    the G-sheet of the run that produced them.
+
+    Returns:
+        Tuple: (status, data_frame, file_name, error_log, url, cache_hit) as shown by the app.
+    """
+    if item.get("cache_hit", False):
+        return (
+            item["status"],
+            item["data_frame"],
+            item["file_name"],
+            item["error_log"],
+            item.get("url"),
+            True,
+        )
+
+    url = None
+    df = None
+    if item["status"]:
+        df = item["data_frame"]
+        url = StageCheckpoints().run(
+            "upload", upload_stage, df, item["file_name"], code=(get_gsheet_url,)
+        )["url"]
+        logger.info(f"G-sheet URL :{url}")
+
+        # Bundles are reused by later runs only once their result was uploaded
+        commit_bundles(df, item.get("pending_bundles"))
+
+        # Only successful results are cached; failures may be caused by the environment
+        if item.get("cache_key"):
+            ResultCache().put(
+                item["cache_key"],
+                {
+                    "file_name": item["file_name"],
+                    "data_frame": df,
+                    "status": item["status"],
+                    "error_log": item["error_log"],
+                    "url": url,
+                },
+            )
+
+    return (item["status"], df, item["file_name"], item["error_log"], url, False)
+
+
+def run_in_memory(sources: list) -> list:
+    """
+    Run every file through extraction, transformation and loading in a single pass.
+
+    Items are handed from one phase to the next as Python objects. They are written
+    to `inputs/interim` and `inputs/processed` if `checkpoints` is enabled, or if
+    `run_transformation` or `run_loading` is switched off, in which case the files
+    stop at that phase as in the staged mode.
+
+    Args:
+        sources (list): Local paths or uploaded file buffers.
+
+    Returns:
+        list: One (status, data_frame, file_name, error_log, url, cache_hit) tuple per file.
+    """
+    etl_config = config["etl_pipeline"]
+    run_transformation = etl_config["run_transformation"]
+    run_loading = etl_config["run_loading"]
+    checkpoints = etl_config.get("checkpoints", False)
+    schema = load_layout_schema(source_schema_path)
+    required_cols = get_required_columns(schema)
+    header_translations = get_header_translations(schema)
+    if run_transformation and (checkpoints or not run_loading):
+        delete_all_files(os.path.join(local_data_input_path, "processed"))
+
+    dataframes = []
+    for file_path in sources:
+        item = extract_file(file_path)
+        if isinstance(file_path, str):
+            delete_file(file_path)
+        if item is None:
+            continue
+        if checkpoints or not run_transformation:
+            save_interim_file(item, item["file_name"], folder="interim")
+        if not run_transformation:
+            continue
+
+        item = transform_item(item, schema, required_cols, header_translations)
+        if checkpoints or not run_loading:
+            save_interim_file(item, item["file_name"], folder="processed")
+        if not run_loading:
+            continue
+
+        dataframes.append(load_item(item))
+
+    logger.info("ETL pipeline completed")
+    return dataframes
+
+
+def pipeline_run(uploaded_files: list = None):
     """
     Orchestrates the ETL pipeline, managing each step sequentially.
 
+    With `in_memory` enabled, or when files are passed directly, each file goes
+    through the enabled phases in memory. Otherwise, or if `run_extraction` is
+    switched off, every phase runs for all files and hands its results to the next
+    phase through `inputs/interim` and `inputs/processed`.
+
     Args:
-        config_path (str): Path to the YAML configuration file.
+        uploaded_files (list, optional): Uploaded file buffers to process instead of
+            the files in `inputs/tmp`.
     """
     delete_all_files(os.path.join(local_data_input_path, "interim"))
     delete_all_files(log_output_path)
 
+    if config["etl_pipeline"]["run_extraction"]:
+        if uploaded_files is not None:
+            return run_in_memory(
+                [buffer for buffer in uploaded_files if is_valid_buffer(buffer)]
+            )
+        if config["etl_pipeline"].get("in_memory", False):
+            return run_in_memory(generate_path_list(folder_name="tmp") or [])
+    elif uploaded_files is not None:
+        logger.warning(
+            "run_extraction is disabled, the uploaded files are not processed."
+        )
+
     if config["etl_pipeline"]["run_extraction"]:
         excel_path_list = generate_path_list(folder_name="tmp")
         if excel_path_list and len(excel_path_list) > 0:
             for file_path in excel_path_list:
-                file_name, _ = os.path.basename(file_path).rsplit('.', 1)
-
-                # Set up logging for each file
-                global_vars["error_list"] = []
-                status = False
-                logger = setup_logger(file_path, config)
-                logger.info(f"Starting processing for file: {file_path}")
-
-                # Step 1: Load file
-                logger.info("<< Step 1: Loading Excel from from pre-define location >>")
-                df = load_excel_file(file_path)
-                if df is None:
-                    message = f"Loader failed to load Excel file to dataframe for: {file_path}"
-                    global_vars["error_list"].append(message)
-                    logger.error(message)
+                item = extract_file(file_path)
+                if item is None:
                     continue
-
-                # Step 2: Detec the header suing heuristic approach
-                # logger.info("<< Step 2: Detecting table's header >>")
-                # df = identify_tables(df)
-
-                # Step 3: Validate against multiple schemas with scoring
-                logger.info(
-                    "<< Step 3: Validate dataframe layout against pre-defined source schemas >>\n"
-                )
-                status = validate_with_all_schemas(df, file_path)
-                print(f"error list >>{global_vars['error_list']}")
-                save_pickle_file(
-                    {
-                        "file_name": file_name,
-                        "data_frame": df,
-                        "status": status,
-                        "error_log": global_vars["error_list"],
-                    },
-                    file_name,
-                    folder="interim",
-                )
+                save_interim_file(item, item["file_name"], folder="interim")
 
                 # write funtion to delete Excel file
                 delete_file(file_path)
@@ -126,166 +536,34 @@ def pipeline_run():
         delete_all_files(os.path.join(local_data_input_path, "processed"))
 
         required_cols = get_required_columns(schema)
-        header_translations = {
-            col["name"]: col["translation"]
-            for col in schema["columns"]
-            if col["mandatory"]
-        }
+        header_translations = get_header_translations(schema)
 
-        # Loop in pickle objects and read the dataframes
+        # Loop in interim artifacts and read the dataframes
 
         for file_name in os.listdir(dir_path):
-            status = False
-
             if os.path.isfile(os.path.join(dir_path, file_name)) and file_name.endswith(
-                ".pk"
+                ".json"
             ):
-                item = load_pickle_file(os.path.join(dir_path, file_name))
-                global_vars["error_list"] = []
-                if item["status"]:
-
-                    df = item["data_frame"]
-
-                    # Set up logging for each file
-                    logger = setup_logger(f"{item['file_name']}.pk", config)
-
-                    # Fix data type after loading pickle file
-                    df = fix_data_types(df, schema)
-
-                    # Convert all empty values to NAN
-                    standardize_missing_values(df)
-
-                    # Drop rows when 90% of the required row values are empty
-                    drop_rows_with_missing_values(df, required_cols, threshold=0.9)
-
-                    # Rename columns based on translations
-                    df.rename(columns=header_translations, inplace=True)
-
-                    # Run transformations and validations
-                    df = transform_dimensions(df)
-                    df = ensure_floating_point(df)
-                    not_missed, missing_values = validate_missing_values(df)
-
-                    validation_reports = {
-                        "missing_values": missing_values,
-                        "unit_validation": validate_units(df),
-                        "frei_verwendbar": validate_frei_verwendbar(df),
-                    }
-
-                    # Print validation reports
-                    for report_name, report in validation_reports.items():
-                        if not report.empty:
-                            global_vars["error_list"].append(report)
-                            logger.warning(f"\n{report_name.capitalize()} Report:")
-                            logger.warning(f"\n{report}")
-
-                    # Aggregate data grouped by 'Q-Meldungsnummer'
-                    non_identical_rows_flag, aggregated_df = aggregate_data(df)
-
-                    if non_identical_rows_flag and not_missed:
-                        # Initialize the database connection
-                        db = Database()
-                        try:
-                            # Translate description and merge columns[ description, bescheribung, batch_number]
-                            df = translate_and_merge_description(aggregated_df)
-
-                            # Check and update grade column
-                            grade_checker = GradeChecker(db)
-                            df = grade_checker.check_and_update_grade(
-                                df, grade_column="grade"
-                            )
-
-                            # Check and update finish column
-                            finish_checker = FinishChecker()
-                            df = finish_checker.check_and_update_finish(
-                                df, finish_column="finish"
-                            )
-
-                            # Add material form column
-                            df = add_material_form(df)
-
-                            # Convert the address code to real address
-                            df = convert_warehouse_address(df)
-
-                            # Add article ID column (same with bundle ID- only for internal usage)
-                            df = add_article_id(df)
-
-                            # Add material choice column (e,g 2nd, prime etc.)
-                            df = add_material_choice(df)
-
-                            # Add access default column
-                            df = add_access_default(df)
-
-                            # Add auction type column
-                            df = add_auction_type(df)
-
-                            # Add supplier min column (same with min_price)
-                            df = add_supplier_min(df)
-
-                            # Add material columns
-                            df = add_material(df)
-
-                            # Add category columns
-                            df = add_category(df)
-
-                            # Update status
-                            status = True
-
-                        except Exception as e:
-                            print(e)
-                        finally:
-                            # Close the connection when done
-                            db.close()
-                            del grade_checker
-                            del finish_checker
-
-                    else:
-                        df = None
-                        logger.error(
-                            f" >>> Fix the errors for Excel file {item['file_name']} and upload file again! <<<"
-                        )
-                else:
-                    global_vars["error_list"] = item["error_log"]
-
-                # write function to delete pickle file
-                delete_file(os.path.join(dir_path, file_name))
-                save_pickle_file(
-                    {
-                        "file_name": file_name,
-                        "data_frame": df,
-                        "status": status,
-                        "error_log": global_vars["error_list"],
-                    },
-                    file_name,
-                    folder="processed",
-                )
+                item = load_interim_file(os.path.join(dir_path, file_name))
+                item = transform_item(item, schema, required_cols, header_translations)
+
+                # Delete the interim artifact
+                delete_interim_file(os.path.join(dir_path, file_name))
+                save_interim_file(item, item["file_name"], folder="processed")
 
     # Run loading Phase
     if config["etl_pipeline"]["run_loading"]:
         dataframes = []
         dir_path = os.path.join(local_data_input_path, "processed")
         for file_name in os.listdir(dir_path):
-            url = None
-            df = None
             if os.path.isfile(os.path.join(dir_path, file_name)) and file_name.endswith(
-                ".pk"
+                ".json"
             ):
-                item = load_pickle_file(os.path.join(dir_path, file_name))
-                if item["status"]:
-                    df = item["data_frame"]
-                    url = get_gsheet_url(
-                        df,
-                        file_name=item["file_name"],
-                        folder_id=config["google_folder_id"],
-                    )
-                    logger.info(f"G-sheet URL :{url}")
-
-                dataframes.append(
-                    (item["status"], df, item["file_name"], item["error_log"], url)
-                )
-                delete_file(os.path.join(dir_path, file_name))
+                item = load_interim_file(os.path.join(dir_path, file_name))
+                dataframes.append(load_item(item))
+                delete_interim_file(os.path.join(dir_path, file_name))
 
-        print("ETL pipeline completed")
+        logger.info("ETL pipeline completed")
         return dataframes
 
 
@@ -62,7 +62,11 @@ def validate_with_all_schemas(df: pd.DataFrame, file_path: str):
 
     if required_columns == matched_columns:
         # Check if any required columns have empty values
-        empty_columns = [col for col in required_columns if df[col].isnull().all() and col not in can_be_empty_col]
+        empty_columns = [
+            col
+            for col in required_columns
+            if df[col].isnull().all() and col not in can_be_empty_col
+        ]
 
         if empty_columns:
             unmatched_schemas.append(
@@ -106,33 +110,109 @@ def validate_with_all_schemas(df: pd.DataFrame, file_path: str):
     return False
 
 
-def match_and_fix_columns(df: pd.DataFrame, required_columns: list) -> list:
+def validate_header_prefetch(sheet_heads: list, file_path: str) -> bool:
     """
-    Uses fuzzy matching to match and rename DataFrame columns to the schema's required columns
-    if the match is close enough based on a specified threshold.
+    Check the first rows of every sheet for the mandatory schema columns.
+
+    Each row is treated as a candidate header and fuzzy-matched like the full
+    validation. The file passes as soon as one row matches all mandatory columns;
+    otherwise the columns missing from the best candidate are reported.
 
     Args:
-        df (pd.DataFrame): DataFrame with columns to match.
+        sheet_heads (list): The first rows of each sheet.
+        file_path (str): The path to the file being validated.
+
+    Returns:
+        bool: True if a matching header row was found; otherwise, False.
+    """
+    schema = load_layout_schema(source_schema_path)
+    required_columns = get_required_columns(schema)
+
+    best_matched = []
+    for sheet_index, rows in enumerate(sheet_heads):
+        for row_index, row in enumerate(rows):
+            header = [
+                str(col).strip() for col in row if isinstance(col, str) and col.strip()
+            ]
+            # A row with fewer text cells than mandatory columns cannot be the header
+            if len(header) < len(required_columns):
+                continue
+            _, matched_columns = resolve_column_mapping(header, required_columns)
+            if matched_columns == required_columns:
+                logger.info(
+                    f"Header of {file_path} found in sheet {sheet_index}, row {row_index}"
+                )
+                return True
+            if len(matched_columns) > len(best_matched):
+                best_matched = matched_columns
+
+    report = {
+        "schema": source_schema_path,
+        "missing_columns": [col for col in required_columns if col not in best_matched],
+    }
+    global_vars["error_list"].append(report)
+    logger.error(f"No matching schema found in the first rows of {file_path}")
+    logger.error(f"Schema mismatch details: {report}")
+    return False
+
+
+def resolve_column_mapping(columns: list, required_columns: list) -> tuple[dict, list]:
+    """
+    Fuzzy-match the required columns against a list of column names without a DataFrame.
+
+    Matches are resolved one required column at a time, as if each match were renamed
+    before the next one is looked up.
+
+    Args:
+        columns (list): Column names, e.g. the header row of a sheet.
         required_columns (list): List of required column names from the schema.
-        match_threshold (int): Fuzzy matching threshold.
 
     Returns:
-        list: List of columns that were matched and possibly renamed.
+        Tuple[dict, list]: Mapping of original column name to required column name for the
+        columns that need renaming, and the list of matched required columns.
     """
+    current_columns = list(columns)
+    origins = {col: col for col in current_columns}
+    mapping = {}
     matched_columns = []
     for required_col in required_columns:
-        # Fuzzy match each required column with DataFrame columns
+        # Fuzzy match each required column with the column names
         best_match, similarity = process.extractOne(
-            required_col, df.columns, scorer=fuzz.ratio
+            required_col, current_columns, scorer=fuzz.ratio
         )
 
         if similarity >= config["column_match_threshold"]:
             matched_columns.append(required_col)
             if best_match != required_col:
-                logger.info(
-                    f"Renaming column '{best_match}' to '{required_col}' (similarity: {similarity}%)"
-                )
-                df.rename(columns={best_match: required_col}, inplace=True)
+                mapping[origins[best_match]] = required_col
+                origins[required_col] = origins.pop(best_match)
+                current_columns = [
+                    required_col if col == best_match else col
+                    for col in current_columns
+                ]
+
+    return mapping, matched_columns
+
+
+def match_and_fix_columns(df: pd.DataFrame, required_columns: list) -> list:
+    """
+    Uses fuzzy matching to match and rename DataFrame columns to the schema's required columns
+    if the match is close enough based on a specified threshold.
+
+    Args:
+        df (pd.DataFrame): DataFrame with columns to match.
+        required_columns (list): List of required column names from the schema.
+
+    Returns:
+        list: List of columns that were matched and possibly renamed.
+    """
+    mapping, matched_columns = resolve_column_mapping(df.columns, required_columns)
+    for source_col, required_col in mapping.items():
+        similarity = fuzz.ratio(required_col, source_col)
+        logger.info(
+            f"Renaming column '{source_col}' to '{required_col}' (similarity: {similarity}%)"
+        )
+    df.rename(columns=mapping, inplace=True)
 
     return matched_columns
 
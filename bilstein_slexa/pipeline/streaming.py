@@ -0,0 +1,180 @@
+import time
+import logging
+from itertools import chain
+import pandas as pd
+from bilstein_slexa import config, source_schema_path, global_vars
+from bilstein_slexa.getters.data_getter import iter_excel_chunks
+from bilstein_slexa.getters.excel_engines import source_name
+from bilstein_slexa.pipeline.aggregation import BundleAggregator
+from bilstein_slexa.pipeline.data_validation import (
+    validate_frei_verwendbar,
+    validate_missing_values,
+    validate_units,
+)
+from bilstein_slexa.pipeline.schema_validation import (
+    delete_extra_columns,
+    fix_data_types,
+    get_required_columns,
+    resolve_column_mapping,
+    validate_with_all_schemas,
+)
+from bilstein_slexa.pipeline.transformation import (
+    drop_rows_with_missing_values,
+    ensure_floating_point,
+    standardize_missing_values,
+    transform_dimensions,
+)
+from bilstein_slexa.utils.helper import load_layout_schema
+
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+
+def get_header_translations(schema: dict) -> dict:
+    """Return the source column -> internal column name mapping of the mandatory columns."""
+    return {
+        col["name"]: col["translation"] for col in schema["columns"] if col["mandatory"]
+    }
+
+
+def prepare_rows(
+    df: pd.DataFrame, schema: dict, required_cols: list, header_translations: dict
+) -> pd.DataFrame:
+    """
+    Run the row-wise cleaning stages on a validated sheet or chunk of a sheet.
+
+    Args:
+        df (pd.DataFrame): Rows with the schema's column names.
+        schema (dict): The source schema.
+        required_cols (list): The mandatory source columns.
+        header_translations (dict): Source column -> internal column name mapping.
+
+    Returns:
+        pd.DataFrame: Cleaned rows with internal column names.
+    """
+    # Fix data type after loading
+    df = fix_data_types(df, schema)
+
+    # Convert all empty values to NAN
+    standardize_missing_values(df)
+
+    # Drop rows when 90% of the required row values are empty
+    drop_rows_with_missing_values(df, required_cols, threshold=0.9)
+
+    # Rename columns based on translations
+    df.rename(columns=header_translations, inplace=True)
+
+    # Run transformations
+    df = transform_dimensions(df)
+    df = ensure_floating_point(df)
+    return df
+
+
+def validate_rows(df: pd.DataFrame) -> tuple[bool, dict]:
+    """
+    Run the row-level validations.
+
+    Returns:
+        Tuple[bool, dict]: False if required values are missing, and the reports by name.
+    """
+    not_missed, missing_values = validate_missing_values(df)
+    validation_reports = {
+        "missing_values": missing_values,
+        "unit_validation": validate_units(df),
+        "frei_verwendbar": validate_frei_verwendbar(df),
+    }
+    return not_missed, validation_reports
+
+
+def report_validation_results(validation_reports: dict, file_logger) -> None:
+    """Add the non-empty validation reports to the error list and log them."""
+    for report_name, report in validation_reports.items():
+        if not report.empty:
+            global_vars["error_list"].append(report)
+            file_logger.warning(f"\n{report_name.capitalize()} Report:")
+            file_logger.warning(f"\n{report}")
+
+
+def stream_file(file_path, chunk_rows: int = None) -> dict:
+    """
+    Validate, clean and aggregate a workbook chunk by chunk.
+
+    The layout is validated on the first chunk; every later chunk gets the same column
+    renaming and projection. Each chunk goes through the row-wise stages and is merged
+    into a `BundleAggregator`, so peak memory is bounded by the chunk size plus the
+    number of distinct bundles. Note that the empty-column check of the schema
+    validation only sees the first chunk.
+
+    Args:
+        file_path (str or file-like): Local path to the Excel file, or an uploaded file buffer.
+        chunk_rows (int, optional): Rows per chunk; defaults to `streaming_chunk_rows`.
+
+    Returns:
+        dict: 'status' of the schema validation, the aggregated 'data_frame' (or None),
+        'aggregated' set to True and 'ready' if the file can go through the transformation.
+    """
+    chunk_rows = chunk_rows or config["etl_pipeline"].get("streaming_chunk_rows", 50000)
+    file_name = source_name(file_path)
+    schema = load_layout_schema(source_schema_path)
+    required_cols = get_required_columns(schema)
+    header_translations = get_header_translations(schema)
+    failed = {"status": False, "data_frame": None, "aggregated": True, "ready": False}
+
+    start_time = time.perf_counter()
+    chunks = iter_excel_chunks(file_path, chunk_rows)
+    first_chunk = next(chunks, None)
+    if first_chunk is None:
+        message = f"No rows found in Excel file: {file_name}"
+        global_vars["error_list"].append(message)
+        logger.error(message)
+        return failed
+
+    header = [str(col).strip() for col in first_chunk.columns]
+    column_mapping, _ = resolve_column_mapping(header, required_cols)
+    if not validate_with_all_schemas(first_chunk, file_name):
+        chunks.close()
+        return failed
+
+    try:
+        aggregator = BundleAggregator()
+        not_missed = True
+        collected_reports = {}
+        row_count = 0
+        for chunk in chain([first_chunk], chunks):
+            if chunk is not first_chunk:
+                chunk.columns = header
+                chunk.rename(columns=column_mapping, inplace=True)
+                delete_extra_columns(chunk, required_cols)
+            row_count += len(chunk)
+
+            chunk = prepare_rows(chunk, schema, required_cols, header_translations)
+            chunk_not_missed, chunk_reports = validate_rows(chunk)
+            not_missed = not_missed and chunk_not_missed
+            for report_name, report in chunk_reports.items():
+                collected_reports.setdefault(report_name, []).append(report)
+
+            aggregator.update(chunk)
+
+        report_validation_results(
+            {
+                name: pd.concat(reports, ignore_index=True)
+                for name, reports in collected_reports.items()
+            },
+            logger,
+        )
+        non_identical_rows_flag, aggregated_df = aggregator.result()
+    except Exception as e:
+        message = f"Streaming failed for {file_name}: {e}"
+        global_vars["error_list"].append(message)
+        logger.error(message)
+        return failed
+
+    logger.info(
+        f"Streamed {row_count} rows into {len(aggregated_df)} bundles in chunks of "
+        f"{chunk_rows} rows ({time.perf_counter() - start_time:.2f}s)"
+    )
+    return {
+        "status": True,
+        "data_frame": aggregated_df,
+        "aggregated": True,
+        "ready": non_identical_rows_flag and not_missed,
+    }
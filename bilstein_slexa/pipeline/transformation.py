@@ -1,13 +1,20 @@
+import time
 import pandas as pd
 import logging
 import numpy as np
+from multiprocessing import AuthenticationError
 
+from bilstein_slexa import config
 from bilstein_slexa.model_loader import ModelLoader
+from bilstein_slexa.utils.translation_cache import TranslationCache
+from bilstein_slexa.pipeline.translation_worker import (
+    TranslationWorkerError,
+    translate_with_worker,
+)
+from bilstein_slexa.pipeline.glossary import apply_glossary
 
 logger = logging.getLogger("<Bilstein SLExA ETL>")
 
-model, tokenizer = ModelLoader.load_translation_model()
-
 
 def standardize_missing_values(df) -> pd.DataFrame:
     """
@@ -158,10 +165,8 @@ def translate_and_merge_description(df: pd.DataFrame) -> pd.DataFrame:
     """
 
     try:
-        # Step 1: Translate the 'description' column
-        df["translated_description"] = df["description"].apply(
-            lambda x: translate_text(x, tokenizer, model)
-        )
+        # Step 1: Translate the unique 'description' values in batches and map them back
+        df["translated_description"] = translate_column(df["description"])
 
         # Step 2: Append translated text to 'description' column with '|'
         df["description"] = df.apply(
@@ -171,18 +176,22 @@ def translate_and_merge_description(df: pd.DataFrame) -> pd.DataFrame:
 
         # Step 3: Merge 'Beschreibung' and 'batch_number' with updated 'description' column
         df["description"] = df.apply(
-                lambda row: " | ".join(
-                    filter(
-                        None,
-                        [
-                            row['description'] if pd.notna(row['description']) else "",
-                            row['beschreibung'] if pd.notna(row['beschreibung']) else "",
-                            f"\n-{row['batch_number']}" if pd.notna(row['batch_number']) else ""
-                        ]
-                    )
-                ).strip(" | "),
-                axis=1,
-            )
+            lambda row: " | ".join(
+                filter(
+                    None,
+                    [
+                        row["description"] if pd.notna(row["description"]) else "",
+                        row["beschreibung"] if pd.notna(row["beschreibung"]) else "",
+                        (
+                            f"\n-{row['batch_number']}"
+                            if pd.notna(row["batch_number"])
+                            else ""
+                        ),
+                    ],
+                )
+            ).strip(" | "),
+            axis=1,
+        )
 
         # Drop the intermediate 'translated_description' column if not needed
         df.drop(
@@ -200,6 +209,132 @@ def translate_and_merge_description(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def translate_column(column: pd.Series) -> pd.Series:
+    """
+    Translates a column of texts by running the model once per batch of unique values.
+
+    Unique values are first served by the glossary, then looked up in the persistent
+    translation cache; only the remaining texts are sent to the model. Missing values
+    are left untouched and the translations are broadcast back to every row holding
+    the same source text.
+
+    Args:
+        column (pd.Series): The texts to translate.
+
+    Returns:
+        pd.Series: The translated texts aligned with the input index.
+    """
+    unique_texts = [text for text in column.dropna().unique() if isinstance(text, str)]
+    if not unique_texts:
+        return column.copy()
+
+    translation_config = config.get("translation", {})
+
+    # Serve codes, English texts and known steel vocabulary without the model
+    translations = apply_glossary(unique_texts)
+    fast_path_rows = column.isin(list(translations)).sum()
+    logger.info(
+        f"Glossary served {len(translations)} of {len(unique_texts)} unique descriptions "
+        f"({fast_path_rows / len(column):.1%} of rows)"
+    )
+
+    cache = None
+    pending_texts = [text for text in unique_texts if text not in translations]
+    if pending_texts and translation_config.get("cache", {}).get("enabled", False):
+        cache = TranslationCache(ModelLoader.get_model_id())
+        translations.update(cache.get_many(pending_texts))
+        pending_texts = [text for text in pending_texts if text not in translations]
+
+    try:
+        if pending_texts:
+            start_time = time.perf_counter()
+            new_translations = translate_pending(pending_texts, translation_config)
+            elapsed = time.perf_counter() - start_time
+            logger.info(
+                f"Translated {len(pending_texts)} unique descriptions ({len(column)} rows) "
+                f"in {elapsed:.2f}s ({len(pending_texts) / max(elapsed, 1e-9):.1f} descriptions/sec)"
+            )
+            translations.update(new_translations)
+            if cache:
+                cache.put_many(new_translations)
+    finally:
+        if cache:
+            cache.close()
+
+    return column.map(translations).fillna(column)
+
+
+def translate_pending(texts, translation_config) -> dict:
+    """
+    Translates texts with the shared translation worker if enabled, otherwise with the
+    in-process model. Falls back to the in-process model if the worker is unreachable.
+
+    Args:
+        texts (list): The unique texts to translate.
+        translation_config (dict): The 'translation' section of the config.
+
+    Returns:
+        dict: Mapping of source text to translated text.
+    """
+    if translation_config.get("worker", {}).get("enabled", False):
+        try:
+            return translate_with_worker(texts)
+        except (
+            ConnectionError,
+            OSError,
+            AuthenticationError,
+            TranslationWorkerError,
+        ) as e:
+            logger.warning(
+                f"Translation worker is not available, translating in-process: {e}"
+            )
+
+    # The model is only loaded once there is something to translate
+    model, tokenizer = ModelLoader.load_translation_model()
+    return translate_batch(
+        texts,
+        tokenizer,
+        model,
+        translation_config.get("batch_size", 32),
+        ModelLoader.get_generate_kwargs(),
+    )
+
+
+def translate_batch(
+    texts, tokenizer, model, batch_size=32, generate_kwargs=None
+) -> dict:
+    """
+    Translates a list of texts in length-bucketed batches.
+
+    The texts are sorted by token length so that each batch holds texts of similar
+    size, which keeps the padding (and hence the wasted decoder work) small.
+
+    Args:
+        texts (list): The unique texts to translate.
+        tokenizer (MarianTokenizer): The tokenizer for the translation model.
+        model (MarianMTModel): The translation model.
+        batch_size (int): The number of texts passed to a single `generate` call.
+        generate_kwargs (dict, optional): Decoding settings of the inference profile.
+
+    Returns:
+        dict: Mapping of source text to translated text. Texts of a failed batch are left out.
+    """
+    token_lengths = [len(ids) for ids in tokenizer(texts)["input_ids"]]
+    ordered_texts = [text for _, text in sorted(zip(token_lengths, texts))]
+
+    translations = {}
+    for start in range(0, len(ordered_texts), batch_size):
+        batch = ordered_texts[start : start + batch_size]
+        try:
+            tokens = tokenizer(batch, return_tensors="pt", padding=True)
+            translated = model.generate(**tokens, **(generate_kwargs or {}))
+            decoded = tokenizer.batch_decode(translated, skip_special_tokens=True)
+            translations.update(zip(batch, decoded))
+        except Exception as e:
+            logger.error(f"Translation error for batch starting with '{batch[0]}': {e}")
+    return translations
+
+
 def translate_text(text, tokenizer, model):
     """
     Translates the given text using the specified tokenizer and model.
@@ -221,5 +356,5 @@ def translate_text(text, tokenizer, model):
         translated_text = tokenizer.batch_decode(translated, skip_special_tokens=True)
         return translated_text[0]
     except Exception as e:
-        logging.error(f"Translation error for text '{text}': {e}")
+        logger.error(f"Translation error for text '{text}': {e}")
         return text  # Return original text if translation fails
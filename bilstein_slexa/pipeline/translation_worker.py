@@ -0,0 +1,204 @@
+"""Long-lived translation worker shared by all pipeline processes.
+
+The worker holds a single translation model and coalesces the texts sent by concurrent
+clients into dynamic batches: a batch is translated once it holds `batch_size` texts or
+once `max_wait_ms` passed since its first request arrived.
+
+Usage:
+    python -m bilstein_slexa.pipeline.translation_worker
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from multiprocessing.connection import Client, Listener
+from dotenv import load_dotenv
+from bilstein_slexa import config
+from bilstein_slexa.model_loader import ModelLoader
+
+# Load environment variables from .env file
+load_dotenv()
+
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+
+def get_worker_address() -> tuple:
+    """Return the (host, port) address of the translation worker from the config."""
+    worker_config = config.get("translation", {}).get("worker", {})
+    return worker_config.get("host", "localhost"), worker_config.get("port", 6070)
+
+
+def get_timeout() -> float:
+    """Return the number of seconds a request may wait for its translations."""
+    return config.get("translation", {}).get("worker", {}).get("timeout_seconds", 120)
+
+
+class TranslationWorkerError(RuntimeError):
+    """Raised on the client when the worker failed to translate a request in time."""
+
+
+def get_authkey() -> bytes:
+    """
+    Return the key shared by the worker and its clients.
+
+    Raises:
+        TranslationWorkerError: If TRANSLATION_WORKER_AUTHKEY is not set. The worker
+            exchanges pickled objects, so it must not accept a well-known key.
+    """
+    authkey = os.getenv("TRANSLATION_WORKER_AUTHKEY")
+    if not authkey:
+        raise TranslationWorkerError("TRANSLATION_WORKER_AUTHKEY is not set")
+    return authkey.encode()
+
+
+class TranslationRequest:
+    def __init__(self, texts):
+        """A list of texts sent by one client, answered once its batch is translated."""
+        self.texts = texts
+        self.result = {}
+        self.error = None
+        self.done = threading.Event()
+
+
+class TranslationWorker:
+    def __init__(self, address=None, batch_size=None, max_wait_ms=None):
+        """
+        Initialize the worker.
+
+        Args:
+            address (tuple, optional): (host, port) to listen on.
+            batch_size (int, optional): Number of texts after which a batch is translated.
+            max_wait_ms (int, optional): Maximum time a request waits for others to join its batch.
+        """
+        translation_config = config.get("translation", {})
+        self.address = address or get_worker_address()
+        self.batch_size = batch_size or translation_config.get("batch_size", 32)
+        self.max_wait = (
+            max_wait_ms or translation_config.get("worker", {}).get("max_wait_ms", 50)
+        ) / 1000
+        self.timeout = get_timeout()
+        self.requests = queue.Queue()
+
+    def serve_forever(self):
+        """Load the model and answer client requests until the process is stopped."""
+        authkey = get_authkey()
+        ModelLoader.load_translation_model()
+        threading.Thread(target=self.batch_loop, name="batcher", daemon=True).start()
+
+        with Listener(self.address, authkey=authkey) as listener:
+            logger.info(f"Translation worker listening on {self.address}")
+            while True:
+                conn = listener.accept()
+                threading.Thread(
+                    target=self.handle_connection, args=(conn,), daemon=True
+                ).start()
+
+    def handle_connection(self, conn):
+        """Queue every list of texts received on a connection and send back the translations."""
+        with conn:
+            while True:
+                try:
+                    texts = conn.recv()
+                except (EOFError, OSError):
+                    return
+                request = TranslationRequest(texts)
+                self.requests.put(request)
+                if not request.done.wait(self.timeout):
+                    request.error = f"No translation within {self.timeout}s"
+                # Errors are sent as exceptions and raised again by the client
+                try:
+                    conn.send(
+                        TranslationWorkerError(request.error)
+                        if request.error
+                        else request.result
+                    )
+                except OSError:
+                    return
+
+    def collect_batch(self) -> list:
+        """Block for a first request, then gather more until the batch is full or the deadline passes."""
+        batch = [self.requests.get()]
+        size = len(batch[0].texts)
+        deadline = time.monotonic() + self.max_wait
+        while size < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self.requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(request)
+            size += len(request.texts)
+        return batch
+
+    def batch_loop(self):
+        """Translate the coalesced batches and answer every request of a batch."""
+        # Imported here to avoid a circular import with the transformation module
+        from bilstein_slexa.pipeline.transformation import translate_batch
+
+        model, tokenizer = ModelLoader.load_translation_model()
+        generate_kwargs = ModelLoader.get_generate_kwargs()
+        while True:
+            batch = self.collect_batch()
+            try:
+                texts = list(
+                    dict.fromkeys(text for request in batch for text in request.texts)
+                )
+                start_time = time.perf_counter()
+                translations = translate_batch(
+                    texts, tokenizer, model, self.batch_size, generate_kwargs
+                )
+                logger.info(
+                    f"Translated {len(texts)} texts from {len(batch)} requests "
+                    f"in {time.perf_counter() - start_time:.2f}s"
+                )
+                for request in batch:
+                    request.result = {
+                        text: translations[text]
+                        for text in request.texts
+                        if text in translations
+                    }
+            except Exception as e:
+                # A failed batch must not stop the loop serving every client
+                logger.error(f"Translation worker failed on a batch: {e}")
+                for request in batch:
+                    request.error = f"Translation worker failed: {e}"
+            finally:
+                for request in batch:
+                    request.done.set()
+
+
+def translate_with_worker(texts) -> dict:
+    """
+    Send texts to the shared translation worker.
+
+    Args:
+        texts (list): The texts to translate.
+
+    Returns:
+        dict: Mapping of source text to translated text.
+
+    Raises:
+        ConnectionError: If the worker is not reachable.
+        AuthenticationError: If the worker uses another key.
+        TranslationWorkerError: If no key is set, or the worker failed or did not
+            answer in time.
+    """
+    authkey = get_authkey()
+    timeout = get_timeout()
+    with Client(get_worker_address(), authkey=authkey) as conn:
+        conn.send(list(texts))
+        if not conn.poll(timeout):
+            raise TranslationWorkerError(f"No answer from the worker within {timeout}s")
+        result = conn.recv()
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    TranslationWorker().serve_forever()
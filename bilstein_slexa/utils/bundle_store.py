@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import pandas as pd
+from bilstein_slexa import bundle_store_path, config
+from bilstein_slexa.utils.helper import (
+    decode_error_log,
+    encode_error_log,
+    json_default,
+)
+
+# Configure logging
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+
+class BundleStore:
+    def __init__(self, version, db_path=bundle_store_path, max_entries=None):
+        """
+        Open (or create) the SQLite store of processed bundles.
+
+        Args:
+            version (str): Version of the reference data and processing code, part of every key.
+            db_path (str): Path to the SQLite file.
+            max_entries (int, optional): Maximum number of stored bundles. The least
+                recently used bundles are evicted beyond this size.
+        """
+        self.version = version
+        self.max_entries = max_entries or config.get("bundle_reuse", {}).get(
+            "max_entries", 200000
+        )
+        self.conn = self.connect(db_path)
+
+    def connect(self, db_path):
+        """Open the SQLite file and create the bundle table if needed."""
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS bundle (
+                version TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                row TEXT NOT NULL,
+                messages TEXT NOT NULL DEFAULT '[]',
+                last_used REAL NOT NULL,
+                PRIMARY KEY (version, fingerprint)
+            )
+            """)
+        columns = [column[1] for column in conn.execute("PRAGMA table_info(bundle)")]
+        if "messages" not in columns:
+            # Stores created before the messages were kept
+            conn.execute(
+                "ALTER TABLE bundle ADD COLUMN messages TEXT NOT NULL DEFAULT '[]'"
+            )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS bundle_last_used ON bundle (last_used)"
+        )
+        conn.commit()
+        return conn
+
+    @staticmethod
+    def fingerprint(df):
+        """
+        Return a fingerprint of every bundle of an aggregated frame.
+
+        Args:
+            df (pd.DataFrame): The aggregated frame, one row per bundle.
+
+        Returns:
+            pd.Series: Hex digest of each row's values (and column names), aligned with df.
+        """
+        row_hashes = pd.util.hash_pandas_object(df, index=False)
+        columns_hash = pd.util.hash_array(
+            pd.Index(df.columns).astype(str).to_numpy()
+        ).sum()
+        return (row_hashes ^ columns_hash).map("{:016x}".format)
+
+    def get_many(self, fingerprints):
+        """
+        Look up the processed rows of several bundles.
+
+        Args:
+            fingerprints (list): Bundle fingerprints.
+
+        Returns:
+            dict: Mapping of fingerprint to the stored 'row' (column -> value) and
+            'messages' for every hit.
+        """
+        keys = list(dict.fromkeys(fingerprints))
+        found = {}
+        # Stay below SQLite's host parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            rows = self.conn.execute(
+                f"SELECT fingerprint, row, messages FROM bundle WHERE version = ? "
+                f"AND fingerprint IN ({', '.join('?' * len(chunk))})",
+                [self.version, *chunk],
+            ).fetchall()
+            found.update(
+                (
+                    fingerprint,
+                    {
+                        "row": json.loads(row),
+                        "messages": decode_error_log(json.loads(messages)),
+                    },
+                )
+                for fingerprint, row, messages in rows
+            )
+
+        if found:
+            self.conn.executemany(
+                "UPDATE bundle SET last_used = ? WHERE version = ? AND fingerprint = ?",
+                [(time.time(), self.version, key) for key in found],
+            )
+            self.conn.commit()
+        return found
+
+    def put_many(self, fingerprints, df, messages=None):
+        """
+        Store the processed rows of several bundles and evict the least recently used
+        bundles if the store grew beyond `max_entries`.
+
+        Args:
+            fingerprints (pd.Series): Fingerprints of the input bundles, aligned with df.
+            df (pd.DataFrame): The processed rows.
+            messages (list, optional): The messages of each bundle, aligned with df.
+        """
+        now = time.time()
+        records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+        messages = messages if messages is not None else [[] for _ in records]
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO bundle (version, fingerprint, row, messages, last_used) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    self.version,
+                    fingerprint,
+                    json.dumps(record, default=json_default),
+                    json.dumps(encode_error_log(bundle_messages), default=json_default),
+                    now,
+                )
+                for fingerprint, record, bundle_messages in zip(
+                    fingerprints, records, messages
+                )
+            ],
+        )
+        (size,) = self.conn.execute("SELECT COUNT(*) FROM bundle").fetchone()
+        if size > self.max_entries:
+            self.conn.execute(
+                "DELETE FROM bundle WHERE rowid IN "
+                "(SELECT rowid FROM bundle ORDER BY last_used LIMIT ?)",
+                (size - self.max_entries,),
+            )
+            logger.info(
+                f"Evicted {size - self.max_entries} bundles from the bundle store."
+            )
+        self.conn.commit()
+
+    def close(self):
+        """Close the store connection."""
+        if self.conn:
+            self.conn.close()
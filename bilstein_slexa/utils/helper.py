@@ -1,63 +1,167 @@
 import os
-import pickle
 import pandas as pd
 import logging
 import json
-from bilstein_slexa import local_data_input_path
+from io import StringIO
+from bilstein_slexa import config, local_data_input_path
 
 logger = logging.getLogger("<Bilstein SLExA ETL>")
 
 
-def save_pickle_file(df: pd.DataFrame, file_name: str, folder="interim") -> None:
-    """Save dataframe to pickle format
+def json_default(value):
+    """Serialize numpy scalars as Python values and anything else as text."""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def encode_error_log(error_log: list) -> list:
+    """Make the error log JSON serializable; DataFrame reports are stored in split orientation."""
+    return [
+        (
+            {"__data_frame__": error.to_json(orient="split", date_format="iso")}
+            if isinstance(error, pd.DataFrame)
+            else error
+        )
+        for error in error_log
+    ]
+
+
+def decode_error_log(error_log: list) -> list:
+    """Restore the DataFrame reports of an error log read from a sidecar."""
+    return [
+        (
+            pd.read_json(StringIO(error["__data_frame__"]), orient="split", dtype=False)
+            if isinstance(error, dict) and "__data_frame__" in error
+            else error
+        )
+        for error in error_log
+    ]
+
+
+def find_parquet_errors(df: pd.DataFrame) -> dict:
+    """Return the columns of a DataFrame that pyarrow cannot convert, with the reason."""
+    import pyarrow as pa
+
+    errors = {}
+    for column in df.columns:
+        try:
+            pa.array(df[column], from_pandas=True)
+        except Exception as e:
+            errors[str(column)] = str(e)
+    return errors
+
+
+def save_frame(df: pd.DataFrame, path: str) -> str:
+    """
+    Save a DataFrame as Parquet, or as pickle if its columns cannot be stored in Parquet.
 
     Args:
-        df (pd.DataFrame): Excel table converted to df
-        file_name (str): the name of expected pickle file
+        df (pd.DataFrame): The DataFrame to save.
+        path (str): Path of the file without extension.
+
+    Returns:
+        str: The format used, 'parquet' or 'pickle'.
     """
     try:
-        with open(
-            os.path.join(local_data_input_path, f"{folder}/{file_name}.pk"), "wb"
-        ) as writer:
-            pickle.dump(df, writer, protocol=pickle.HIGHEST_PROTOCOL)
-        logger.info(f"file {file_name} is dumped in data folder successfully")
+        df.to_parquet(
+            f"{path}.parquet",
+            compression=config["etl_pipeline"].get("interim_compression", "zstd"),
+        )
+        return "parquet"
+    except ImportError as e:
+        logger.warning(f"pyarrow is not installed, saving {path} as pickle: {e}")
     except Exception as e:
-        logging.error(f"Could not save pickel file :{e}")
+        # e.g. an object column mixes numbers and strings
+        reasons = find_parquet_errors(df) or {"": str(e)}
+        logger.warning(
+            f"Could not save {path} as Parquet, saving it as pickle. Columns that "
+            f"Parquet cannot store: "
+            + "; ".join(f"'{column}': {reason}" for column, reason in reasons.items())
+        )
+    df.to_pickle(f"{path}.pk")
+    return "pickle"
+
 
+def save_interim_file(item: dict, file_name: str, folder="interim") -> None:
+    """
+    Save the result of an ETL phase as a columnar data file plus a JSON sidecar.
 
-def load_pickle_file(file_path: str) -> pd.DataFrame:
-    """Load the pickle file inrto dataframe
+    The DataFrame is written to `<file_name>.parquet`; the other keys (file name,
+    status, error log, ...) go to `<file_name>.json`.
 
     Args:
-        file_name (str): pickle filename
+        item (dict): Phase result with a 'data_frame' key, which may be None.
+        file_name (str): Name of the artifact without extension.
+        folder (str): Sub-folder of the input directory.
+
+    Raises:
+        Exception: Any error writing the files is logged and raised again, so that
+            the next phase does not run on a missing DataFrame.
+    """
+    path = os.path.join(local_data_input_path, folder, file_name)
+    try:
+        sidecar = {key: value for key, value in item.items() if key != "data_frame"}
+        sidecar["error_log"] = encode_error_log(item.get("error_log", []))
+        df = item.get("data_frame")
+        sidecar["data_format"] = save_frame(df, path) if df is not None else None
+
+        with open(f"{path}.json", "w", encoding="utf-8") as f:
+            json.dump(sidecar, f, default=json_default)
+        logger.info(f"file {file_name} is saved in {folder} folder successfully")
+    except Exception as e:
+        logger.error(f"Could not save interim file {file_name}: {e}")
+        raise
+
+
+def load_interim_file(file_path: str) -> dict:
+    """
+    Load an artifact written by `save_interim_file`.
+
+    Parquet files are memory-mapped.
+
+    Args:
+        file_path (str): Path to the JSON sidecar.
 
     Returns:
-        pd.DataFrame: Excel dataftame
+        dict: The sidecar keys plus the 'data_frame' (None if none was saved).
     """
     try:
-        with open(file_path, "rb") as f:
-            data = pickle.load(f)
-            if (
-                not isinstance(data, dict)
-                or "data_frame" not in data
-                or "file_name" not in data
-            ):
-                raise ValueError(
-                    "Pickle file must contain a dictionary with 'file_name' and 'data_frame' keys."
-                )
-        logging.info(f"Successfully loaded data from {file_path}")
-        return data
+        with open(file_path, "r", encoding="utf-8") as f:
+            item = json.load(f)
+        if not isinstance(item, dict) or "file_name" not in item:
+            raise ValueError(
+                "Interim sidecar must contain a dictionary with a 'file_name' key."
+            )
+
+        path = file_path[: -len(".json")]
+        data_format = item.pop("data_format", None)
+        if data_format == "parquet":
+            item["data_frame"] = pd.read_parquet(f"{path}.parquet", memory_map=True)
+        elif data_format == "pickle":
+            item["data_frame"] = pd.read_pickle(f"{path}.pk")
+        else:
+            item["data_frame"] = None
+        item["error_log"] = decode_error_log(item.get("error_log", []))
+        logger.info(f"Successfully loaded data from {file_path}")
+        return item
     except FileNotFoundError:
-        logging.error(f"File not found: {file_path}")
-        raise
-    except pickle.PickleError:
-        logging.error("Failed to load pickle file due to an unpickling error.")
+        logger.error(f"File not found: {file_path}")
         raise
     except Exception as e:
-        logging.error(f"An unexpected error occurred: {e}")
+        logger.error(f"An unexpected error occurred: {e}")
         raise
 
 
+def delete_interim_file(file_path: str) -> None:
+    """Delete a JSON sidecar together with its data file."""
+    path = file_path[: -len(".json")]
+    for data_path in (f"{path}.parquet", f"{path}.pk"):
+        if os.path.isfile(data_path):
+            delete_file(data_path)
+    delete_file(file_path)
+
+
 def load_layout_schema(schema_path: str) -> dict | None:
     """Load layout schema
     Args:
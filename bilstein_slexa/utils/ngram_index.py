@@ -0,0 +1,77 @@
+import heapq
+from collections import Counter, defaultdict
+
+
+class NgramIndex:
+    def __init__(self, references, n=3, normalize=None):
+        """
+        Build a character n-gram inverted index over reference strings.
+
+        Args:
+            references (list): The reference strings to search.
+            n (int): Length of the character n-grams.
+            normalize (callable, optional): Function applied to references and queries before indexing.
+        """
+        self.n = n
+        self.normalize = normalize or (lambda text: text)
+        self.references = list(references)
+        self.gram_counts = []
+        self.postings = defaultdict(list)
+        for ref_id, reference in enumerate(self.references):
+            grams = self.ngrams(self.normalize(reference))
+            self.gram_counts.append(len(grams))
+            for gram in grams:
+                self.postings[gram].append(ref_id)
+
+    def ngrams(self, text):
+        """Return the set of character n-grams of a text, padded so that short texts still produce grams."""
+        padded = f" {text} "
+        return {padded[i : i + self.n] for i in range(max(len(padded) - self.n + 1, 1))}
+
+    def search(self, query, top_k=3, min_score=0.0):
+        """
+        Return the references most similar to a query.
+
+        Only references sharing at least one n-gram with the query are scored, using the
+        Dice coefficient of the two n-gram sets.
+
+        Args:
+            query (str): The string to look up.
+            top_k (int): Maximum number of suggestions.
+            min_score (float): Minimum similarity between 0 and 1.
+
+        Returns:
+            List[Tuple[str, float]]: (reference, score) pairs, best first.
+        """
+        grams = self.ngrams(self.normalize(query))
+        overlaps = Counter()
+        for gram in grams:
+            overlaps.update(self.postings.get(gram, ()))
+
+        scored = (
+            (2 * overlap / (len(grams) + self.gram_counts[ref_id]), ref_id)
+            for ref_id, overlap in overlaps.items()
+        )
+        best = heapq.nlargest(top_k, scored)
+        return [
+            (self.references[ref_id], round(score, 2))
+            for score, ref_id in best
+            if score >= min_score
+        ]
+
+    def search_many(self, queries, top_k=3, min_score=0.0):
+        """
+        Return suggestions for several queries at once.
+
+        Args:
+            queries (list): The strings to look up; duplicates are searched once.
+            top_k (int): Maximum number of suggestions per query.
+            min_score (float): Minimum similarity between 0 and 1.
+
+        Returns:
+            dict: Mapping of query to its list of (reference, score) pairs.
+        """
+        return {
+            query: self.search(query, top_k, min_score)
+            for query in dict.fromkeys(queries)
+        }
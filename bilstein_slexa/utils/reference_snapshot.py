@@ -0,0 +1,107 @@
+import os
+import json
+import time
+import logging
+from bilstein_slexa import config, grade_snapshot_path
+
+# Configure logging
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+
+class GradeSnapshot:
+    grades_query = "SELECT name FROM grade WHERE active = TRUE"
+    version_query = (
+        "SELECT COUNT(*), md5(string_agg(name, '|' ORDER BY name)) "
+        "FROM grade WHERE active = TRUE"
+    )
+
+    def __init__(self, snapshot_path=grade_snapshot_path, ttl_seconds=None):
+        """
+        Initialize the local snapshot of the active grade table.
+
+        Args:
+            snapshot_path (str): Path to the JSON snapshot file.
+            ttl_seconds (int, optional): Age after which the snapshot is checked against the database.
+        """
+        self.snapshot_path = snapshot_path
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else config.get("reference_data", {}).get(
+                "grade_snapshot_ttl_seconds", 3600
+            )
+        )
+
+    def load(self):
+        """Load the snapshot from disk, or return None if it does not exist or is unreadable."""
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Could not read grade snapshot {self.snapshot_path}: {e}")
+            return None
+
+    def save(self, grades, version):
+        """Write the snapshot atomically so that concurrent readers never see a partial file."""
+        os.makedirs(os.path.dirname(self.snapshot_path), exist_ok=True)
+        snapshot = {"version": version, "checked_at": time.time(), "grades": grades}
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.snapshot_path)
+        return snapshot
+
+    def fetch_version(self, db):
+        """Return a version stamp of the active grades (row count and checksum of the names)."""
+        count, checksum = db.query(self.version_query)[0]
+        return f"{count}:{checksum}"
+
+    def fetch_grades(self, db):
+        """Fetch grade names from the database and return as a list."""
+        return [row[0].strip() for row in db.query(self.grades_query)]
+
+    def get_grades(self, db=None):
+        """
+        Return the active grades, from the snapshot while it is fresh.
+
+        Once the TTL expired the database version is checked and the grades are only
+        re-fetched if it changed. If the database is unavailable a stale snapshot is used.
+
+        Args:
+            db (Database, optional): Open connection; a new one is opened only if needed.
+
+        Returns:
+            list: The active grade names.
+        """
+        snapshot = self.load()
+        if snapshot and time.time() - snapshot["checked_at"] < self.ttl_seconds:
+            logger.info(f"Using grade snapshot version {snapshot['version']}.")
+            return snapshot["grades"]
+
+        own_connection = db is None
+        try:
+            if own_connection:
+                # Imported here so that a fresh snapshot is served without the database driver
+                from bilstein_slexa.utils.database import Database
+
+                db = Database()
+            version = self.fetch_version(db)
+            if snapshot and snapshot["version"] == version:
+                logger.info(f"Grade table unchanged (version {version}).")
+                grades = snapshot["grades"]
+            else:
+                grades = self.fetch_grades(db)
+                logger.info(f"Grade snapshot refreshed to version {version}.")
+            return self.save(grades, version)["grades"]
+        except Exception as e:
+            if snapshot is None:
+                raise
+            logger.warning(
+                f"Could not refresh grade snapshot, using version {snapshot['version']}: {e}"
+            )
+            return snapshot["grades"]
+        finally:
+            if own_connection and db is not None:
+                db.close()
@@ -0,0 +1,147 @@
+import os
+import glob
+import json
+import hashlib
+import logging
+from bilstein_slexa import (
+    config,
+    finish_repo_path,
+    glossary_path,
+    grade_snapshot_path,
+    result_cache_path,
+    source_schema_path,
+)
+from bilstein_slexa.model_loader import ModelLoader
+from bilstein_slexa.utils.reference_snapshot import GradeSnapshot
+from bilstein_slexa.utils.helper import (
+    delete_interim_file,
+    load_interim_file,
+    save_interim_file,
+)
+
+# Configure logging
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+
+class ResultCache:
+    def __init__(self, cache_dir=result_cache_path, max_size_mb=None):
+        """
+        Open the content-addressed cache of processed workbooks.
+
+        Args:
+            cache_dir (str): Directory of the cached results.
+            max_size_mb (int, optional): Maximum size of the cache on disk. The least
+                recently used results are evicted beyond this size.
+        """
+        self.cache_dir = cache_dir
+        self.max_size_mb = max_size_mb or config.get("result_cache", {}).get(
+            "max_size_mb", 500
+        )
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def reference_version():
+        """
+        Return a hash of everything besides the workbook that determines a result:
+        the schemas, the finish repository, the glossary, the grade snapshot version,
+        the translation model and the configuration.
+
+        The grade snapshot is refreshed first (once its TTL expired), as a cache hit
+        skips the grade check that would otherwise refresh it.
+        """
+        digest = hashlib.sha256()
+        schema_paths = sorted(
+            glob.glob(os.path.join(os.path.dirname(source_schema_path), "*.json"))
+        )
+        for path in [*schema_paths, finish_repo_path, glossary_path]:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+
+        try:
+            GradeSnapshot(grade_snapshot_path).get_grades()
+        except Exception as e:
+            logger.warning(f"Could not refresh the grade snapshot: {e}")
+        try:
+            with open(grade_snapshot_path, "r", encoding="utf-8") as f:
+                digest.update(str(json.load(f)["version"]).encode())
+        except (OSError, ValueError, KeyError):
+            digest.update(b"no-grade-snapshot")
+
+        digest.update(ModelLoader.get_model_id().encode())
+        digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def make_key(self, file_path):
+        """
+        Return the cache key of a workbook: the hash of its bytes and of the reference data.
+
+        Args:
+            file_path (str or file-like): Local path to the Excel file, or an uploaded file buffer.
+        """
+        if isinstance(file_path, str):
+            with open(file_path, "rb") as f:
+                content = f.read()
+        else:
+            content = file_path.getvalue()
+        content_hash = hashlib.sha256(content).hexdigest()
+        return hashlib.sha256(
+            f"{content_hash}:{self.reference_version()}".encode()
+        ).hexdigest()
+
+    def get(self, key):
+        """
+        Return the cached result of a key, or None on a miss.
+
+        Returns:
+            dict: The cached 'data_frame', 'status', 'error_log' and 'url'.
+        """
+        sidecar_path = os.path.join(self.cache_dir, f"{key}.json")
+        if not os.path.isfile(sidecar_path):
+            return None
+        try:
+            item = load_interim_file(sidecar_path)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cached result {key}: {e}")
+            delete_interim_file(sidecar_path)
+            return None
+        # Mark the entry as recently used
+        os.utime(sidecar_path)
+        return item
+
+    def put(self, key, item):
+        """
+        Store the result of a workbook and evict old results beyond the size limit.
+
+        Args:
+            key (str): The key returned by `make_key`.
+            item (dict): The 'file_name', 'data_frame', 'status', 'error_log' and 'url'.
+        """
+        # An absolute folder makes save_interim_file write into the cache directory
+        try:
+            save_interim_file(item, key, folder=self.cache_dir)
+        except Exception as e:
+            logger.warning(f"Could not cache the result {key}: {e}")
+            return
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used results until the cache fits its size limit."""
+        entries = []
+        total_size = 0
+        for sidecar_path in glob.glob(os.path.join(self.cache_dir, "*.json")):
+            path = sidecar_path[: -len(".json")]
+            size = sum(
+                os.path.getsize(p)
+                for p in (sidecar_path, f"{path}.parquet", f"{path}.pk")
+                if os.path.isfile(p)
+            )
+            entries.append((os.path.getmtime(sidecar_path), size, sidecar_path))
+            total_size += size
+
+        max_size = self.max_size_mb * 1e6
+        for _, size, sidecar_path in sorted(entries):
+            if total_size <= max_size:
+                break
+            delete_interim_file(sidecar_path)
+            total_size -= size
+            logger.info(f"Evicted cached result {os.path.basename(sidecar_path)}")
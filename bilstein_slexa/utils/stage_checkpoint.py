@@ -0,0 +1,195 @@
+import os
+import glob
+import json
+import time
+import pickle
+import hashlib
+import inspect
+import logging
+import weakref
+import pandas as pd
+from bilstein_slexa import checkpoint_path, config, global_vars
+from bilstein_slexa.utils.helper import (
+    delete_interim_file,
+    load_interim_file,
+    save_interim_file,
+)
+
+# Configure logging
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+
+class StageCheckpoints:
+    # Checkpoint key of every DataFrame returned by a stage, by id of the live frame
+    _output_keys = {}
+
+    def __init__(
+        self, checkpoint_dir=checkpoint_path, enabled=None, max_age_hours=None
+    ):
+        """
+        Open the store of stage outputs used to resume a file after a failed run.
+
+        Args:
+            checkpoint_dir (str): Directory of the checkpoints.
+            enabled (bool, optional): Whether stages are checkpointed; defaults to the config.
+            max_age_hours (float, optional): Age after which checkpoints are deleted.
+        """
+        checkpoint_config = config.get("stage_checkpoints", {})
+        self.checkpoint_dir = checkpoint_dir
+        self.enabled = (
+            enabled if enabled is not None else checkpoint_config.get("enabled", False)
+        )
+        self.max_age_hours = max_age_hours or checkpoint_config.get("max_age_hours", 24)
+        if self.enabled:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            self.purge()
+
+    @staticmethod
+    def canonical_column(column):
+        """
+        Return a dtype-independent form of a column: numbers as float64, anything else
+        as text. A frame restored from Parquet (e.g. object columns read back as string
+        or float64) then hashes like the frame that was saved.
+        """
+        try:
+            return pd.to_numeric(column, errors="raise").astype("float64")
+        except (ValueError, TypeError):
+            return column.astype(object).map(
+                lambda value: None if pd.isna(value) is True else str(value)
+            )
+
+    @classmethod
+    def hash_input(cls, value):
+        """Return a hash of a stage input: DataFrame values, file bytes or a JSON value."""
+        if isinstance(value, pd.DataFrame):
+            canonical = pd.DataFrame(
+                {
+                    position: cls.canonical_column(value.iloc[:, position])
+                    for position in range(value.shape[1])
+                },
+                index=value.index,
+            )
+            try:
+                content = pd.util.hash_pandas_object(
+                    canonical, index=True
+                ).values.tobytes()
+            except TypeError:
+                # e.g. cells holding lists
+                content = pickle.dumps(canonical)
+            header = json.dumps(list(map(str, value.columns)))
+            return hashlib.sha256(header.encode() + content).hexdigest()
+        if isinstance(value, str) and os.path.isfile(value):
+            with open(value, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        if hasattr(value, "getvalue"):
+            return hashlib.sha256(value.getvalue()).hexdigest()
+        return hashlib.sha256(json.dumps(value, default=str).encode()).hexdigest()
+
+    @classmethod
+    def input_key(cls, value):
+        """
+        Return the key of a stage input. Frames returned by an earlier stage are keyed
+        by that stage's checkpoint key, so that a chain of stages resumes whether the
+        frame was computed or restored; other inputs are hashed.
+        """
+        entry = cls._output_keys.get(id(value))
+        if entry is not None and entry[0]() is value:
+            return f"stage:{entry[1]}"
+        return cls.hash_input(value)
+
+    @classmethod
+    def register_output(cls, output, key):
+        """Remember the checkpoint key of the DataFrame returned by a stage."""
+        df = output.get("data_frame")
+        if not isinstance(df, pd.DataFrame):
+            return
+        frame_id = id(df)
+        cls._output_keys[frame_id] = (
+            weakref.ref(df, lambda _: cls._output_keys.pop(frame_id, None)),
+            key,
+        )
+
+    @staticmethod
+    def stage_version(stage, code):
+        """Return a hash of the source of the modules running a stage and of the config."""
+        digest = hashlib.sha256()
+        for obj in (stage, *code):
+            digest.update(inspect.getsource(inspect.getmodule(obj)).encode())
+        digest.update(json.dumps(config, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def run(self, stage_name, stage, *inputs, code=(), **params):
+        """
+        Run a stage, or return its checkpointed output for the same input and version.
+
+        The key of a stage combines its name, its version and the keys of its inputs;
+        a DataFrame returned by an earlier stage contributes that stage's key.
+
+        The errors the stage adds to the error list, and the messages it records per
+        bundle, are stored with its output and added again when the stage is resumed. Outputs holding None (a failed load or
+        upload) are not checkpointed, so that the stage runs again next time.
+
+        Args:
+            stage_name (str): Name of the stage, part of the checkpoint name.
+            stage (callable): Function returning a dict with an optional 'data_frame'
+                and JSON serializable values.
+            *inputs: Inputs of the stage; they make up the checkpoint key.
+            code (tuple): Functions whose modules implement the stage.
+            **params: Arguments that do not change the output, e.g. names used in logs.
+
+        Returns:
+            dict: The output of the stage.
+        """
+        if not self.enabled:
+            return stage(*inputs, **params)
+
+        key = hashlib.sha256(
+            ":".join(
+                [stage_name, self.stage_version(stage, code)]
+                + [self.input_key(value) for value in inputs]
+            ).encode()
+        ).hexdigest()
+        sidecar_path = os.path.join(self.checkpoint_dir, f"{stage_name}-{key}.json")
+
+        if os.path.isfile(sidecar_path):
+            try:
+                output = load_interim_file(sidecar_path)
+                global_vars["error_list"].extend(output.pop("error_log"))
+                global_vars["bundle_messages"].extend(output.pop("bundle_messages", []))
+                output.pop("file_name")
+                logger.info(f"Stage '{stage_name}' resumed from checkpoint {key[:12]}")
+                self.register_output(output, key)
+                return output
+            except Exception as e:
+                logger.warning(
+                    f"Could not resume stage '{stage_name}', running it: {e}"
+                )
+
+        errors_before = len(global_vars["error_list"])
+        messages_before = len(global_vars["bundle_messages"])
+        output = stage(*inputs, **params)
+        if all(value is not None for value in output.values()):
+            try:
+                save_interim_file(
+                    {
+                        "file_name": stage_name,
+                        **output,
+                        "error_log": global_vars["error_list"][errors_before:],
+                        "bundle_messages": global_vars["bundle_messages"][
+                            messages_before:
+                        ],
+                    },
+                    f"{stage_name}-{key}",
+                    folder=self.checkpoint_dir,
+                )
+            except Exception as e:
+                logger.warning(f"Could not checkpoint stage '{stage_name}': {e}")
+        self.register_output(output, key)
+        return output
+
+    def purge(self):
+        """Delete the checkpoints older than `max_age_hours`."""
+        max_age = self.max_age_hours * 3600
+        for sidecar_path in glob.glob(os.path.join(self.checkpoint_dir, "*.json")):
+            if time.time() - os.path.getmtime(sidecar_path) > max_age:
+                delete_interim_file(sidecar_path)
@@ -1,48 +1,189 @@
 import logging
+from typing import Optional
+import numpy as np
 import pandas as pd
 from bilstein_slexa import config
 
 logger = logging.getLogger("<Bilstein SLExA ETL>")
 
 
-def find_potential_headers(df: pd.DataFrame) -> int:
+def string_mask(column: pd.Series) -> np.ndarray:
     """
-    Find potential header rows and select the best candidate based on string and non-null value distribution.
+    Return a boolean mask of the cells of a column that hold strings, without a per-cell loop.
 
     Args:
-        df (pd.DataFrame): Input DataFrame.
-        config (dict): Configuration dictionary for BERT processing.
+        column (pd.Series): A column of a sheet.
 
     Returns:
-        int: Index of the identified header row.
+        np.ndarray: True where the cell is a string.
     """
+    if column.dtype != object:
+        return column.notna().to_numpy() & pd.api.types.is_string_dtype(column.dtype)
+    try:
+        # .str.len() is NaN for every non-string cell
+        return column.str.len().notna().to_numpy()
+    except AttributeError:
+        # Object column without any string cell
+        return np.zeros(len(column), dtype=bool)
 
-    potential_header_indices = []
-    heuristic_header_idx = 0
 
-    for idx, row in df.iterrows():
-        non_null_count = row.notnull().sum()
-        string_count = row.apply(lambda x: isinstance(x, str)).sum()
+def density_masks(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the non-null and string masks of a sheet in one pass over its columns.
+
+    Args:
+        df (pd.DataFrame): Sheet read without a header.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Boolean (rows x columns) non-null and string masks.
+    """
+    not_null = df.notna().to_numpy()
+    if df.shape[1] == 0:
+        return not_null, not_null.copy()
+    is_string = np.column_stack(
+        [string_mask(df.iloc[:, idx]) for idx in range(df.shape[1])]
+    )
+    return not_null, is_string
+
+
+def select_header_row(not_null: np.ndarray, is_string: np.ndarray) -> Optional[int]:
+    """
+    Select the header row from the masks of the rows scanned for a table.
+
+    A row is a candidate if more than `row_density_threshold` of its cells are
+    non-null and more than `row_string_density_threshold` are strings; the candidate
+    with the most non-null cells wins, the first one on ties.
+
+    Args:
+        not_null (np.ndarray): Non-null mask of the scanned rows and used columns.
+        is_string (np.ndarray): String mask of the same cells.
+
+    Returns:
+        int: Position of the header among the scanned rows, None if there is no candidate.
+    """
+    width = not_null.shape[1]
+    non_null_count = not_null.sum(axis=1)
+    string_count = is_string.sum(axis=1)
+    candidates = (non_null_count > width * config["row_density_threshold"]) & (
+        string_count > width * config["row_string_density_threshold"]
+    )
+    if not candidates.any():
+        return None
+    return int(np.argmax(np.where(candidates, non_null_count, -1)))
+
+
+def split_blocks(not_null: np.ndarray, min_empty_rows: int = None) -> list:
+    """
+    Split a sheet into blocks of rows separated by runs of empty rows.
+
+    Args:
+        not_null (np.ndarray): Non-null mask of the sheet.
+        min_empty_rows (int, optional): Empty rows that end a block; defaults to
+            `table_split_empty_rows`.
+
+    Returns:
+        list: (first_row, last_row) positions of each block, last row excluded.
+    """
+    min_empty_rows = min_empty_rows or config.get("table_split_empty_rows", 1)
+    used_rows = np.flatnonzero(not_null.any(axis=1))
+    if len(used_rows) == 0:
+        return []
+
+    # A gap of more than min_empty_rows between two used rows starts a new block
+    breaks = np.flatnonzero(np.diff(used_rows) > min_empty_rows)
+    starts = np.concatenate([[used_rows[0]], used_rows[breaks + 1]])
+    ends = np.concatenate([used_rows[breaks] + 1, [used_rows[-1] + 1]])
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def header_values(df: pd.DataFrame, row: int, columns) -> list:
+    """Return the non-empty cells of a header row as stripped strings."""
+    return [
+        str(value).strip()
+        for value in df.iloc[row, columns]
+        if pd.notna(value) and str(value).strip()
+    ]
 
-        # Identify rows where 70% are non-null and 50% are strings
-        if (
-            non_null_count > len(row) * config["row_density_threshold"]
-            and string_count > len(row) * config["row_string_density_threshold"]
-        ):
-            potential_header_indices.append(idx)
 
-    if potential_header_indices:
-        heuristic_header_idx = max(
-            potential_header_indices, key=lambda idx: df.iloc[idx].notnull().sum()
+def find_tables(df: pd.DataFrame, scan_rows: int = None) -> list:
+    """
+    Find every candidate table of a sheet with its header row.
+
+    The masks are computed once for the sheet; each block of rows between empty-row
+    runs is trimmed to its used columns and its first `scan_rows` rows are searched
+    for a header. Blocks of a single column before the first table (titles, notes)
+    are skipped. The first table falls back to its first row. A later block only
+    starts a new table if its header repeats the header of the first table; any
+    other block continues the previous table, since data rows holding mostly text
+    (e.g. grades and descriptions after a blank row) also pass the density test.
+
+    Args:
+        df (pd.DataFrame): Sheet read without a header.
+        scan_rows (int, optional): Rows searched for a header; defaults to `header_scan_rows`.
+
+    Returns:
+        list: One dict per block with the 'header_row' position in the sheet, the
+        'first_row' and 'last_row' (excluded) of the block and the used 'columns' positions.
+    """
+    scan_rows = scan_rows or config.get("header_scan_rows", 20)
+    not_null, is_string = density_masks(df)
+
+    tables = []
+    first_header = None
+    for first_row, last_row in split_blocks(not_null):
+        columns = np.flatnonzero(not_null[first_row:last_row].any(axis=0))
+        if not tables and len(columns) < 2:
+            # Title or note lines above the first table
+            continue
+        scan_end = min(last_row, first_row + scan_rows)
+        header_offset = select_header_row(
+            not_null[first_row:scan_end, columns],
+            is_string[first_row:scan_end, columns],
+        )
+        if tables and (
+            header_offset is None
+            or header_values(df, first_row + header_offset, columns) != first_header
+        ):
+            previous = tables[-1]
+            previous["last_row"] = last_row
+            previous["columns"] = sorted(
+                set(previous["columns"]) | set(columns.tolist())
+            )
+            continue
+        if not tables:
+            first_header = header_values(df, first_row + (header_offset or 0), columns)
+        tables.append(
+            {
+                "header_row": first_row + (header_offset or 0),
+                "first_row": first_row,
+                "last_row": last_row,
+                "columns": columns.tolist(),
+            }
         )
-        logger.info(f"The index of the header in Dataframe is: {heuristic_header_idx}")
+    return tables
+
+
+def find_potential_headers(df: pd.DataFrame) -> int:
+    """
+    Find potential header rows and select the best candidate based on string and non-null value distribution.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame.
 
+    Returns:
+        int: Position of the identified header row.
+    """
+    not_null, is_string = density_masks(df)
+    heuristic_header_idx = select_header_row(not_null, is_string)
+    if heuristic_header_idx is None:
+        return 0
+    logger.info(f"The index of the header in Dataframe is: {heuristic_header_idx}")
     return heuristic_header_idx
 
 
 def create_dataframe_from_table(
     table: pd.DataFrame, header_row_idx: int
-) -> pd.DataFrame:
+) -> Optional[pd.DataFrame]:
     """
     Create a DataFrame by extracting headers and table boundaries.
 
@@ -74,26 +215,41 @@ def create_dataframe_from_table(
         return None
 
 
+def extract_tables(df: pd.DataFrame) -> list:
+    """
+    Extract the candidate tables of a sheet.
+
+    Args:
+        df (pd.DataFrame): Sheet read without a header.
+
+    Returns:
+        list: (header_row, DataFrame) pairs, with the header position in the sheet.
+    """
+    extracted_tables = []
+    for table in find_tables(df):
+        block = df.iloc[table["first_row"] : table["last_row"], table["columns"]]
+        table_df = create_dataframe_from_table(
+            block, table["header_row"] - table["first_row"]
+        )
+        if table_df is not None:
+            extracted_tables.append((table["header_row"], table_df))
+    return extracted_tables
+
+
 def identify_tables(df: pd.DataFrame) -> list:
     """
     Identify and extract tables from an Excel sheet, splitting by empty rows.
 
     Args:
-        df (pd.DataFrame): DataFrame representing an Excel sheet.
-        config (dict): Configuration dictionary for BERT header identification.
+        df (pd.DataFrame): DataFrame representing an Excel sheet read without a header.
 
     Returns:
         list: List of DataFrames representing extracted tables.
     """
-    extracted_tables = []
-
     if df.empty:
         logger.error("Input DataFrame is empty. No tables to extract.")
-        return extracted_tables
-
-    # Clean the current table and attempt to extract headers
-    cleaned_table = df.dropna(how="all", axis=0).dropna(how="all", axis=1)
-    header_idx = find_potential_headers(cleaned_table)
-    table_df = create_dataframe_from_table(cleaned_table, header_idx)
+        return []
 
-    return table_df
+    extracted_tables = [table_df for _, table_df in extract_tables(df)]
+    logger.info(f"{len(extracted_tables)} table(s) found in the sheet")
+    return extracted_tables
@@ -0,0 +1,124 @@
+import os
+import re
+import sqlite3
+import time
+import logging
+from bilstein_slexa import config, translation_cache_path
+
+# Configure logging
+logger = logging.getLogger("<Bilstein SLExA ETL>")
+
+
+class TranslationCache:
+    def __init__(self, model_id, db_path=translation_cache_path, max_entries=None):
+        """
+        Open (or create) the SQLite translation cache.
+
+        Args:
+            model_id (str): Identifier of the translation model, part of every cache key.
+            db_path (str): Path to the SQLite file.
+            max_entries (int, optional): Maximum number of cached translations. The least
+                recently used entries are evicted beyond this size.
+        """
+        self.model_id = model_id
+        self.max_entries = max_entries or config.get("translation", {}).get(
+            "cache", {}
+        ).get("max_entries", 100000)
+        self.hits = 0
+        self.misses = 0
+        self.conn = self.connect(db_path)
+
+    def connect(self, db_path):
+        """Open the SQLite file and create the cache table if needed."""
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS translation (
+                model_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                target TEXT NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model_id, source)
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS translation_last_used ON translation (last_used)"
+        )
+        conn.commit()
+        return conn
+
+    @staticmethod
+    def normalize_text(text):
+        """Normalize the source text by trimming and collapsing whitespace."""
+        return re.sub(r"\s+", " ", text).strip()
+
+    def get_many(self, texts):
+        """
+        Look up the translations of several texts.
+
+        Args:
+            texts (list): Source texts.
+
+        Returns:
+            dict: Mapping of source text to cached translation for every hit.
+        """
+        keys = {self.normalize_text(text): text for text in texts}
+        found = {}
+        key_list = list(keys)
+        # Stay below SQLite's host parameter limit
+        for start in range(0, len(key_list), 500):
+            chunk = key_list[start : start + 500]
+            rows = self.conn.execute(
+                f"SELECT source, target FROM translation WHERE model_id = ? "
+                f"AND source IN ({', '.join('?' * len(chunk))})",
+                [self.model_id, *chunk],
+            ).fetchall()
+            found.update(rows)
+
+        if found:
+            self.conn.executemany(
+                "UPDATE translation SET last_used = ? WHERE model_id = ? AND source = ?",
+                [(time.time(), self.model_id, key) for key in found],
+            )
+            self.conn.commit()
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return {keys[key]: target for key, target in found.items()}
+
+    def put_many(self, translations):
+        """
+        Store several translations and evict the least recently used entries if the
+        cache grew beyond `max_entries`.
+
+        Args:
+            translations (dict): Mapping of source text to translated text.
+        """
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO translation (model_id, source, target, last_used) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (self.model_id, self.normalize_text(source), target, now)
+                for source, target in translations.items()
+            ],
+        )
+        (size,) = self.conn.execute("SELECT COUNT(*) FROM translation").fetchone()
+        if size > self.max_entries:
+            self.conn.execute(
+                "DELETE FROM translation WHERE rowid IN "
+                "(SELECT rowid FROM translation ORDER BY last_used LIMIT ?)",
+                (size - self.max_entries,),
+            )
+            logger.info(
+                f"Evicted {size - self.max_entries} entries from the translation cache."
+            )
+        self.conn.commit()
+
+    def close(self):
+        """Close the cache connection."""
+        if self.conn:
+            self.conn.close()
+            logger.info(
+                f"Translation cache closed (hits: {self.hits}, misses: {self.misses})."
+            )
@@ -18,7 +18,11 @@ setup(
     name="bilstein_slexa",
     long_description=open(BASE_DIR / "README.md").read(),
     install_requires=read_lines(BASE_DIR / "requirements.txt"),
-    extras_require={"dev": read_lines(BASE_DIR / "requirements_dev.txt")},
+    extras_require={
+        "dev": read_lines(BASE_DIR / "requirements_dev.txt"),
+        # Faster Excel reader, tried before openpyxl when installed
+        "calamine": ["python-calamine"],
+    },
     packages=find_packages(exclude=["docs"]),
     version="0.1.0",
     description="A short description of the project.",
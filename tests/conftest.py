@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from bilstein_slexa import global_vars
+
+
+def make_stock_list(rows: int = 60, seed: int = 0) -> pd.DataFrame:
+    """Generate a Bilstein stock list with three rows per bundle and a few extra SAP columns."""
+    rng = np.random.default_rng(seed)
+    bundles = np.repeat(np.arange(30000000, 30000000 + rows // 3), 3)[:rows]
+    per_bundle = {
+        "Lagerort": rng.choice(["100", "139"], rows // 3),
+        "Güte-Text": rng.choice(["DC 01", "S235JR", "XYZ9"], rows // 3),
+        "HF-Dicke": rng.choice([1.0, 1.5], rows // 3),
+        "HF-Breite": rng.choice([105.0, 700.0], rows // 3),
+        "Mindestpreis €/mt": rng.choice([375.0, 400.0], rows // 3),
+        "Beschreibung": rng.choice(["Alllast VK", "Rest"], rows // 3),
+        "Walzzustand (Fertigung)": rng.choice(["10", "7"], rows // 3),
+    }
+    df = pd.DataFrame(
+        {
+            "Werk": "100",
+            "Material": "50000029",
+            "Güte (Fertigung)": "02",
+            "Charge": [f"{x:010d}" for x in rng.integers(0, 10**6, rows)],
+            "Erstellt am": "2024-09-04",
+            "Frei verwendbar": rng.integers(10, 900, rows).astype(float),
+            "Basismengeneinheit": "KG",
+            "Materialkurztext": "x",
+            "Q-Meldungsnummer": bundles.astype(str),
+            "Kurztext zum Code": "Spaltband kaltgewalzt",
+            "Wiederverwertung Ausfall": "2A",
+            **{
+                column: np.repeat(values, 3)[:rows]
+                for column, values in per_bundle.items()
+            },
+        }
+    )
+    for i in range(3):
+        df[f"SAP_{i}"] = rng.random(rows)
+    return df
+
+
+@pytest.fixture
+def stock_list(tmp_path):
+    """Path to a generated stock list workbook."""
+    path = str(tmp_path / "bestand.xlsx")
+    make_stock_list().to_excel(path, index=False)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def error_list():
+    """Start every test with an empty error list."""
+    global_vars["error_list"] = []
+    global_vars["bundle_messages"] = []
+    yield global_vars["error_list"]
+    global_vars["error_list"] = []
+    global_vars["bundle_messages"] = []
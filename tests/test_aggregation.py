@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+from bilstein_slexa import source_schema_path
+from bilstein_slexa.pipeline.aggregation import BundleAggregator, aggregate_data
+from bilstein_slexa.pipeline.schema_validation import get_required_columns
+from bilstein_slexa.pipeline.streaming import get_header_translations, prepare_rows
+from bilstein_slexa.utils.helper import load_layout_schema
+from conftest import make_stock_list
+
+
+def join_if_conflicting(x, separator=",", as_string=False):
+    values = map(str, x.unique()) if as_string else x.unique()
+    return separator.join(values) if x.nunique() > 1 else x.iloc[0]
+
+
+def baseline_aggregate(df):
+    """The row-wise groupby aggregation that aggregate_data replaced."""
+    aggregated_df = (
+        df.groupby("bundle_id")
+        .agg(
+            weight=("weight", "sum"),
+            quantity=("weight", "count"),
+            grade=("grade", join_if_conflicting),
+            finish=("finish", join_if_conflicting),
+            min_price=("min_price", lambda x: join_if_conflicting(x, as_string=True)),
+            location=("location", join_if_conflicting),
+            thickness=(
+                "thickness(mm)",
+                lambda x: join_if_conflicting(x, as_string=True),
+            ),
+            width=("width(mm)", lambda x: join_if_conflicting(x, ", ", as_string=True)),
+            beschreibung=(
+                "beschreibung",
+                lambda x: (
+                    ", ".join(x.unique())
+                    if x.replace(" ", "").nunique() > 1
+                    else x.iloc[0]
+                ),
+            ),
+            description=(
+                "description",
+                lambda x: "| ".join(pd.Series(x.unique()).dropna()),
+            ),
+            batch_number=(
+                "batch_number",
+                lambda x: "\n".join(x.dropna().astype(str).unique()),
+            ),
+        )
+        .reset_index()
+    )
+    identical = all(
+        aggregated_df[col]
+        .apply(lambda x: len(set(x.split(","))) == 1 if isinstance(x, str) else True)
+        .all()
+        for col in ["grade", "min_price", "location", "finish", "thickness", "width"]
+    )
+    return identical, aggregated_df
+
+
+def cleaned_rows(raw):
+    schema = load_layout_schema(source_schema_path)
+    raw = raw.rename(columns={col["name"]: col["name"] for col in schema["columns"]})
+    raw = raw[[col["name"] for col in schema["columns"] if col["mandatory"]]].copy()
+    return prepare_rows(
+        raw, schema, get_required_columns(schema), get_header_translations(schema)
+    )
+
+
+@pytest.mark.parametrize("conflicting", [False, True])
+def test_matches_the_row_wise_aggregation(conflicting):
+    raw = make_stock_list(rows=300, seed=1)
+    if conflicting:
+        # Rows of a bundle with different grades, widths and prices
+        rng = np.random.default_rng(2)
+        raw["Güte-Text"] = rng.choice(["DC 01", "S235JR"], len(raw))
+        raw["HF-Breite"] = rng.choice([105.0, 700.0], len(raw))
+        raw["Mindestpreis €/mt"] = rng.choice([375.0, 400.0], len(raw))
+    df = cleaned_rows(raw)
+
+    expected_flag, expected = baseline_aggregate(df.copy())
+    flag, actual = aggregate_data(df.copy())
+
+    assert flag == expected_flag == (not conflicting)
+    pd.testing.assert_frame_equal(
+        actual.astype(object), expected.astype(object), check_dtype=False
+    )
+
+
+def test_chunked_aggregation_matches_a_single_pass():
+    df = cleaned_rows(make_stock_list(rows=300, seed=3))
+
+    aggregator = BundleAggregator()
+    for start in range(0, len(df), 70):
+        aggregator.update(df.iloc[start : start + 70])
+
+    chunked_flag, chunked = aggregator.result()
+    flag, single = aggregate_data(df.copy())
+
+    assert chunked_flag == flag
+    pd.testing.assert_frame_equal(chunked, single)
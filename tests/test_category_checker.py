@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from bilstein_slexa.pipeline.category_checker import (
+    add_category,
+    apply_logic,
+    validation_df,
+)
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    forms = np.concatenate([validation_df["Forms"].dropna().unique(), ["Unknown"]])
+    materials = [col for col in validation_df.columns if col != "Forms"] + ["Unknown"]
+    finishes = np.concatenate(
+        [validation_df["Finish Long"].dropna().unique(), ["Unknown"]]
+    )
+    return pd.DataFrame(
+        {
+            "form": rng.choice(forms, rows),
+            "material": rng.choice(materials, rows),
+            "finish_1": [
+                f"{finish};second" if rng.random() < 0.5 else finish
+                for finish in rng.choice(finishes, rows)
+            ],
+        }
+    )
+
+
+def test_matches_the_row_wise_lookup():
+    df = make_frame(2000, seed=5)
+
+    expected = df.apply(apply_logic, axis=1)
+    actual = add_category(df.copy())["category"]
+
+    pd.testing.assert_series_equal(
+        actual.fillna("").astype(object),
+        expected.fillna("").astype(object),
+        check_names=False,
+    )
+
+
+def test_finish_rows_use_the_first_finish():
+    finish_cells = validation_df.set_index("Forms").eq("Finish").stack()
+    form, material = finish_cells[finish_cells].index[0]
+    finish, category = validation_df.dropna(subset=["Finish Long"]).iloc[0][
+        ["Finish Long", "Carbon Steel Flat"]
+    ]
+    df = pd.DataFrame(
+        {"form": [form], "material": [material], "finish_1": [f"{finish};other"]}
+    )
+
+    assert add_category(df)["category"].tolist() == [category]
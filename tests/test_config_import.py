@@ -0,0 +1,36 @@
+import subprocess
+import sys
+import pytest
+
+
+def run_isolated(code, *args):
+    """Run code in a fresh interpreter, as the import order is what is tested."""
+    result = subprocess.run(
+        [sys.executable, "-c", code, *args], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_config_stays_a_dict_after_importing_logging_system(tmp_path):
+    # The cache directory is passed in so that the checkout stays clean
+    run_isolated(
+        "import sys\n"
+        "import bilstein_slexa.config.logging_system\n"
+        "from bilstein_slexa import config\n"
+        "from bilstein_slexa.utils.result_cache import ResultCache\n"
+        "assert isinstance(config, dict), type(config)\n"
+        "ResultCache(cache_dir=sys.argv[1])\n",
+        str(tmp_path / "results"),
+    )
+    assert (tmp_path / "results").is_dir()
+
+
+def test_reference_snapshot_after_pipeline_manager():
+    for module in ("streamlit", "psycopg2", "gspread", "transformers"):
+        pytest.importorskip(module)
+    run_isolated(
+        "import bilstein_slexa.pipeline.pipeline_manager\n"
+        "from bilstein_slexa.utils import reference_snapshot\n"
+        "assert isinstance(reference_snapshot.config, dict)\n"
+        "reference_snapshot.GradeSnapshot()\n"
+    )
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+from bilstein_slexa import config, global_vars
+from bilstein_slexa.pipeline.data_augmentaion import augment_data
+
+FORM_RULE = next(rule for rule in config["augmentation"] if rule["column"] == "form")
+
+
+def add_form(df):
+    return augment_data(df, [FORM_RULE])["form"]
+
+
+def test_form_follows_the_width_threshold():
+    df = pd.DataFrame(
+        {"bundle_id": ["1", "2", "3", "4"], "width": [700.0, 600.0, 12.5, np.nan]}
+    )
+
+    forms = add_form(df)
+
+    assert forms.tolist() == ["Coils", "Slit Coils", "Slit Coils", "Slit Coils"]
+    assert global_vars["error_list"] == []
+
+
+def test_non_numeric_width_gives_no_form_and_a_report():
+    df = pd.DataFrame({"bundle_id": ["1", "2"], "width": [700, "breit"]}, dtype=object)
+
+    forms = add_form(df)
+
+    assert forms.iloc[0] == "Coils"
+    assert pd.isna(forms.iloc[1])
+    assert len(global_vars["error_list"]) == 1
+    assert "breit" in global_vars["error_list"][0]
+
+
+def test_numeric_strings_are_not_classified():
+    # The row-wise rule only compared int and float values
+    df = pd.DataFrame({"bundle_id": ["1", "2"], "width": ["700", 700]}, dtype=object)
+
+    forms = add_form(df)
+
+    assert pd.isna(forms.iloc[0])
+    assert forms.iloc[1] == "Coils"
+    assert len(global_vars["error_list"]) == 1
+
+    string_column = pd.DataFrame({"bundle_id": ["1"], "width": ["700"]})
+    assert add_form(string_column).isna().all()
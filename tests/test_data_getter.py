@@ -0,0 +1,113 @@
+import pandas as pd
+import pytest
+from bilstein_slexa import config, global_vars
+from bilstein_slexa.getters.data_getter import (
+    iter_excel_chunks,
+    iter_used_rows,
+    prefetch_header,
+    read_projected_excel,
+)
+from bilstein_slexa.getters.excel_engines import open_sheet
+from bilstein_slexa.pipeline.schema_validation import validate_with_all_schemas
+from conftest import make_stock_list
+
+
+def write_sheet(path, rows):
+    pd.DataFrame(rows).to_excel(path, index=False, header=False)
+
+
+def read_rows(path):
+    sheet = open_sheet(path, ["openpyxl"])
+    try:
+        sheet.header()
+        return list(iter_used_rows(sheet, [0, 1], {}))
+    finally:
+        sheet.close()
+
+
+def test_gap_longer_than_the_limit_is_reported(tmp_path, monkeypatch, error_list):
+    monkeypatch.setitem(config["etl_pipeline"], "max_empty_rows", 3)
+    path = str(tmp_path / "gap.xlsx")
+    write_sheet(path, [["a", "b"], [1, 2]] + [[None, None]] * 5 + [[3, 4]])
+
+    rows = read_rows(path)
+
+    assert rows == [(1, 2)]
+    assert len(error_list) == 1
+    assert "declares 8 rows" in error_list[0]
+
+
+def test_short_gap_is_read_through_without_a_report(tmp_path, monkeypatch, error_list):
+    monkeypatch.setitem(config["etl_pipeline"], "max_empty_rows", 3)
+    path = str(tmp_path / "gap.xlsx")
+    write_sheet(path, [["a", "b"], [1, 2], [None, None], [3, 4]])
+
+    rows = read_rows(path)
+
+    assert rows == [(1, 2), (None, None), (3, 4)]
+    assert error_list == []
+
+
+@pytest.mark.parametrize("engine", ["openpyxl", "calamine"])
+def test_projected_read_matches_the_full_read(stock_list, engine):
+    if engine == "calamine":
+        pytest.importorskip("python_calamine")
+    # Cells as stored; the plain read would also turn text such as "0000510063" into numbers
+    full = pd.read_excel(stock_list, dtype=object)
+
+    df = read_projected_excel(stock_list, [engine])
+
+    # Only the columns matching the mandatory schema columns are read
+    assert set(df.columns) < set(full.columns)
+    assert {"Q-Meldungsnummer", "Güte-Text", "HF-Breite"} <= set(df.columns)
+    pd.testing.assert_frame_equal(df, full[df.columns.tolist()], check_dtype=False)
+
+
+def test_chunks_add_up_to_the_projected_read(stock_list):
+    chunks = list(iter_excel_chunks(stock_list, 25))
+
+    assert [len(chunk) for chunk in chunks] == [25, 25, 10]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), read_projected_excel(stock_list)
+    )
+
+
+@pytest.fixture
+def prefetch(monkeypatch):
+    monkeypatch.setitem(config["etl_pipeline"], "prefetch_validation", True)
+    monkeypatch.setitem(config["etl_pipeline"], "load_local", True)
+    return prefetch_header
+
+
+@pytest.mark.parametrize("dropped", [None, "Q-Meldungsnummer", "HF-Breite"])
+def test_prefetch_agrees_with_the_full_validation(tmp_path, prefetch, dropped):
+    path = str(tmp_path / "bestand.xlsx")
+    df = make_stock_list()
+    if dropped:
+        df = df.drop(columns=[dropped])
+    df.to_excel(path, index=False)
+
+    status = prefetch(path)
+    prefetch_errors = list(global_vars["error_list"])
+
+    assert status == validate_with_all_schemas(pd.read_excel(path), path)
+    assert status == (dropped is None)
+    if dropped:
+        assert prefetch_errors[0]["missing_columns"] == [dropped]
+
+
+def test_prefetch_finds_a_header_below_title_rows_of_another_sheet(tmp_path, prefetch):
+    path = str(tmp_path / "bestand.xlsx")
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"Hinweis": ["Bestand zum 04.09.2024"]}).to_excel(
+            writer, sheet_name="Info", index=False
+        )
+        pd.DataFrame([["Bestandsliste Bilstein"]]).to_excel(
+            writer, sheet_name="Bestand", index=False, header=False
+        )
+        make_stock_list().to_excel(
+            writer, sheet_name="Bestand", index=False, startrow=2
+        )
+
+    assert prefetch(path)
+    assert global_vars["error_list"] == []
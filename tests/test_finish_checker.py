@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import yaml
+from bilstein_slexa import finish_repo_path, global_vars
+from bilstein_slexa.pipeline.finish_checker import FinishChecker, normalize_finish_id
+
+with open(finish_repo_path, "r") as file:
+    FINISHES = yaml.safe_load(file)
+
+
+def baseline_finish(finish_id):
+    """The row-wise lookup through the string finish IDs that the index replaced."""
+    finish_dict = {str(item["finish_id"]): item for item in FINISHES}
+    return finish_dict[finish_id]["finish_1"] if finish_id in finish_dict else np.nan
+
+
+def check(finish_ids):
+    df = pd.DataFrame(
+        {"bundle_id": [str(i) for i in range(len(finish_ids))], "finish": finish_ids},
+        dtype=object,
+    )
+    return FinishChecker().check_and_update_finish(df)
+
+
+def test_string_ids_match_the_row_wise_lookup():
+    rng = np.random.default_rng(7)
+    known = [str(item["finish_id"]) for item in FINISHES]
+    finish_ids = list(rng.choice(known + ["999", "abc"], 300))
+
+    result = check(finish_ids)
+
+    expected = pd.Series(
+        [baseline_finish(finish_id) for finish_id in finish_ids],
+        name="finish_1",
+        dtype=object,
+    )
+    pd.testing.assert_series_equal(result["finish_1"], expected, check_dtype=False)
+    assert [record["bundle_id"] for record in global_vars["bundle_messages"]] == [
+        str(idx) for idx in expected.index[expected.isna()]
+    ]
+
+
+def test_numeric_ids_normalize_to_known_keys():
+    finish_ids = [10, 10.0, "10.0", " 10 ", "7", np.nan, "10.5"]
+
+    result = check(finish_ids)
+
+    assert [normalize_finish_id(finish_id) for finish_id in finish_ids] == [
+        "10",
+        "10",
+        "10",
+        "10",
+        "7",
+        None,
+        "10.5",
+    ]
+    ten, seven = baseline_finish("10"), baseline_finish("7")
+    assert result["finish_1"].tolist()[:5] == [ten, ten, ten, ten, seven]
+    assert result["finish_1"].iloc[5:].isna().all()
+    # Only the missing and the unknown ID are reported
+    assert [record["bundle_id"] for record in global_vars["bundle_messages"]] == [
+        "5",
+        "6",
+    ]
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+import bilstein_slexa.pipeline.transformation as transformation
+from bilstein_slexa import config
+from bilstein_slexa.pipeline.glossary import translate_with_glossary
+
+
+@pytest.fixture
+def model_calls(monkeypatch):
+    """Replace the translation model with a marker translation and record its inputs."""
+    calls = []
+
+    def translate_pending(texts, translation_config):
+        calls.append(list(texts))
+        return {text: f"<model> {text}" for text in texts}
+
+    monkeypatch.setattr(transformation, "translate_pending", translate_pending)
+    monkeypatch.setitem(config["translation"]["cache"], "enabled", False)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Spaltband  kaltgewalzt", "Slit strip cold rolled"),
+        ("Blech gebeizt, geölt", "Sheet pickled, oiled"),
+        ("0012345678", "0012345678"),
+        ("1,5 x 1250", "1,5 x 1250"),
+        ("Rostige Kante", None),
+    ],
+)
+def test_glossary_hits_and_misses(text, expected):
+    assert translate_with_glossary(text) == expected
+
+
+def test_only_glossary_misses_reach_the_model(model_calls):
+    column = pd.Series(
+        [
+            "Spaltband kaltgewalzt",
+            "Rostige Kante",
+            np.nan,
+            "0012345678",
+            "Rostige Kante",
+            "Blech gebeizt, geölt",
+            "Leichte Welligkeit",
+        ]
+    )
+
+    translated = transformation.translate_column(column)
+
+    # Every text the glossary misses is sent once, in a single call
+    assert model_calls == [["Rostige Kante", "Leichte Welligkeit"]]
+    # Row-wise: the glossary translation if there is one, else the model's
+    expected = column.map(
+        lambda text: (
+            text
+            if not isinstance(text, str)
+            else translate_with_glossary(text) or f"<model> {text}"
+        )
+    )
+    pd.testing.assert_series_equal(translated, expected)
@@ -0,0 +1,101 @@
+import re
+import numpy as np
+import pandas as pd
+import pytest
+from bilstein_slexa import global_vars
+from bilstein_slexa.pipeline.grade_checker import GradeChecker
+from bilstein_slexa.utils.reference_snapshot import GradeSnapshot
+
+# 'S235 JR' and 'S235JR' normalize to the same key; the first one must win
+GRADES = ["DC01", "S235 JR", "S235JR", "DX51D", "1.0330", "HC 340 LA", "S355MC"]
+
+
+def normalize(grade):
+    return grade.lower().replace(" ", "")
+
+
+def baseline_match(candidate):
+    """The linear scan over the reference grades that the normalized index replaced."""
+    for reference in GRADES:
+        if normalize(candidate) == normalize(reference):
+            return reference, True
+    if "+" in candidate or "-" in candidate:
+        split_candidate = (
+            candidate.split("+")[0] if "+" in candidate else candidate.split("-")[0]
+        )
+        for reference in GRADES:
+            if normalize(split_candidate) == normalize(reference):
+                return reference, True
+    parts = re.split(r"\s+", candidate)
+    combinations = []
+    for i in range(1, len(parts) + 1):
+        combinations.append("".join(parts[:i]))
+        if i < len(parts):
+            combinations.append("".join(parts[i:]))
+    for combo in combinations:
+        for reference in GRADES:
+            if normalize(combo) == normalize(reference):
+                return reference, True
+    return candidate, False
+
+
+CANDIDATES = [
+    "DC 01",
+    "dc01",
+    "s235jr",
+    "S 235 JR",
+    "DX51D+Z275",
+    "DX51D-AM",
+    "HC340LA",
+    "1.0330 geölt",
+    "Sonder DC01",
+    "S355 MC",
+    "XYZ9",
+    "XYZ9+Z",
+    "",
+]
+
+
+@pytest.fixture
+def checker(monkeypatch):
+    monkeypatch.setattr(GradeSnapshot, "get_grades", lambda self, db=None: GRADES)
+    return GradeChecker()
+
+
+@pytest.mark.parametrize("candidate", CANDIDATES)
+def test_match_grade_matches_the_linear_scan(checker, candidate):
+    assert checker.match_grade(candidate) == baseline_match(candidate)
+
+
+def test_each_distinct_grade_is_matched_once(checker, monkeypatch):
+    rng = np.random.default_rng(6)
+    grades = list(rng.choice(CANDIDATES, 200)) + [np.nan, None]
+    df = pd.DataFrame(
+        {"bundle_id": [str(i) for i in range(len(grades))], "grade": grades}
+    )
+
+    calls = []
+    match_grade = checker.match_grade
+    monkeypatch.setattr(
+        checker,
+        "match_grade",
+        lambda candidate: calls.append(candidate) or match_grade(candidate),
+    )
+    result = checker.check_and_update_grade(df.copy())
+
+    assert sorted(calls) == sorted(set(CANDIDATES) & set(grades))
+    expected = df["grade"].map(
+        lambda grade: baseline_match(grade)[0] if isinstance(grade, str) else grade
+    )
+    pd.testing.assert_series_equal(result["grade"], expected)
+
+    # One message per unmatched or empty row, in row order
+    unmatched = [
+        idx
+        for idx, grade in enumerate(grades)
+        if not isinstance(grade, str) or not baseline_match(grade)[1]
+    ]
+    assert [
+        re.search(r"Bundle Id (\d+)", message).group(1)
+        for message in global_vars["error_list"]
+    ] == [str(idx) for idx in unmatched]
@@ -0,0 +1,58 @@
+import logging
+import os
+import pandas as pd
+import pytest
+from bilstein_slexa.utils.helper import (
+    delete_interim_file,
+    load_interim_file,
+    save_interim_file,
+)
+
+
+def test_interim_round_trip_through_parquet(tmp_path):
+    df = pd.DataFrame(
+        {
+            "bundle_id": ["1001", "1002"],
+            "thickness": [1.5, 2.0],
+            "weight": [120, 80],
+        }
+    )
+    report = pd.DataFrame({"bundle_id": ["1002"], "unit": ["1"]})
+    item = {
+        "file_name": "bestand",
+        "data_frame": df,
+        "status": True,
+        "error_log": ["Grade 'XYZ9' not found", report],
+    }
+
+    save_interim_file(item, "bestand", folder=str(tmp_path))
+    assert os.path.exists(tmp_path / "bestand.parquet")
+    loaded = load_interim_file(str(tmp_path / "bestand.json"))
+
+    pd.testing.assert_frame_equal(loaded["data_frame"], df)
+    assert loaded["status"] is True
+    assert loaded["error_log"][0] == "Grade 'XYZ9' not found"
+    # String values of reports must not be turned into numbers
+    pd.testing.assert_frame_equal(loaded["error_log"][1], report)
+
+    delete_interim_file(str(tmp_path / "bestand.json"))
+    assert os.listdir(tmp_path) == []
+
+
+def test_mixed_columns_fall_back_to_pickle_with_a_reason(tmp_path, caplog):
+    df = pd.DataFrame({"width": [1250, "breit"]}, dtype=object)
+    item = {"file_name": "gemischt", "data_frame": df, "status": False, "error_log": []}
+
+    with caplog.at_level(logging.WARNING, logger="<Bilstein SLExA ETL>"):
+        save_interim_file(item, "gemischt", folder=str(tmp_path))
+    loaded = load_interim_file(str(tmp_path / "gemischt.json"))
+
+    assert "'width'" in caplog.text
+    assert loaded["data_frame"]["width"].tolist() == [1250, "breit"]
+
+
+def test_save_errors_are_raised(tmp_path):
+    item = {"file_name": "bestand", "data_frame": pd.DataFrame({"a": [1]})}
+
+    with pytest.raises(OSError):
+        save_interim_file(item, "bestand", folder=str(tmp_path / "missing"))
@@ -0,0 +1,125 @@
+import pandas as pd
+import pytest
+import bilstein_slexa.pipeline.incremental as incremental
+from bilstein_slexa import global_vars
+from bilstein_slexa.pipeline.data_augmentaion import augment_data
+from bilstein_slexa.pipeline.finish_checker import FinishChecker
+from bilstein_slexa.pipeline.grade_checker import GradeChecker
+from bilstein_slexa.utils.bundle_store import BundleStore
+from bilstein_slexa.utils.reference_snapshot import GradeSnapshot
+
+
+@pytest.fixture(autouse=True)
+def local_store(tmp_path, monkeypatch):
+    """Keep the bundle store in the test directory and serve grades without a database."""
+    db_path = str(tmp_path / "bundle_store.sqlite")
+
+    class LocalBundleStore(BundleStore):
+        def __init__(self, version):
+            super().__init__(version, db_path=db_path)
+
+    monkeypatch.setattr(incremental, "BundleStore", LocalBundleStore)
+    monkeypatch.setattr(
+        GradeSnapshot, "get_grades", lambda self, db=None: ["DC01", "S235JR"]
+    )
+
+
+def bundles(location_1003="555"):
+    return pd.DataFrame(
+        {
+            "bundle_id": ["1001", "1002", "1003"],
+            "grade": ["DC 01", "XYZ9", "S235JR"],
+            "finish": ["10", "99", "7"],
+            "width": [700.0, 105.0, 105.0],
+            "location": ["100", "100", location_1003],
+            "min_price": [375.0, 400.0, 400.0],
+        }
+    )
+
+
+class Enrichment:
+    def __init__(self):
+        self.bundle_ids = []
+
+    def __call__(self, df):
+        self.bundle_ids.append(df["bundle_id"].tolist())
+        df = GradeChecker().check_and_update_grade(df.copy(), grade_column="grade")
+        df = FinishChecker().check_and_update_finish(df, finish_column="finish")
+        return augment_data(df)
+
+
+def run(df, enrich, loaded=True):
+    global_vars["error_list"] = []
+    result, pending = incremental.process_bundles(df, "v1", enrich)
+    if loaded:
+        incremental.commit_bundles(result, pending)
+    return result, list(global_vars["error_list"])
+
+
+def test_unchanged_bundles_are_reused_with_their_warnings():
+    enrich = Enrichment()
+    first, first_messages = run(bundles(), enrich)
+    second, second_messages = run(bundles(), enrich)
+
+    assert enrich.bundle_ids == [["1001", "1002", "1003"]]
+    assert any("XYZ9" in str(message) for message in first_messages)
+    assert sorted(map(str, second_messages)) == sorted(map(str, first_messages))
+    assert second["bundle_id"].tolist() == first["bundle_id"].tolist()
+    assert second["form"].tolist() == first["form"].tolist()
+    assert second["grade"].tolist() == ["DC01", "XYZ9", "S235JR"]
+
+
+def test_changed_bundle_is_processed_and_its_old_warnings_dropped():
+    enrich = Enrichment()
+    run(bundles(), enrich)
+    result, messages = run(bundles(location_1003="100"), enrich)
+
+    assert enrich.bundle_ids == [["1001", "1002", "1003"], ["1003"]]
+    assert result["bundle_id"].tolist() == ["1001", "1002", "1003"]
+    text = "\n".join(map(str, messages))
+    # Warnings of the reused bundle 1002 are reported again
+    assert "Grade 'XYZ9' with Bundle Id 1002" in text
+    assert "99" in text
+    # The location of 1003 is fixed, so its report is gone
+    assert "555" not in text
+
+
+def test_bundles_are_not_reused_until_their_result_was_loaded():
+    enrich = Enrichment()
+    run(bundles(), enrich, loaded=False)
+    run(bundles(), enrich)
+    run(bundles(), enrich)
+
+    assert enrich.bundle_ids == [["1001", "1002", "1003"], ["1001", "1002", "1003"]]
+
+
+def test_group_and_join_messages_rebuild_a_shared_report():
+    report = pd.DataFrame({"bundle_id": ["1001", "1002"], "finish": ["98", "99"]})
+    title = "Finish IDs not found"
+    message = incremental.report_bundle_table(title, report)
+    incremental.report_bundle_message("1002", "Grade 'X' with Bundle Id 1002")
+
+    by_bundle = incremental.group_messages(
+        global_vars["bundle_messages"], ["1001", "1002"]
+    )
+
+    assert by_bundle["1001"] == [
+        {"title": title, "row": {"bundle_id": "1001", "finish": "98"}}
+    ]
+    assert incremental.join_messages([by_bundle["1001"], by_bundle["1002"]]) == [
+        message,
+        "Grade 'X' with Bundle Id 1002",
+    ]
+
+
+def test_messages_stay_with_their_bundle_when_values_look_like_ids():
+    # Bundle 1002 lies at location '100', which is also the ID of another bundle
+    df = pd.DataFrame({"bundle_id": ["100", "1002"], "location": ["7", "100"]})
+    report = df.loc[[1]]
+    incremental.report_bundle_table("Unknown locations", report)
+
+    by_bundle = incremental.group_messages(
+        global_vars["bundle_messages"], ["100", "1002"]
+    )
+
+    assert list(by_bundle) == ["1002"]
@@ -0,0 +1,22 @@
+import pandas as pd
+from bilstein_slexa.benchmarks.material_lookup import make_frame
+from bilstein_slexa.pipeline.material_checker import add_material, apply_logic
+
+
+def test_matches_the_row_wise_lookup():
+    df = make_frame(2000, seed=4)
+
+    expected = df.apply(apply_logic, axis=1)
+    actual = add_material(df.copy())["material"]
+
+    pd.testing.assert_series_equal(
+        actual.fillna("").astype(object),
+        expected.fillna("").astype(object),
+        check_names=False,
+    )
+
+
+def test_empty_grade_of_offcuts_is_carbon_steel():
+    df = pd.DataFrame({"grade": [""], "choice": ["2nd"], "form": ["Offcuts"]})
+
+    assert add_material(df)["material"].tolist() == ["Carbon Steel"]
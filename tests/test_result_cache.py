@@ -0,0 +1,79 @@
+import io
+import pandas as pd
+import pytest
+import bilstein_slexa.utils.result_cache as result_cache
+from bilstein_slexa import config
+from bilstein_slexa.utils.reference_snapshot import GradeSnapshot
+from bilstein_slexa.utils.result_cache import ResultCache
+
+
+@pytest.fixture
+def snapshot(tmp_path, monkeypatch):
+    """A fresh local grade snapshot, so that no database is needed."""
+    path = str(tmp_path / "grade_snapshot.json")
+    monkeypatch.setattr(result_cache, "grade_snapshot_path", path)
+    snapshot = GradeSnapshot(path)
+    snapshot.save(["DC01", "S235JR"], "2:abc")
+    return snapshot
+
+
+@pytest.fixture
+def cache(tmp_path, snapshot):
+    return ResultCache(cache_dir=str(tmp_path / "results"))
+
+
+def workbook():
+    buffer = io.BytesIO(b"workbook bytes")
+    buffer.name = "bestand.xlsx"
+    return buffer
+
+
+def cached_item():
+    return {
+        "file_name": "bestand",
+        "data_frame": pd.DataFrame({"bundle_id": ["1001"], "grade": ["DC01"]}),
+        "status": True,
+        "error_log": ["Grade 'XYZ9' not found"],
+        "url": "https://docs.google.com/spreadsheets/d/1",
+    }
+
+
+def test_hit_for_the_same_workbook_and_reference_data(cache):
+    cache.put(cache.make_key(workbook()), cached_item())
+
+    hit = cache.get(cache.make_key(workbook()))
+
+    assert hit["url"] == "https://docs.google.com/spreadsheets/d/1"
+    assert hit["error_log"] == ["Grade 'XYZ9' not found"]
+    pd.testing.assert_frame_equal(hit["data_frame"], cached_item()["data_frame"])
+
+
+def test_miss_after_the_grade_table_changed(cache, snapshot):
+    cache.put(cache.make_key(workbook()), cached_item())
+
+    snapshot.save(["DC01", "S235JR", "S355MC"], "3:def")
+
+    assert cache.get(cache.make_key(workbook())) is None
+
+
+def test_miss_after_a_config_change(cache, monkeypatch):
+    cache.put(cache.make_key(workbook()), cached_item())
+
+    monkeypatch.setitem(config["grade_suggestions"], "top_k", 5)
+
+    assert cache.get(cache.make_key(workbook())) is None
+
+
+def test_snapshot_is_refreshed_before_the_key_is_computed(cache, snapshot, monkeypatch):
+    key_before = cache.make_key(workbook())
+    refreshed = []
+
+    def get_grades(self, db=None):
+        # The grade table changed in the database since the last check
+        refreshed.append(self.snapshot_path)
+        return self.save(["DC01"], "1:new")["grades"]
+
+    monkeypatch.setattr(GradeSnapshot, "get_grades", get_grades)
+
+    assert cache.make_key(workbook()) != key_before
+    assert refreshed == [snapshot.snapshot_path]
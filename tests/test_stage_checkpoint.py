@@ -0,0 +1,96 @@
+import logging
+import pandas as pd
+import pytest
+from bilstein_slexa import source_schema_path
+from bilstein_slexa.getters.data_getter import load_excel_file
+from bilstein_slexa.pipeline.aggregation import aggregate_data
+from bilstein_slexa.pipeline.schema_validation import (
+    get_required_columns,
+    validate_with_all_schemas,
+)
+from bilstein_slexa.pipeline.streaming import (
+    get_header_translations,
+    prepare_rows,
+    validate_rows,
+)
+from bilstein_slexa.utils.helper import load_layout_schema
+from bilstein_slexa.utils.stage_checkpoint import StageCheckpoints
+
+schema = load_layout_schema(source_schema_path)
+calls = {"translate": 0, "category": 0}
+
+
+def load_stage(file_path):
+    return {"data_frame": load_excel_file(file_path)}
+
+
+def validation_stage(df, file_name):
+    return {"data_frame": df, "status": validate_with_all_schemas(df, file_name)}
+
+
+def clean_stage(df):
+    df = prepare_rows(
+        df, schema, get_required_columns(schema), get_header_translations(schema)
+    )
+    return {"data_frame": df, "not_missed": validate_rows(df)[0]}
+
+
+def aggregate_stage(df):
+    identical, aggregated_df = aggregate_data(df)
+    return {"data_frame": aggregated_df, "identical": identical}
+
+
+def translate_stage(df, reference_version):
+    calls["translate"] += 1
+    return {"data_frame": df.assign(description=df["beschreibung"].str.upper())}
+
+
+def category_stage(df, reference_version):
+    calls["category"] += 1
+    if calls["category"] == 1:
+        raise RuntimeError("category lookup crashed")
+    return {"data_frame": df.assign(category="Flat")}
+
+
+def run_file(checkpoints, file_path):
+    df = checkpoints.run("load", load_stage, file_path)["data_frame"]
+    df = checkpoints.run("validation", validation_stage, df, file_name="bestand.xlsx")[
+        "data_frame"
+    ]
+    df = checkpoints.run("clean", clean_stage, df)["data_frame"]
+    df = checkpoints.run("aggregate", aggregate_stage, df)["data_frame"]
+    df = checkpoints.run("translate", translate_stage, df, "v1")["data_frame"]
+    return checkpoints.run("category", category_stage, df, "v1")["data_frame"]
+
+
+def test_translation_resumes_after_a_crash_in_a_later_stage(
+    tmp_path, stock_list, caplog
+):
+    calls.update(translate=0, category=0)
+    checkpoints = StageCheckpoints(
+        checkpoint_dir=str(tmp_path / "checkpoints"), enabled=True
+    )
+
+    with pytest.raises(RuntimeError):
+        run_file(checkpoints, stock_list)
+    with caplog.at_level(logging.INFO, logger="<Bilstein SLExA ETL>"):
+        result = run_file(checkpoints, stock_list)
+
+    assert calls == {"translate": 1, "category": 2}
+    for stage_name in ("load", "validation", "clean", "aggregate", "translate"):
+        assert f"Stage '{stage_name}' resumed" in caplog.text
+    assert (result["category"] == "Flat").all()
+
+
+def test_restored_frame_hashes_like_the_saved_one(tmp_path):
+    df = pd.DataFrame(
+        {
+            "grade": pd.Series(["DC01", None], dtype=object),
+            "thickness": pd.Series([1.5, 2.0], dtype=object),
+            "width": pd.Series(["105.0", "700.0, 705.0"], dtype=object),
+        }
+    )
+    df.to_parquet(tmp_path / "frame.parquet")
+    restored = pd.read_parquet(tmp_path / "frame.parquet")
+
+    assert StageCheckpoints.hash_input(restored) == StageCheckpoints.hash_input(df)
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+from bilstein_slexa.getters.data_getter import load_detected_table
+from bilstein_slexa.utils.table import find_potential_headers, identify_tables
+from conftest import make_stock_list
+
+
+def sheet(rows):
+    return pd.DataFrame(rows, dtype=object)
+
+
+def test_blank_row_does_not_split_a_table():
+    df = sheet(
+        [
+            ["Charge", "Dicke", "Breite", "Gewicht"],
+            [1, 2, 3, 4],
+            [5, 6, 7, 8],
+            [None, None, None, None],
+            [9, 10, 11, 12],
+        ]
+    )
+
+    tables = identify_tables(df)
+
+    assert len(tables) == 1
+    assert tables[0].columns.tolist() == ["Charge", "Dicke", "Breite", "Gewicht"]
+    assert tables[0].values.tolist() == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]
+
+
+def test_repeated_header_starts_a_new_table():
+    df = sheet(
+        [
+            ["Charge", "Dicke", "Breite"],
+            [1, 2, 3],
+            [None, None, None],
+            ["Charge", "Dicke", "Breite"],
+            [4, 5, 6],
+        ]
+    )
+
+    tables = identify_tables(df)
+
+    assert [table.values.tolist() for table in tables] == [[[1, 2, 3]], [[4, 5, 6]]]
+
+
+def test_text_rows_after_a_blank_row_continue_the_table():
+    stock_list = make_stock_list(rows=6)
+    rows = [stock_list.columns.tolist(), *stock_list.values.tolist()]
+    # A blank row before the last bundle, whose rows are mostly text
+    rows.insert(4, [None] * len(stock_list.columns))
+
+    tables = identify_tables(sheet(rows))
+
+    assert len(tables) == 1
+    assert tables[0].columns.tolist() == stock_list.columns.tolist()
+    assert len(tables[0]) == 6
+
+
+def test_header_below_title_rows():
+    df = sheet(
+        [
+            ["Bestandsliste", None, None],
+            [None, None, None],
+            ["Charge", "Dicke", "Breite"],
+            [1, 2.5, np.nan],
+        ]
+    )
+
+    assert find_potential_headers(df) == 2
+    assert identify_tables(df)[0].columns.tolist() == ["Charge", "Dicke", "Breite"]
+
+
+def test_detects_the_stock_list_below_title_rows_of_another_sheet(tmp_path):
+    path = str(tmp_path / "bestand.xlsx")
+    stock_list = make_stock_list(rows=9)
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"Hinweis": ["Bestand zum 04.09.2024"]}).to_excel(
+            writer, sheet_name="Info", index=False
+        )
+        sheet([["Bestandsliste Bilstein"], [None]]).to_excel(
+            writer, sheet_name="Bestand", index=False, header=False
+        )
+        stock_list.to_excel(writer, sheet_name="Bestand", index=False, startrow=2)
+
+    df = load_detected_table(path)
+
+    assert df.columns.tolist() == stock_list.columns.tolist()
+    assert (
+        df["Q-Meldungsnummer"].astype(str).tolist()
+        == stock_list["Q-Meldungsnummer"].tolist()
+    )
@@ -0,0 +1,82 @@
+import threading
+from multiprocessing import AuthenticationError
+import pytest
+import bilstein_slexa.pipeline.transformation as transformation
+from bilstein_slexa.model_loader import ModelLoader
+from bilstein_slexa.pipeline.translation_worker import (
+    TranslationRequest,
+    TranslationWorker,
+    TranslationWorkerError,
+)
+
+
+def test_failed_batch_answers_its_requests_and_keeps_serving(monkeypatch):
+    calls = []
+
+    def translate_batch(texts, tokenizer, model, batch_size, generate_kwargs):
+        calls.append(texts)
+        if len(calls) == 1:
+            raise RuntimeError("generate failed")
+        return {text: text.upper() for text in texts}
+
+    monkeypatch.setattr(ModelLoader, "load_translation_model", lambda: (None, None))
+    monkeypatch.setattr(transformation, "translate_batch", translate_batch)
+
+    worker = TranslationWorker(address=("localhost", 0), max_wait_ms=1)
+    threading.Thread(target=worker.batch_loop, daemon=True).start()
+
+    failed = TranslationRequest(["blech"])
+    worker.requests.put(failed)
+    assert failed.done.wait(5)
+    assert "generate failed" in failed.error
+
+    served = TranslationRequest(["blech"])
+    worker.requests.put(served)
+    assert served.done.wait(5)
+    assert served.error is None
+    assert served.result == {"blech": "BLECH"}
+
+
+def test_translate_pending_falls_back_on_authentication_error(monkeypatch):
+    def translate_with_worker(texts):
+        raise AuthenticationError("digest received was wrong")
+
+    monkeypatch.setattr(transformation, "translate_with_worker", translate_with_worker)
+    monkeypatch.setattr(ModelLoader, "load_translation_model", lambda: (None, None))
+    monkeypatch.setattr(
+        transformation,
+        "translate_batch",
+        lambda texts, *args: {text: f"en {text}" for text in texts},
+    )
+
+    translations = transformation.translate_pending(
+        ["Band"], {"worker": {"enabled": True}}
+    )
+    assert translations == {"Band": "en Band"}
+
+
+def test_worker_refuses_to_start_without_authkey(monkeypatch):
+    monkeypatch.delenv("TRANSLATION_WORKER_AUTHKEY", raising=False)
+    loaded = []
+    monkeypatch.setattr(
+        ModelLoader, "load_translation_model", lambda: loaded.append(True)
+    )
+
+    with pytest.raises(TranslationWorkerError):
+        TranslationWorker(address=("localhost", 0)).serve_forever()
+    assert not loaded
+
+
+def test_translate_pending_falls_back_without_authkey(monkeypatch):
+    monkeypatch.delenv("TRANSLATION_WORKER_AUTHKEY", raising=False)
+    monkeypatch.setattr(ModelLoader, "load_translation_model", lambda: (None, None))
+    monkeypatch.setattr(
+        transformation,
+        "translate_batch",
+        lambda texts, *args: {text: f"en {text}" for text in texts},
+    )
+
+    translations = transformation.translate_pending(
+        ["Band"], {"worker": {"enabled": True}}
+    )
+    assert translations == {"Band": "en Band"}